@@ -4,10 +4,32 @@ yalje - Yet Another LiveJournal Exporter
 A comprehensive tool for downloading and archiving all content from LiveJournal accounts.
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "yalje contributors"
 
-from yalje.exporters.yaml_exporter import YAMLExporter
-from yalje.models.export import LJExport
-
 __all__ = ["LJExport", "YAMLExporter", "__version__"]
+
+if TYPE_CHECKING:
+    from yalje.exporters.yaml_exporter import YAMLExporter
+    from yalje.models.export import LJExport
+
+# Public names imported on first access (PEP 562), so `import yalje` and
+# `from yalje import __version__` don't pull in pydantic and PyYAML
+_LAZY_ATTRS = {
+    "LJExport": "yalje.models.export",
+    "YAMLExporter": "yalje.exporters.yaml_exporter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -17,14 +17,21 @@ class BaseAPIClient:
         self.session = session
         self.config = config
         self.base_url = config.base_url
+        self._url_cache: dict[str, str] = {}
 
     def _build_url(self, path: str) -> str:
         """Build full URL from path.
 
+        Clients only use a handful of distinct paths, so results are cached
+        per instance.
+
         Args:
             path: URL path (e.g., "/export_do.bml")
 
         Returns:
             Full URL
         """
-        return f"{self.base_url}{path}"
+        url = self._url_cache.get(path)
+        if url is None:
+            url = self._url_cache[path] = f"{self.base_url}{path}"
+        return url
@@ -1,15 +1,34 @@
 """API client for downloading LiveJournal comments."""
 
+from functools import lru_cache
+from operator import attrgetter
+from typing import IO, Iterator, Optional, cast
+
+import requests
+import urllib3
+
 from yalje.api.base import BaseAPIClient
 from yalje.core.config import YaljeConfig
+from yalje.core.exceptions import StreamInterruptedError
 from yalje.core.session import HTTPSession
 from yalje.models.comment import Comment
 from yalje.models.user import User
+from yalje.parsers.xml_parser import XMLParser
 from yalje.utils.logging import get_logger
 
 logger = get_logger("api.comments")
 
 
+@lru_cache(maxsize=4096)
+def _unknown_label(posterid: int) -> str:
+    """Placeholder username for a poster missing from the usermap.
+
+    Cached because deleted or purged accounts typically left many comments,
+    so the same label is requested repeatedly.
+    """
+    return f"[unknown-{posterid}]"
+
+
 class CommentsClient(BaseAPIClient):
     """Client for downloading comments via LiveJournal export API."""
 
@@ -33,8 +52,6 @@ class CommentsClient(BaseAPIClient):
         Raises:
             APIError: If download fails
         """
-        from yalje.parsers.xml_parser import XMLParser
-
         logger.info("Downloading comment metadata")
 
         # Build URL
@@ -47,7 +64,7 @@ class CommentsClient(BaseAPIClient):
         response = self.session.get(url, params=params)
 
         # Parse XML response
-        maxid, usermap = XMLParser.parse_comment_metadata(response.text)
+        maxid, usermap = XMLParser.parse_comment_metadata(response.content)
 
         logger.info(f"  → Downloaded metadata: maxid={maxid}, {len(usermap)} users in usermap")
         return (maxid, usermap)
@@ -66,39 +83,109 @@ class CommentsClient(BaseAPIClient):
         # Get metadata first
         maxid, usermap = self.download_metadata()
 
-        # Download comment bodies in batches
-        all_comments = []
+        all_comments: list[Comment] = []
+        for batch in self._iter_batches(maxid, usermap):
+            all_comments.extend(batch)
+
+        return all_comments, usermap
+
+    def iter_all(self) -> tuple[list[User], Iterator[list[Comment]]]:
+        """Download the usermap now and comments one batch at a time.
+
+        Lets callers write each batch out before the next is requested, so
+        memory is bounded by one batch rather than the whole journal. The
+        metadata is fetched before returning, so the usermap is available
+        even when there are no comment batches at all.
+
+        Returns:
+            Tuple of (usermap, batches), where batches yields lists of
+            comments with poster_username already resolved
+
+        Raises:
+            APIError: If the metadata download fails (batch downloads raise
+                while iterating)
+        """
+        maxid, usermap = self.download_metadata()
+        return usermap, self._iter_batches(maxid, usermap)
+
+    def _iter_batches(self, maxid: int, usermap: list[User]) -> Iterator[list[Comment]]:
+        """Page through comment batches up to maxid.
+
+        Args:
+            maxid: Highest comment ID from the metadata
+            usermap: Usermap from the metadata
+
+        Yields:
+            Lists of comments with poster_username resolved
+        """
+        # Build the poster lookup once; it is reused for every batch
+        # (keyed by Optional[int] so anonymous posterids can be looked up too)
+        user_lookup: dict[Optional[int], str] = dict(map(attrgetter("userid", "username"), usermap))
+
+        # Bind loop-invariant lookups to locals for the batch loop
+        collect_batch = self._collect_batch
+        retry_read = self.session.retry_read
+        resolve_usernames = self._resolve_usernames
         startid = 0
 
         while startid < maxid:
-            batch = self.download_batch(startid)
-            if not batch:
+            # A batch cut off mid-stream is requested again from the same startid
+            batch, batch_max = retry_read(collect_batch, startid)
+            if batch_max is None:
                 break
 
-            all_comments.extend(batch)
+            # Resolve poster usernames
+            resolve_usernames(batch, user_lookup)
+            yield batch
+
+            # A batch that doesn't advance past startid would be requested forever
+            if batch_max <= startid:
+                logger.warning(
+                    f"Comment batch did not advance past ID {startid}; stopping pagination"
+                )
+                break
 
             # Update startid to highest ID in batch
-            startid = max(c.id for c in batch)
+            startid = batch_max
 
-        # Resolve poster usernames
-        self._resolve_usernames(all_comments, usermap)
+    def _collect_batch(self, startid: int) -> tuple[list[Comment], Optional[int]]:
+        """Download one whole batch, tracking its highest comment ID.
 
-        return all_comments, usermap
+        The highest ID is tracked while consuming the stream, so the batch is
+        never rescanned to find the next startid.
 
-    def download_batch(self, startid: int) -> list[Comment]:
+        Args:
+            startid: Start ID (downloads comments with ID > startid)
+
+        Returns:
+            Tuple of (comments, highest ID or None for an empty batch)
+        """
+        batch: list[Comment] = []
+        append_comment = batch.append
+        batch_max: Optional[int] = None
+        for comment in self.download_batch(startid):
+            append_comment(comment)
+            if batch_max is None or comment.id > batch_max:
+                batch_max = comment.id
+        return batch, batch_max
+
+    def download_batch(self, startid: int) -> Iterator[Comment]:
         """Download a batch of comments starting after startid.
 
+        The response body is streamed into the parser, so comments are yielded
+        as they arrive instead of after the whole batch has been parsed.
+
         Args:
             startid: Start ID (downloads comments with ID > startid)
 
-        Returns:
-            List of Comment objects in this batch
+        Yields:
+            Comment objects in this batch
 
         Raises:
             APIError: If download fails
+            StreamInterruptedError: If the connection drops while the body is read
+            ParsingError: If the response cannot be parsed
         """
-        from yalje.parsers.xml_parser import XMLParser
-
         logger.info(f"Downloading comments batch starting from ID {startid}")
 
         # Build URL
@@ -107,28 +194,41 @@ class CommentsClient(BaseAPIClient):
         # Add query parameters
         params = {"get": "comment_body", "startid": str(startid)}
 
-        # Make GET request
-        response = self.session.get(url, params=params)
-
-        # Parse XML response
-        comments = XMLParser.parse_comments(response.text)
-
-        logger.info(f"  → Downloaded {len(comments)} comments in batch")
-        return comments
-
-    def _resolve_usernames(self, comments: list[Comment], usermap: list[User]) -> None:
+        # Make streaming GET request
+        response = self.session.get(url, params=params, stream=True)
+
+        # Parse XML response incrementally from the raw socket stream
+        count = 0
+        try:
+            # Let urllib3 undo any Content-Encoding before lxml sees the bytes
+            response.raw.decode_content = True
+            for comment in XMLParser.iter_comments(cast(IO[bytes], response.raw)):
+                count += 1
+                yield comment
+        except (urllib3.exceptions.HTTPError, requests.RequestException) as e:
+            logger.warning(f"Comments batch from ID {startid} was cut off: {e}")
+            raise StreamInterruptedError(
+                f"Comments batch from ID {startid} was cut off: {e}"
+            ) from e
+        finally:
+            response.close()
+
+        logger.info(f"  → Downloaded {count} comments in batch")
+
+    def _resolve_usernames(
+        self, comments: list[Comment], user_lookup: dict[Optional[int], str]
+    ) -> None:
         """Resolve poster_username for comments using usermap.
 
         Args:
             comments: List of comments to update
-            usermap: User ID to username mappings
+            user_lookup: User ID to username mapping built from the usermap
         """
-        # Build lookup dict
-        user_lookup = {user.userid: user.username for user in usermap}
-
-        # Resolve usernames
-        for comment in comments:
-            if comment.posterid is not None:
-                comment.poster_username = user_lookup.get(
-                    comment.posterid, f"[unknown-{comment.posterid}]"
-                )
+        # Look all posters up in one C-level map() pass over the IDs, then
+        # write the names back; misses share one cached placeholder per poster
+        posterids = [comment.posterid for comment in comments]
+        usernames = map(user_lookup.get, posterids)
+
+        for comment, posterid, username in zip(comments, posterids, usernames):
+            if posterid is not None:
+                comment.poster_username = username or _unknown_label(posterid)
@@ -1,11 +1,13 @@
 """API client (HTML scraper) for downloading LiveJournal inbox messages."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from yalje.api.base import BaseAPIClient
 from yalje.core.config import YaljeConfig
 from yalje.core.session import HTTPSession
 from yalje.models.inbox import InboxMessage
+from yalje.parsers.html_parser import HTMLParser
 from yalje.utils.logging import get_logger
 
 logger = get_logger("api.inbox")
@@ -36,17 +38,29 @@ class InboxClient(BaseAPIClient):
             APIError: If download fails
         """
         logger.info(f"Downloading inbox folder: {view}")
-        all_messages = []
-        page = 1
+        all_messages: list[InboxMessage] = []
 
-        while True:
-            messages, has_next = self.download_page(view, page)
-            all_messages.extend(messages)
+        # Bind loop-invariant lookups to locals for the pagination loop
+        fetch_page = self._fetch_page
+        extend_messages = all_messages.extend
 
-            if not has_next:
-                break
+        # Page 1 tells us how many pages the folder has; the remaining pages
+        # are then fetched concurrently and consumed in page order.
+        messages, has_next, total_pages = fetch_page(view, 1)
+        extend_messages(messages)
+        page = 1
 
-            page += 1
+        with ThreadPoolExecutor(max_workers=max(1, self.config.concurrency)) as executor:
+            while has_next:
+                # If the folder grew past the advertised total, keep going one page at a time
+                pages = list(range(page + 1, max(total_pages, page + 1) + 1))
+                results = executor.map(fetch_page, [view] * len(pages), pages)
+                for result in results:
+                    messages, has_next, total_pages = result
+                    extend_messages(messages)
+                    page += 1
+                    if not has_next:
+                        break
 
         logger.info(f"  → Downloaded {len(all_messages)} messages from folder '{view}'")
         return all_messages
@@ -66,8 +80,22 @@ class InboxClient(BaseAPIClient):
         Raises:
             APIError: If download fails
         """
-        from yalje.parsers.html_parser import HTMLParser
+        messages, has_next_page, _total_pages = self._fetch_page(view, page)
+        return (messages, has_next_page)
+
+    def _fetch_page(self, view: str, page: int) -> tuple[list[InboxMessage], bool, int]:
+        """Download a single page of inbox messages along with the folder's page count.
+
+        Args:
+            view: Folder view
+            page: Page number (1-indexed)
+
+        Returns:
+            Tuple of (messages, has_next_page, total_pages)
 
+        Raises:
+            APIError: If download fails
+        """
         logger.info(f"Downloading inbox page {page} (view={view})")
 
         # Build URL with query parameters
@@ -77,11 +105,13 @@ class InboxClient(BaseAPIClient):
         # Make GET request
         response = self.session.get(url, params=params)
 
-        # Parse HTML response using HTMLParser
-        messages, has_next_page = HTMLParser.parse_inbox_page(response.text)
+        # Parse HTML response using HTMLParser (raw bytes skip requests' charset detection)
+        messages, current_page, total_pages = HTMLParser.parse_inbox_page_with_pagination(
+            response.content
+        )
 
         logger.info(f"  → Downloaded {len(messages)} messages from page {page}")
-        return (messages, has_next_page)
+        return (messages, current_page < total_pages, total_pages)
 
     def download_all(self, folders: Optional[list[str]] = None) -> list[InboxMessage]:
         """Download messages from multiple inbox folders.
@@ -1,16 +1,43 @@
 """API client for downloading LiveJournal posts."""
 
-from datetime import datetime
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Iterator, Optional
+from urllib.parse import urlencode
 
 from yalje.api.base import BaseAPIClient
+from yalje.api.profile import parse_profile_data
 from yalje.core.config import YaljeConfig
 from yalje.core.session import HTTPSession
 from yalje.models.post import Post
+from yalje.parsers.xml_parser import XMLParser
+from yalje.storage.cache import CacheEntry, ResponseCache
+from yalje.utils.dates import generate_month_range
 from yalje.utils.logging import get_logger
 
 logger = get_logger("api.posts")
 
+# Zero-padded month strings indexed by month number (index 0 unused)
+_MONTH_STR = ("", "01", "02", "03", "04", "05", "06", "07", "08", "09", "10", "11", "12")
+
+# Constant part of the export_do.bml form, URL-encoded once at import
+_EXPORT_FORM_PREFIX = urlencode(
+    {
+        "what": "journal",
+        "format": "xml",
+        "header": "on",
+        "encid": "2",  # UTF-8 encoding
+        "field_itemid": "on",
+        "field_eventtime": "on",
+        "field_logtime": "on",
+        "field_subject": "on",
+        "field_event": "on",
+        "field_security": "on",
+        "field_allowmask": "on",
+        "field_currents": "on",
+    }
+)
+
 
 class PostsClient(BaseAPIClient):
     """Client for downloading posts via LiveJournal export API."""
@@ -23,6 +50,7 @@ class PostsClient(BaseAPIClient):
             config: Configuration object
         """
         super().__init__(session, config)
+        self._cache = ResponseCache(config.cache_dir) if config.cache_dir else None
 
     def download_month(self, year: int, month: int) -> list[Post]:
         """Download all posts for a specific month.
@@ -37,42 +65,45 @@ class PostsClient(BaseAPIClient):
         Raises:
             APIError: If download fails
         """
-        from yalje.parsers.xml_parser import XMLParser
-
-        logger.info(f"Downloading posts for {year}-{month:02d}")
-
-        # Build request parameters
-        data = {
-            "what": "journal",
-            "year": str(year),
-            "month": f"{month:02d}",  # Zero-padded month
-            "format": "xml",
-            "header": "on",
-            "encid": "2",  # UTF-8 encoding
-            "field_itemid": "on",
-            "field_eventtime": "on",
-            "field_logtime": "on",
-            "field_subject": "on",
-            "field_event": "on",
-            "field_security": "on",
-            "field_allowmask": "on",
-            "field_currents": "on",
-        }
+        month_str = _MONTH_STR[month]
+        logger.info(f"Downloading posts for {year}-{month_str}")
+
+        # Build request body; only year and month vary between requests
+        body = f"{_EXPORT_FORM_PREFIX}&year={year}&month={month_str}"
 
         # Build URL
         url = self._build_url("/export_do.bml")
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+
+        # Revalidate a previously downloaded month instead of refetching it
+        cache_key = ResponseCache.make_key(self.config.username, url, body)
+        cached = self._cache.get(cache_key) if self._cache else None
+        if cached is not None:
+            headers.update(cached.conditional_headers())
 
         # Make POST request
-        response = self.session.post(
-            url,
-            data=data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
+        response = self.session.post(url, data=body, headers=headers)
+
+        # For a POST, a matching If-None-Match is answered 412 instead of 304
+        if cached is not None and response.status_code in (304, 412):
+            posts = [Post(**post) for post in cached.data]
+            logger.info(f"  → {year}-{month_str} unchanged, reused {len(posts)} cached posts")
+            return posts
 
         # Parse XML response
-        posts = XMLParser.parse_posts(response.text)
+        posts = XMLParser.parse_posts(response.content)
+
+        if self._cache is not None:
+            self._cache.put(
+                cache_key,
+                CacheEntry(
+                    data=[post.model_dump() for post in posts],
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                ),
+            )
 
-        logger.info(f"  → Downloaded {len(posts)} posts for {year}-{month:02d}")
+        logger.info(f"  → Downloaded {len(posts)} posts for {year}-{month_str}")
         return posts
 
     def discover_date_range(self) -> tuple[tuple[int, int], tuple[int, int], int]:
@@ -90,8 +121,6 @@ class PostsClient(BaseAPIClient):
             APIError: If profile cannot be fetched
             ParsingError: If profile data cannot be parsed
         """
-        from yalje.api.profile import ProfileParser
-
         logger.info("Auto-discovering date range from profile page")
 
         # Fetch profile page
@@ -99,7 +128,7 @@ class PostsClient(BaseAPIClient):
         response = self.session.get(profile_url)
 
         # Parse profile data
-        profile_data = ProfileParser.parse_profile_data(response.text)
+        profile_data = parse_profile_data(response.text)
 
         start_date = (profile_data.created_year, profile_data.created_month)
         end_date = (profile_data.updated_year, profile_data.updated_month)
@@ -137,23 +166,11 @@ class PostsClient(BaseAPIClient):
             APIError: If download fails
             ParsingError: If profile parsing fails during auto-discovery
         """
-        # Auto-discover date range if not provided
-        expected_count = None
-        if start_year is None or end_year is None:
-            (start_year, start_month), (end_year, end_month), expected_count = (
-                self.discover_date_range()
-            )
-            logger.info(f"Auto-discovered range: expecting {expected_count} posts")
-
-        # Type narrowing: after auto-discovery, these values are guaranteed to be int
-        assert start_year is not None and start_month is not None
-        assert end_year is not None and end_month is not None
-
-        all_posts = []
+        (start_year, start_month), (end_year, end_month), expected_count = self._resolve_date_range(
+            start_year, start_month, end_year, end_month
+        )
 
-        for year, month in self._generate_month_range(start_year, start_month, end_year, end_month):
-            posts = self.download_month(year, month)
-            all_posts.extend(posts)
+        all_posts = list(self.iter_all(start_year, start_month, end_year, end_month))
 
         # Log validation if we have expected count
         if expected_count is not None:
@@ -167,6 +184,82 @@ class PostsClient(BaseAPIClient):
 
         return all_posts
 
+    def iter_all(
+        self,
+        start_year: Optional[int] = None,
+        start_month: Optional[int] = None,
+        end_year: Optional[int] = None,
+        end_month: Optional[int] = None,
+    ) -> Iterator[Post]:
+        """Download posts within a date range, yielding them month by month.
+
+        Months are fetched concurrently over the shared session, but at most
+        ``config.concurrency`` months are in flight or buffered at once, so
+        memory stays proportional to a few months rather than the whole journal.
+        Posts are yielded in chronological month order.
+
+        Args:
+            start_year: Starting year (optional - auto-discovered if not provided)
+            start_month: Starting month 1-12 (optional - auto-discovered if not provided)
+            end_year: Ending year (optional - auto-discovered if not provided)
+            end_month: Ending month 1-12 (optional - auto-discovered if not provided)
+
+        Yields:
+            Post objects
+
+        Raises:
+            APIError: If download fails
+            ParsingError: If profile parsing fails during auto-discovery
+        """
+        (start_year, start_month), (end_year, end_month), _ = self._resolve_date_range(
+            start_year, start_month, end_year, end_month
+        )
+
+        workers = max(1, self.config.concurrency)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: deque[Future[list[Post]]] = deque()
+            for year, month in self._generate_month_range(
+                start_year, start_month, end_year, end_month
+            ):
+                pending.append(executor.submit(self.download_month, year, month))
+                if len(pending) >= workers:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+
+    def _resolve_date_range(
+        self,
+        start_year: Optional[int],
+        start_month: Optional[int],
+        end_year: Optional[int],
+        end_month: Optional[int],
+    ) -> tuple[tuple[int, int], tuple[int, int], Optional[int]]:
+        """Fill in a missing date range from the profile page.
+
+        Args:
+            start_year: Starting year, or None to auto-discover
+            start_month: Starting month, or None to auto-discover
+            end_year: Ending year, or None to auto-discover
+            end_month: Ending month, or None to auto-discover
+
+        Returns:
+            Tuple of ((start_year, start_month), (end_year, end_month), expected_count);
+            expected_count is None unless the range was auto-discovered
+        """
+        expected_count = None
+        if start_year is None or end_year is None:
+            (start_year, start_month), (end_year, end_month), expected_count = (
+                self.discover_date_range()
+            )
+            logger.info(f"Auto-discovered range: expecting {expected_count} posts")
+
+        # Type narrowing: after auto-discovery, these values are guaranteed to be int
+        assert start_year is not None and start_month is not None
+        assert end_year is not None and end_month is not None
+
+        return (start_year, start_month), (end_year, end_month), expected_count
+
     def _generate_month_range(
         self, start_year: int, start_month: int, end_year: int, end_month: int
     ) -> Iterator[tuple[int, int]]:
@@ -178,17 +271,7 @@ class PostsClient(BaseAPIClient):
             end_year: Ending year
             end_month: Ending month (1-12)
 
-        Yields:
-            (year, month) tuples
+        Returns:
+            Iterator of (year, month) tuples
         """
-        current = datetime(start_year, start_month, 1)
-        end = datetime(end_year, end_month, 1)
-
-        while current <= end:
-            yield (current.year, current.month)
-
-            # Move to next month
-            if current.month == 12:
-                current = datetime(current.year + 1, 1, 1)
-            else:
-                current = datetime(current.year, current.month + 1, 1)
+        return generate_month_range(start_year, start_month, end_year, end_month)
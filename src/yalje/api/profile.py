@@ -2,10 +2,17 @@
 
 import html
 import json
-import re
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional
 
+# The third-party regex module is API-compatible with re for these patterns
+# and is used when installed (pip install yalje[speedups])
+try:
+    import regex as re
+except ImportError:  # pragma: no cover - depends on installed extras
+    import re  # type: ignore[no-redef]
+
 from yalje.core.exceptions import ParsingError
 from yalje.utils.logging import get_logger
 
@@ -97,6 +104,91 @@ MONTH_NAMES = {
     "diciembre": 12,
 }
 
+# Site.remote is a JS object literal assigned in an inline script; it is found
+# with str.find and decoded with raw_decode, which stops at the closing brace
+_SITE_REMOTE = "Site.remote"
+_JSON_DECODER = json.JSONDecoder()
+
+# Profile page patterns, compiled once at import
+_RE_STAT_ENTRYCOUNT = re.compile(
+    r'class="b-profile-stat-item\s+b-profile-stat-entrycount"[^>]*>.*?'
+    r'class="b-profile-stat-value">(\d+)</div>',
+    re.DOTALL,
+)
+# The month is captured as any non-space run (staying off the regex engine's
+# Unicode class path) and validated by the MONTH_NAMES lookup instead
+_RE_CREATED = re.compile(r"on\s+(\d+)\s+(\S+)\s+(\d{4})")
+_RE_UPDATED = re.compile(r'<span class="tooltip"[^>]*>(\d+)\s+(\S+)\s+(\d{4})</span>')
+
+# Read-only month lookup that also holds the capitalized spellings pages use,
+# so the common case needs no str.lower() call
+_MONTH_LOOKUP = MappingProxyType(
+    {**MONTH_NAMES, **{name.capitalize(): num for name, num in MONTH_NAMES.items()}}
+)
+
+# Literal labels that precede the creation date; the date is read from a short
+# window after the label before falling back to a whole-page regex search
+_CREATED_LABELS = ("Journal created", "Журнал создан")
+_CREATED_WINDOW = 200
+_UPDATED_MARKER = '<span class="tooltip"'
+
+
+def _unescape(html_content: str) -> str:
+    """Decode HTML entities, skipping the work when there are none.
+
+    Args:
+        html_content: HTML content
+
+    Returns:
+        HTML with entities (e.g. &nbsp;) decoded
+    """
+    if "&" not in html_content:
+        return html_content
+    return html.unescape(html_content)
+
+
+def _month_number(month_name: str) -> Optional[int]:
+    """Look up a month number by (any-case) month name.
+
+    Args:
+        month_name: Month name as it appears on the page
+
+    Returns:
+        Month number (1-12) or None if the name is unknown
+    """
+    month_num = _MONTH_LOOKUP.get(month_name)
+    if month_num is None:
+        month_num = _MONTH_LOOKUP.get(month_name.lower())
+    return month_num
+
+
+def _scan_date_tokens(text: str) -> Optional[tuple[int, int]]:
+    """Find a "DD MONTH YYYY" date in a short run of text without a regex.
+
+    Splits on whitespace (which includes the non-breaking spaces from
+    &nbsp;) and looks for a day, a known month name and a 4-digit year in
+    consecutive tokens. Markup glued to the year (e.g. "2011</dd>") is
+    ignored.
+
+    Args:
+        text: Text to scan, typically a small window after a label
+
+    Returns:
+        Tuple of (year, month) or None if no date is found
+    """
+    tokens = text.split()
+    for i in range(2, len(tokens)):
+        year = tokens[i].partition("<")[0]
+        if len(year) != 4 or not (year.isascii() and year.isdigit()):
+            continue
+        day = tokens[i - 2].rpartition(">")[2]
+        if not (day.isascii() and day.isdigit()):
+            continue
+        month_num = _month_number(tokens[i - 1])
+        if month_num is not None:
+            return (int(year), month_num)
+    return None
+
 
 class ProfileData:
     """Container for profile metadata."""
@@ -121,8 +213,16 @@ class ProfileData:
         self.post_count = post_count
         self.created_year = created_year
         self.created_month = created_month
-        self.updated_year = updated_year or datetime.now().year
-        self.updated_month = updated_month or datetime.now().month
+
+        # Default a missing update date to now, reading the clock at most once
+        if updated_year is None or updated_month is None:
+            now = datetime.now()
+            if updated_year is None:
+                updated_year = now.year
+            if updated_month is None:
+                updated_month = now.month
+        self.updated_year = updated_year
+        self.updated_month = updated_month
 
     def __repr__(self) -> str:
         """String representation."""
@@ -133,213 +233,240 @@ class ProfileData:
         )
 
 
-class ProfileParser:
-    """Parser for LiveJournal profile pages."""
+def parse_profile_data(html: str) -> ProfileData:
+    """Extract profile metadata from HTML.
 
-    @staticmethod
-    def parse_profile_data(html: str) -> ProfileData:
-        """Extract profile metadata from HTML.
+    This function uses a multi-strategy approach:
+    1. Try to extract post count from Site.remote JSON (most reliable)
+    2. Try to extract creation date from HTML
+    3. Fall back to defaults if parsing fails
 
-        This method uses a multi-strategy approach:
-        1. Try to extract post count from Site.remote JSON (most reliable)
-        2. Try to extract creation date from HTML
-        3. Fall back to defaults if parsing fails
+    Args:
+        html: HTML content from profile page
 
-        Args:
-            html: HTML content from profile page
+    Returns:
+        ProfileData object with extracted metadata
 
-        Returns:
-            ProfileData object with extracted metadata
+    Raises:
+        ParsingError: If critical data cannot be extracted
+    """
+    logger.debug("Parsing profile data from HTML")
 
-        Raises:
-            ParsingError: If critical data cannot be extracted
-        """
-        logger.debug("Parsing profile data from HTML")
+    # Extract post count from JSON
+    post_count = _extract_post_count_json(html)
+    if post_count is None:
+        # Fallback: try HTML statistics section
+        post_count = _extract_post_count_html(html)
 
-        # Extract post count from JSON
-        post_count = ProfileParser._extract_post_count_json(html)
-        if post_count is None:
-            # Fallback: try HTML statistics section
-            post_count = ProfileParser._extract_post_count_html(html)
+    if post_count is None:
+        raise ParsingError("Could not extract post count from profile page")
 
-        if post_count is None:
-            raise ParsingError("Could not extract post count from profile page")
+    # Decode HTML entities (&nbsp; etc) once for both date extractors
+    decoded_html = _unescape(html)
 
-        # Extract creation date
-        created_year, created_month = ProfileParser._extract_creation_date(html)
+    # Extract creation date
+    created_year, created_month = _extract_creation_date(decoded_html)
 
-        # Extract update date (optional)
-        updated_year, updated_month = ProfileParser._extract_update_date(html)
+    # Extract update date (optional)
+    updated_year, updated_month = _extract_update_date(decoded_html)
 
-        logger.debug(
-            f"Parsed profile: {post_count} posts, created {created_year}-{created_month:02d}"
-        )
+    logger.debug(f"Parsed profile: {post_count} posts, created {created_year}-{created_month:02d}")
 
-        return ProfileData(
-            post_count=post_count,
-            created_year=created_year,
-            created_month=created_month,
-            updated_year=updated_year,
-            updated_month=updated_month,
-        )
+    return ProfileData(
+        post_count=post_count,
+        created_year=created_year,
+        created_month=created_month,
+        updated_year=updated_year,
+        updated_month=updated_month,
+    )
 
-    @staticmethod
-    def _extract_post_count_json(html: str) -> Optional[int]:
-        """Extract post count from Site.remote JSON.
 
-        Args:
-            html: HTML content
+def _extract_post_count_json(html: str) -> Optional[int]:
+    """Extract post count from Site.remote JSON.
 
-        Returns:
-            Post count or None if not found
-        """
-        try:
-            # Find Site.remote = {...};
-            match = re.search(r"Site\.remote\s*=\s*(\{.*?\});", html, re.DOTALL)
-            if not match:
-                logger.debug("Site.remote JSON not found in profile page")
-                return None
-
-            # Parse JSON
-            data = json.loads(match.group(1))
-
-            # Extract post count (it's a string in the JSON)
-            post_count_str = data.get("number_of_posts")
-            if post_count_str:
-                post_count = int(post_count_str)
-                logger.debug(f"Extracted post count from JSON: {post_count}")
-                return post_count
+    Args:
+        html: HTML content
 
+    Returns:
+        Post count or None if not found
+    """
+    try:
+        # Find Site.remote = {...};
+        start = _find_site_remote(html)
+        if start is None:
+            logger.debug("Site.remote JSON not found in profile page")
             return None
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
-            logger.debug(f"Failed to parse post count from JSON: {e}")
-            return None
-
-    @staticmethod
-    def _extract_post_count_html(html: str) -> Optional[int]:
-        """Extract post count from HTML statistics section.
 
-        Looks for the pattern:
-        <div class="b-profile-stat-value">358</div>
-        ...
-        <div class="b-profile-stat-title">...Journal entries...</div>
-
-        Args:
-            html: HTML content
-
-        Returns:
-            Post count or None if not found
-        """
-        try:
-            # Find stat value associated with "entrycount" class
-            match = re.search(
-                r'class="b-profile-stat-item\s+b-profile-stat-entrycount"[^>]*>.*?'
-                r'class="b-profile-stat-value">(\d+)</div>',
-                html,
-                re.DOTALL,
+        # Parse just the object; raw_decode ignores whatever follows it
+        data, _end = _JSON_DECODER.raw_decode(html, start)
+
+        # Extract post count (it's a string in the JSON)
+        post_count_str = data.get("number_of_posts")
+        if post_count_str:
+            post_count = int(post_count_str)
+            logger.debug(f"Extracted post count from JSON: {post_count}")
+            return post_count
+
+        return None
+    except (json.JSONDecodeError, ValueError, KeyError) as e:
+        logger.debug(f"Failed to parse post count from JSON: {e}")
+        return None
+
+
+def _find_site_remote(html: str) -> Optional[int]:
+    """Locate the object literal in a ``Site.remote = {...}`` assignment.
+
+    Args:
+        html: HTML content
+
+    Returns:
+        Index of the opening brace, or None if there is no such assignment
+    """
+    length = len(html)
+    pos = html.find(_SITE_REMOTE)
+    while pos != -1:
+        idx = pos + len(_SITE_REMOTE)
+        while idx < length and html[idx].isspace():
+            idx += 1
+        if idx < length and html[idx] == "=":
+            idx += 1
+            while idx < length and html[idx].isspace():
+                idx += 1
+            if idx < length and html[idx] == "{":
+                return idx
+        pos = html.find(_SITE_REMOTE, idx)
+    return None
+
+
+def _extract_post_count_html(html: str) -> Optional[int]:
+    """Extract post count from HTML statistics section.
+
+    Looks for the pattern:
+    <div class="b-profile-stat-value">358</div>
+    ...
+    <div class="b-profile-stat-title">...Journal entries...</div>
+
+    Args:
+        html: HTML content
+
+    Returns:
+        Post count or None if not found
+    """
+    try:
+        # Find stat value associated with "entrycount" class
+        match = _RE_STAT_ENTRYCOUNT.search(html)
+        if match:
+            post_count = int(match.group(1))
+            logger.debug(f"Extracted post count from HTML: {post_count}")
+            return post_count
+
+        return None
+    except (ValueError, AttributeError) as e:
+        logger.debug(f"Failed to parse post count from HTML: {e}")
+        return None
+
+
+def _extract_creation_date(decoded_html: str) -> tuple[int, int]:
+    """Extract journal creation date (language-agnostic).
+
+    Looks for pattern:
+    "Journal created: on  5 January 2011&nbsp;(#33401138)"
+
+    Supports multiple languages via MONTH_NAMES mapping.
+
+    Args:
+        decoded_html: HTML content with entities already decoded
+
+    Returns:
+        Tuple of (year, month)
+
+    Raises:
+        ParsingError: If creation date cannot be found
+    """
+    try:
+        # Fast path: read "DD MONTH YYYY" tokens just after the label
+        for label in _CREATED_LABELS:
+            idx = decoded_html.find(label)
+            if idx != -1:
+                created = _scan_date_tokens(decoded_html[idx : idx + _CREATED_WINDOW])
+                if created is not None:
+                    logger.debug(f"Extracted creation date: {created[0]}-{created[1]:02d}")
+                    return created
+                break
+
+        # Fallback for unlabelled or unusual layouts
+        # Pattern: "on DD MONTH YYYY" anywhere in the page
+        match = _RE_CREATED.search(decoded_html)
+        if not match:
+            raise ParsingError("Could not find journal creation date in profile")
+
+        _day, month_name, year = match.groups()
+
+        # Look up month number from multi-language mapping
+        month_num = _month_number(month_name)
+
+        if not month_num:
+            raise ParsingError(
+                f"Unknown month name '{month_name}'. "
+                f"Supported languages: English, Russian, German, French, Spanish"
             )
-            if match:
-                post_count = int(match.group(1))
-                logger.debug(f"Extracted post count from HTML: {post_count}")
-                return post_count
 
-            return None
-        except (ValueError, AttributeError) as e:
-            logger.debug(f"Failed to parse post count from HTML: {e}")
-            return None
+        year_int = int(year)
 
-    @staticmethod
-    def _extract_creation_date(html_content: str) -> tuple[int, int]:
-        """Extract journal creation date (language-agnostic).
+        logger.debug(f"Extracted creation date: {year_int}-{month_num:02d}")
 
-        Looks for pattern:
-        "Journal created: on  5 January 2011&nbsp;(#33401138)"
+        return (year_int, month_num)
 
-        Supports multiple languages via MONTH_NAMES mapping.
+    except (ValueError, AttributeError) as e:
+        raise ParsingError(f"Failed to parse journal creation date: {e}") from e
 
-        Args:
-            html_content: HTML content
 
-        Returns:
-            Tuple of (year, month)
+def _extract_update_date(decoded_html: str) -> tuple[Optional[int], Optional[int]]:
+    """Extract journal last update date (language-agnostic).
 
-        Raises:
-            ParsingError: If creation date cannot be found
-        """
-        try:
-            # Decode HTML entities (&nbsp; etc)
-            decoded_html = html.unescape(html_content)
+    Looks for pattern in:
+    <span class="tooltip" title='18 hours ago'>11 November 2025</span>
 
-            # Find the creation date pattern
-            # Pattern: "on  DD MONTH YYYY" followed by anything then "(#ID)"
-            match = re.search(r"on\s+(\d+)\s+([а-яА-ЯёЁa-zA-Zäöüß]+)\s+(\d{4})", decoded_html)
-            if not match:
-                raise ParsingError("Could not find journal creation date in profile")
+    Supports multiple languages via MONTH_NAMES mapping.
 
+    Args:
+        decoded_html: HTML content with entities already decoded
+
+    Returns:
+        Tuple of (year, month) or (None, None) if not found
+    """
+    try:
+        # Find update date in tooltip
+        # Start at the first tooltip span rather than the top of the page
+        idx = decoded_html.find(_UPDATED_MARKER)
+        match = _RE_UPDATED.search(decoded_html, idx) if idx != -1 else None
+        if match:
             _day, month_name, year = match.groups()
 
             # Look up month number from multi-language mapping
-            month_lower = month_name.lower()
-            month_num = MONTH_NAMES.get(month_lower)
+            month_num = _month_number(month_name)
 
             if not month_num:
-                raise ParsingError(
-                    f"Unknown month name '{month_name}'. "
-                    f"Supported languages: English, Russian, German, French, Spanish"
-                )
+                logger.debug(f"Unknown month name in update date: '{month_name}'")
+                return (None, None)
 
             year_int = int(year)
 
-            logger.debug(f"Extracted creation date: {year_int}-{month_num:02d}")
-
+            logger.debug(f"Extracted update date: {year_int}-{month_num:02d}")
             return (year_int, month_num)
 
-        except (ValueError, AttributeError) as e:
-            raise ParsingError(f"Failed to parse journal creation date: {e}") from e
-
-    @staticmethod
-    def _extract_update_date(html_content: str) -> tuple[Optional[int], Optional[int]]:
-        """Extract journal last update date (language-agnostic).
-
-        Looks for pattern in:
-        <span class="tooltip" title='18 hours ago'>11 November 2025</span>
+        # Fallback: current date
+        return (None, None)
 
-        Supports multiple languages via MONTH_NAMES mapping.
+    except (ValueError, AttributeError) as e:
+        logger.debug(f"Could not parse update date: {e}")
+        return (None, None)
 
-        Args:
-            html_content: HTML content
-
-        Returns:
-            Tuple of (year, month) or (None, None) if not found
-        """
-        try:
-            # Decode HTML entities
-            decoded_html = html.unescape(html_content)
-
-            # Find update date in tooltip
-            match = re.search(
-                r'<span class="tooltip"[^>]*>(\d+)\s+([а-яА-ЯёЁa-zA-Zäöüß]+)\s+(\d{4})</span>',
-                decoded_html,
-            )
-            if match:
-                _day, month_name, year = match.groups()
 
-                # Look up month number from multi-language mapping
-                month_lower = month_name.lower()
-                month_num = MONTH_NAMES.get(month_lower)
-
-                if not month_num:
-                    logger.debug(f"Unknown month name in update date: '{month_name}'")
-                    return (None, None)
-
-                year_int = int(year)
-
-                logger.debug(f"Extracted update date: {year_int}-{month_num:02d}")
-                return (year_int, month_num)
+class ProfileParser:
+    """Parser for LiveJournal profile pages.
 
-            # Fallback: current date
-            return (None, None)
+    Thin namespace over the module-level functions, kept for existing callers.
+    """
 
-        except (ValueError, AttributeError) as e:
-            logger.debug(f"Could not parse update date: {e}")
-            return (None, None)
+    parse_profile_data = staticmethod(parse_profile_data)
@@ -1,29 +1,29 @@
 """Main CLI application."""
 
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
 
 import click
 
 from yalje import __version__
-from yalje.api.comments import CommentsClient
-from yalje.api.inbox import InboxClient
-from yalje.api.posts import PostsClient
-from yalje.core.auth import Authenticator
-from yalje.core.config import YaljeConfig
-from yalje.core.exceptions import AuthenticationError, YaljeError
-from yalje.exporters.json_exporter import JSONExporter
-from yalje.exporters.xml_exporter import XMLExporter
-from yalje.exporters.yaml_exporter import YAMLExporter
-from yalje.models.comment import Comment
-from yalje.models.export import ExportMetadata, LJExport
-from yalje.models.inbox import InboxMessage
-from yalje.models.post import Post
-from yalje.models.user import User
 from yalje.utils.logging import get_logger, setup_logging
 
+# The download stack (requests, pydantic, PyYAML, lxml) is imported inside
+# the command, so --help, --version and shell completion start quickly
+if TYPE_CHECKING:
+    from yalje.api.comments import CommentsClient
+    from yalje.models.comment import Comment
+    from yalje.models.export import ExportMetadata
+    from yalje.models.inbox import InboxMessage
+    from yalje.models.post import Post
+    from yalje.models.user import User
+
 logger = get_logger("cli.main")
 
+T = TypeVar("T")
+
 
 @click.command()
 @click.version_option(version=__version__)
@@ -58,7 +58,7 @@ logger = get_logger("cli.main")
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["yaml", "json", "xml"], case_sensitive=False),
+    type=click.Choice(["yaml", "json", "jsonl", "xml"], case_sensitive=False),
     default="yaml",
     help="Output format (default: yaml)",
 )
@@ -103,6 +103,14 @@ def cli(
         # Specify output file
         $ yalje --output my-backup.yaml
     """
+    from yalje.api.comments import CommentsClient
+    from yalje.api.inbox import InboxClient
+    from yalje.api.posts import PostsClient
+    from yalje.core.auth import Authenticator
+    from yalje.core.config import YaljeConfig
+    from yalje.core.exceptions import AuthenticationError, YaljeError
+    from yalje.models.export import ExportMetadata
+
     # Determine log level
     if verbose:
         log_level = "DEBUG"
@@ -161,92 +169,59 @@ def cli(
         comments_client = CommentsClient(session, config)
         inbox_client = InboxClient(session, config)
 
-        # Initialize data containers
-        posts: list[Post] = []
-        comments: list[Comment] = []
-        usermap: list[User] = []
-        inbox_messages: list[InboxMessage] = []
-
-        # Download posts
-        if not no_posts:
-            try:
-                posts = posts_client.download_all(
-                    start_year=start_year,
-                    start_month=start_month,
-                    end_year=end_year,
-                    end_month=end_month,
-                )
-                logger.info(f"Downloaded {len(posts)} posts")
-            except Exception as e:
-                logger.error(f"Posts download failed: {e}")
-                raise click.Abort() from None
-        else:
-            logger.info("Skipping posts download")
-
-        # Download comments
-        if not no_comments:
-            try:
-                comments, usermap = comments_client.download_all()
-                logger.info(f"Downloaded {len(comments)} comments")
-                logger.info(f"Downloaded usermap with {len(usermap)} users")
-            except Exception as e:
-                logger.error(f"Comments download failed: {e}")
-                raise click.Abort() from None
-        else:
-            logger.info("Skipping comments download")
-
-        # Download inbox
-        if not no_inbox:
-            try:
-                inbox_messages = inbox_client.download_all()
-                logger.info(f"Downloaded {len(inbox_messages)} inbox messages")
-            except Exception as e:
-                logger.error(f"Inbox download failed: {e}")
-                raise click.Abort() from None
-        else:
-            logger.info("Skipping inbox download")
+        def download_posts() -> "list[Post]":
+            return posts_client.download_all(
+                start_year=start_year,
+                start_month=start_month,
+                end_year=end_year,
+                end_month=end_month,
+            )
 
-        # Create export object
-        logger.info("Creating export...")
         metadata = ExportMetadata(
             lj_user=config.username,
             yalje_version=__version__,
         )
-        export = LJExport(
-            metadata=metadata,
-            posts=posts,
-            comments=comments,
-            usermap=usermap,
-            inbox=inbox_messages,
-        )
+        usermap: list[User] = []
 
-        # Export to selected format
         logger.info(f"Writing to {output} (format: {format})...")
-        try:
-            # Select exporter based on format
-            exporter: Union[YAMLExporter, JSONExporter, XMLExporter]
-            if format == "yaml":
-                exporter = YAMLExporter()
-            elif format == "json":
-                exporter = JSONExporter()
-            elif format == "xml":
-                exporter = XMLExporter()
-            else:
-                raise ValueError(f"Unknown format: {format}")
-
-            exporter.export(export, output)
-            logger.info(f"Export saved to {output}")
-        except Exception as e:
-            logger.error(f"Export failed: {e}")
-            raise click.Abort() from None
-
-        # Show summary
-        logger.info("Download complete!")
-        logger.info(f"Output file: {output}")
-        logger.info(f"  Posts: {len(posts)}")
-        logger.info(f"  Comments: {len(comments)}")
-        logger.info(f"  Usermap: {len(usermap)} users")
-        logger.info(f"  Inbox: {len(inbox_messages)} messages")
+        if format == "yaml":
+            # YAML is written while posts and comments download, so only a
+            # few months / one comment batch is held in memory at a time
+            _stream_yaml_export(
+                output,
+                metadata,
+                usermap,
+                posts=None
+                if no_posts
+                else posts_client.iter_all(start_year, start_month, end_year, end_month),
+                comments_client=None if no_comments else comments_client,
+                download_inbox=None if no_inbox else inbox_client.download_all,
+            )
+        else:
+            _download_and_export(
+                output,
+                format,
+                metadata,
+                usermap,
+                download_posts=None if no_posts else download_posts,
+                download_comments=None if no_comments else comments_client.download_all,
+                download_inbox=None if no_inbox else inbox_client.download_all,
+            )
+        logger.info(f"Export saved to {output}")
+
+        # Show summary as one record (one console write)
+        logger.info(
+            "\n".join(
+                (
+                    "Download complete!",
+                    f"Output file: {output}",
+                    f"  Posts: {metadata.post_count}",
+                    f"  Comments: {metadata.comment_count}",
+                    f"  Usermap: {len(usermap)} users",
+                    f"  Inbox: {metadata.inbox_count} messages",
+                )
+            )
+        )
 
     except click.Abort:
         raise
@@ -261,5 +236,183 @@ def cli(
         raise click.Abort() from None
 
 
+def _log_failures(label: str, records: Iterable[T]) -> Iterator[T]:
+    """Pass records through, logging which section a download failure came from.
+
+    Args:
+        label: Section name for the error message
+        records: Records being streamed
+
+    Yields:
+        The records unchanged
+    """
+    try:
+        yield from records
+    except Exception as e:
+        logger.error(f"{label} download failed: {e}")
+        raise
+
+
+def _stream_comments(client: "CommentsClient", usermap: "list[User]") -> "Iterator[Comment]":
+    """Flatten comment batches, filling usermap from the comment metadata.
+
+    The usermap is filled as soon as the metadata is downloaded, before the
+    first batch, so it is kept even when there are no comments.
+
+    Args:
+        client: Comments API client
+        usermap: List to receive the usermap
+
+    Yields:
+        Comments with usernames resolved
+    """
+    metadata_usermap, batches = client.iter_all()
+    usermap.extend(metadata_usermap)
+    for batch in batches:
+        yield from batch
+
+
+def _stream_yaml_export(
+    output: Path,
+    metadata: "ExportMetadata",
+    usermap: "list[User]",
+    posts: "Optional[Iterator[Post]]",
+    comments_client: "Optional[CommentsClient]",
+    download_inbox: "Optional[Callable[[], list[InboxMessage]]]",
+) -> None:
+    """Download sections while writing them to a YAML file.
+
+    The inbox is small and independent of the other sections, so it is
+    fetched in the background while posts and comments stream to disk.
+
+    Args:
+        output: Output file path
+        metadata: Export metadata (counts are filled in)
+        usermap: List to receive the comments usermap
+        posts: Post iterator, or None to skip posts
+        comments_client: Comments client, or None to skip comments
+        download_inbox: Inbox download function, or None to skip the inbox
+
+    Raises:
+        click.Abort: If a download or the export fails
+    """
+    from yalje.exporters.yaml_exporter import YAMLExporter
+
+    for label, skipped in (
+        ("posts", posts is None),
+        ("comments", comments_client is None),
+        ("inbox", download_inbox is None),
+    ):
+        if skipped:
+            logger.info(f"Skipping {label} download")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        inbox_future = executor.submit(download_inbox) if download_inbox else None
+
+        def inbox() -> "Iterator[InboxMessage]":
+            if inbox_future is not None:
+                yield from inbox_future.result()
+
+        try:
+            YAMLExporter().export_stream(
+                output,
+                metadata,
+                posts=_log_failures("Posts", posts or ()),
+                comments=_log_failures(
+                    "Comments",
+                    _stream_comments(comments_client, usermap) if comments_client else (),
+                ),
+                usermap=usermap,
+                inbox=_log_failures("Inbox", inbox()),
+            )
+        except Exception as e:
+            logger.error(f"Export failed: {e}")
+            raise click.Abort() from None
+
+
+def _download_and_export(
+    output: Path,
+    format: str,
+    metadata: "ExportMetadata",
+    usermap: "list[User]",
+    download_posts: "Optional[Callable[[], list[Post]]]",
+    download_comments: "Optional[Callable[[], tuple[list[Comment], list[User]]]]",
+    download_inbox: "Optional[Callable[[], list[InboxMessage]]]",
+) -> None:
+    """Download all sections into memory, then export them in one go.
+
+    Args:
+        output: Output file path
+        format: Output format ("json", "jsonl" or "xml")
+        metadata: Export metadata (counts are filled in)
+        usermap: List to receive the comments usermap
+        download_posts: Posts download function, or None to skip posts
+        download_comments: Comments download function, or None to skip comments
+        download_inbox: Inbox download function, or None to skip the inbox
+
+    Raises:
+        click.Abort: If a download or the export fails
+    """
+    from yalje.exporters.json_exporter import JSONExporter
+    from yalje.exporters.jsonl_exporter import JSONLExporter
+    from yalje.exporters.xml_exporter import XMLExporter
+    from yalje.models.export import LJExport
+
+    # Sections are independent and network-bound, so enabled ones run
+    # concurrently over the shared session: (label, download function)
+    downloads: list[tuple[str, Optional[Callable[[], Any]]]] = [
+        ("Posts", download_posts),
+        ("Comments", download_comments),
+        ("Inbox", download_inbox),
+    ]
+
+    results: dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=len(downloads)) as executor:
+        futures: dict[str, Future[Any]] = {}
+        for label, download in downloads:
+            if download is None:
+                logger.info(f"Skipping {label.lower()} download")
+                continue
+            futures[label] = executor.submit(download)
+
+        for label, future in futures.items():
+            try:
+                results[label] = future.result()
+            except Exception as e:
+                logger.error(f"{label} download failed: {e}")
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise click.Abort() from None
+
+    comments, comments_usermap = results.get("Comments", ([], []))
+    usermap.extend(comments_usermap)
+
+    logger.info("Creating export...")
+    # Validation is skipped deliberately: the parsers build every record with
+    # model_construct, and the container is not worth validating on its own
+    export = LJExport.model_construct(
+        metadata=metadata,
+        posts=results.get("Posts", []),
+        comments=comments,
+        usermap=usermap,
+        inbox=results.get("Inbox", []),
+    )
+
+    try:
+        exporter: Union[JSONExporter, JSONLExporter, XMLExporter]
+        if format == "json":
+            exporter = JSONExporter()
+        elif format == "jsonl":
+            exporter = JSONLExporter()
+        elif format == "xml":
+            exporter = XMLExporter()
+        else:
+            raise ValueError(f"Unknown format: {format}")
+
+        exporter.export(export, output)
+    except Exception as e:
+        logger.error(f"Export failed: {e}")
+        raise click.Abort() from None
+
+
 if __name__ == "__main__":
     cli()
@@ -1,9 +1,6 @@
 """Authentication management for LiveJournal."""
 
-import re
-from typing import Optional, Union
-
-from requests.structures import CaseInsensitiveDict
+from typing import Optional
 
 from yalje.core.config import YaljeConfig
 from yalje.core.exceptions import AuthenticationError
@@ -49,8 +46,8 @@ class Authenticator:
         # Acquire luid cookie
         logger.debug("Acquiring luid cookie")
         try:
-            response = session.get(f"{self.config.base_url}/")
-            luid = self._extract_cookie_from_response(response.headers, "luid")
+            session.get(f"{self.config.base_url}/")
+            luid = self._get_cookie(session, "luid")
             if not luid:
                 raise AuthenticationError("Failed to acquire luid cookie")
             session.set_cookies({"luid": luid})
@@ -67,7 +64,7 @@ class Authenticator:
         }
 
         try:
-            response = session.post(
+            session.post(
                 f"{self.config.base_url}/login.bml",
                 data=login_data,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -80,10 +77,8 @@ class Authenticator:
         # Extract session cookies
         logger.debug("Extracting session cookies")
         try:
-            ljloggedin = self._extract_cookie_from_response(response.headers, "ljloggedin")
-            ljmastersession = self._extract_cookie_from_response(
-                response.headers, "ljmastersession"
-            )
+            ljloggedin = self._get_cookie(session, "ljloggedin")
+            ljmastersession = self._get_cookie(session, "ljmastersession")
 
             if not ljloggedin or not ljmastersession:
                 logger.error("Session cookies not found in response - invalid credentials?")
@@ -104,36 +99,26 @@ class Authenticator:
         logger.info(f"Authentication successful for user: {username}")
         return session
 
-    def _extract_cookie_from_response(
-        self, headers: Union[dict[str, str], CaseInsensitiveDict[str]], cookie_name: str
-    ) -> Optional[str]:
-        """Extract cookie value from Set-Cookie headers.
+    @staticmethod
+    def _get_cookie(session: HTTPSession, cookie_name: str) -> Optional[str]:
+        """Get a cookie the server has set on the session.
+
+        requests parses every Set-Cookie header (including those on redirect
+        hops) into the session's cookie jar, so no header parsing is needed.
 
         Args:
-            headers: Response headers
+            session: Session the responses were received on
             cookie_name: Name of cookie to extract
 
         Returns:
-            Cookie value or None if not found
+            Cookie value (the most recently stored one if several domains or
+            paths set it) or None if not found
         """
-        set_cookie_headers = headers.get("Set-Cookie", "")
-        if not set_cookie_headers:
-            return None
-
-        # Handle multiple Set-Cookie headers
-        if isinstance(set_cookie_headers, str):
-            cookie_strings = [set_cookie_headers]
-        else:
-            cookie_strings = set_cookie_headers
-
-        for cookie_str in cookie_strings:
-            if cookie_name in cookie_str:
-                # Extract value between "cookie_name=" and ";"
-                match = re.search(rf"{cookie_name}=([^;]+)", cookie_str)
-                if match:
-                    return match.group(1)
-
-        return None
+        value = None
+        for cookie in session.session.cookies:
+            if cookie.name == cookie_name:
+                value = cookie.value
+        return value
 
     def validate_session(self) -> bool:
         """Validate that the current session is still active.
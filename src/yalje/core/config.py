@@ -3,9 +3,12 @@
 from pathlib import Path
 from typing import List, Optional
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Resolved once at import; the home directory does not change during a run
+DEFAULT_CONFIG_DIR = Path.home() / ".yalje"
+
 
 class YaljeConfig(BaseSettings):
     """Configuration for yalje operations.
@@ -22,7 +25,8 @@ class YaljeConfig(BaseSettings):
 
     # Paths
     output_path: Path = Field(default=Path("lj-backup.yaml"))
-    config_dir: Path = Field(default=Path.home() / ".yalje")
+    config_dir: Path = Field(default=DEFAULT_CONFIG_DIR)
+    cache_dir: Optional[Path] = None  # enables conditional (304) re-downloads when set
 
     # API settings
     base_url: str = "https://www.livejournal.com"
@@ -37,6 +41,9 @@ class YaljeConfig(BaseSettings):
     # Rate limiting
     request_delay: float = 1.0  # seconds between requests
 
+    # Concurrency
+    concurrency: int = 4  # parallel requests for independent downloads (e.g. post months)
+
     # Export options
     export_posts: bool = True
     export_comments: bool = True
@@ -64,23 +71,30 @@ class YaljeConfig(BaseSettings):
         case_sensitive=False,
     )
 
+    @field_validator("output_path", "config_dir", "cache_dir", "log_file")
+    @classmethod
+    def _expand_user(cls, value: Optional[Path]) -> Optional[Path]:
+        """Expand a leading ~ so paths from .env resolve to the home directory."""
+        return value.expanduser() if value is not None else None
+
     def save_to_file(self, path: Path) -> None:
         """Save configuration to a YAML file."""
-        import yaml
+        from yalje.utils.serialization import YamlDumper, yaml
 
+        # mode="json" turns Paths into strings the safe dumper can represent
         with open(path, "w") as f:
-            yaml.dump(self.model_dump(), f, default_flow_style=False)
+            yaml.dump(self.model_dump(mode="json"), f, Dumper=YamlDumper, default_flow_style=False)
 
     @classmethod
     def load_from_file(cls, path: Path) -> "YaljeConfig":
         """Load configuration from a YAML file."""
-        import yaml
+        from yalje.utils.serialization import YamlLoader, yaml
 
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YamlLoader)
         return cls(**data)
 
     @classmethod
     def get_default_config_path(cls) -> Path:
         """Get the default configuration file path."""
-        return Path.home() / ".yalje" / "config.yaml"
+        return DEFAULT_CONFIG_DIR / "config.yaml"
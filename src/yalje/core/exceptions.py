@@ -1,5 +1,7 @@
 """Custom exception classes for yalje."""
 
+from typing import Optional
+
 
 class YaljeError(Exception):
     """Base exception for all yalje errors."""
@@ -25,6 +27,34 @@ class APIError(YaljeError):
     pass
 
 
+class TransientAPIError(APIError):
+    """Raised when an API request fails in a way that is worth retrying.
+
+    Covers connection errors, timeouts, truncated responses, HTTP 429 and 5xx
+    gateway errors.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        """Initialize transient API error.
+
+        Args:
+            message: Error message
+            retry_after: Server-requested delay in seconds (from Retry-After), if any
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class StreamInterruptedError(TransientAPIError):
+    """Raised when a streamed response body is cut off while it is being read.
+
+    The request itself succeeded, so HTTPSession cannot retry it; the caller
+    re-requests the resource (see HTTPSession.retry_read).
+    """
+
+    pass
+
+
 class ParsingError(YaljeError):
     """Raised when parsing responses fails."""
 
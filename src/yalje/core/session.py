@@ -1,20 +1,119 @@
 """HTTP session management with retry logic."""
 
+import logging
+import threading
 import time
-from typing import Any, Optional
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional, TypeVar, Union
 
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    RetryCallState,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from tenacity.wait import wait_base
 
 from yalje.core.config import YaljeConfig
-from yalje.core.exceptions import APIError
+from yalje.core.exceptions import APIError, StreamInterruptedError, TransientAPIError
 from yalje.utils.logging import get_logger
 
 logger = get_logger("session")
 
+T = TypeVar("T")
+
+# HTTP statuses that indicate a temporary condition worth retrying
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# requests failures that say nothing about the request itself; a body cut off
+# mid-transfer (ChunkedEncodingError, ContentDecodingError) is as retryable
+# as a dropped connection
+_TRANSIENT_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.ContentDecodingError,
+)
+
+# Upper bound on a server-requested Retry-After delay (seconds)
+MAX_RETRY_AFTER = 60.0
+
+# Upper bound on the exponential backoff between attempts (seconds)
+MAX_BACKOFF = 10.0
+
+# Download sections (posts, comments, inbox) that may run at the same time
+CONCURRENT_SECTIONS = 3
+
+# Distinct hosts to keep pools for (www., the journal subdomain, and spares)
+POOL_HOSTS = 4
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Delay in seconds, or None if absent or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _WaitBeforeRetry(wait_base):
+    """Honour Retry-After when the server sent one, else jittered exponential backoff."""
+
+    def __init__(self, backoff: float):
+        self.backoff = wait_exponential_jitter(initial=backoff, max=MAX_BACKOFF, jitter=backoff)
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exception = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = getattr(exception, "retry_after", None)
+        if retry_after is not None:
+            return float(min(retry_after, MAX_RETRY_AFTER))
+        return float(self.backoff(retry_state))
+
+
+def _to_api_error(message: str, error: requests.RequestException) -> APIError:
+    """Classify a requests failure as transient (retryable) or permanent.
+
+    Args:
+        message: Error message
+        error: Underlying requests exception
+
+    Returns:
+        TransientAPIError for connection errors, timeouts, truncated or
+        undecodable bodies and retryable statuses; APIError otherwise
+    """
+    if isinstance(error, _TRANSIENT_EXCEPTIONS):
+        return TransientAPIError(message)
+
+    response = error.response
+    if response is not None and response.status_code in RETRYABLE_STATUS_CODES:
+        retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+        return TransientAPIError(message, retry_after=retry_after)
+
+    return APIError(message)
+
 
 class HTTPSession:
-    """Wrapper around requests.Session with retry logic and rate limiting."""
+    """Wrapper around requests.Session with retry logic and rate limiting.
+
+    One HTTPSession is created per run and shared by every API client, so
+    cookies and pooled keep-alive connections are reused across posts,
+    comments and inbox downloads.
+    """
 
     def __init__(self, config: YaljeConfig):
         """Initialize HTTP session.
@@ -24,23 +123,51 @@ class HTTPSession:
         """
         self.config = config
         self.session = requests.Session()
-        self.session.headers.update({"User-Agent": config.user_agent})
-        self._last_request_time = 0.0
+        self.session.headers.update({"User-Agent": config.user_agent, "Connection": "keep-alive"})
+
+        # Size each host's pool for every worker that can hit it at once (the
+        # posts, comments and inbox sections each run up to `concurrency`
+        # requests in parallel), so connections are kept rather than discarded.
+        # Retries are handled by tenacity, not urllib3.
+        pool_size = max(1, config.concurrency) * CONCURRENT_SECTIONS
+        adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Only transient failures are retried (see _to_api_error); 4xx responses
+        # fail on the first attempt
+        self._retrying = Retrying(
+            stop=stop_after_attempt(max(1, config.retry_attempts)),
+            wait=_WaitBeforeRetry(config.retry_backoff),
+            retry=retry_if_exception_type(TransientAPIError),
+            reraise=True,
+        )
+
+        # Streamed bodies are read after get() has returned, so a body cut off
+        # mid-read is retried by re-running the whole read (see retry_read())
+        self._read_retrying = self._retrying.copy(
+            retry=retry_if_exception_type(StreamInterruptedError)
+        )
+
+        # Monotonic time before which the next request may not start
+        self._next_allowed = 0.0
+        self._rate_lock = threading.Lock()
 
     def _rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.config.request_delay:
-            delay = self.config.request_delay - elapsed
-            logger.debug(f"Rate limiting: sleeping for {delay:.2f}s")
-            time.sleep(delay)
-        self._last_request_time = time.time()
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
+        """Apply rate limiting between requests.
+
+        Thread-safe: when the session is shared by worker threads, request
+        start times are still spaced by at least ``request_delay``. Uses the
+        monotonic clock, so wall-clock adjustments cannot stall or skip it.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            delay = self._next_allowed - now
+            if delay > 0:
+                logger.debug(f"Rate limiting: sleeping for {delay:.2f}s")
+                time.sleep(delay)
+            self._next_allowed = max(now, self._next_allowed) + self.config.request_delay
+
     def get(
         self,
         url: str,
@@ -49,6 +176,11 @@ class HTTPSession:
     ) -> requests.Response:
         """Make a GET request with retry logic.
 
+        Connection errors, timeouts, 429 and 5xx responses are retried up to
+        ``retry_attempts`` times with jittered exponential backoff starting at
+        ``retry_backoff`` (or the server's Retry-After); other HTTP errors
+        fail immediately.
+
         Args:
             url: URL to request
             params: Query parameters
@@ -60,11 +192,23 @@ class HTTPSession:
         Raises:
             APIError: If request fails after retries
         """
+        return self._retrying.copy()(self._get, url, params, **kwargs)
+
+    def _get(
+        self,
+        url: str,
+        params: Optional[dict[str, Any]],
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Make a single GET attempt (see get())."""
         self._rate_limit()
 
-        logger.debug(f"GET {url}")
-        if params:
-            logger.debug(f"  params: {params}")
+        # Per-request debug output is skipped entirely at the default INFO level
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"GET {url}")
+            if params:
+                logger.debug(f"  params: {params}")
 
         try:
             response = self.session.get(
@@ -74,28 +218,31 @@ class HTTPSession:
                 **kwargs,
             )
             response.raise_for_status()
-            logger.debug(f"  → {response.status_code} OK ({len(response.content)} bytes)")
+            if debug:
+                if kwargs.get("stream"):
+                    # Reading .content here would drain the stream the caller wants
+                    logger.debug(f"  → {response.status_code} OK (streaming)")
+                else:
+                    logger.debug(f"  → {response.status_code} OK ({len(response.content)} bytes)")
             return response
         except requests.RequestException as e:
             logger.error(f"GET request failed: {url} - {e}")
-            raise APIError(f"GET request failed: {url}") from e
+            raise _to_api_error(f"GET request failed: {url}", e) from e
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
     def post(
         self,
         url: str,
-        data: Optional[dict[str, Any]] = None,
+        data: Optional[Union[dict[str, Any], str]] = None,
         **kwargs: Any,
     ) -> requests.Response:
         """Make a POST request with retry logic.
 
+        Retries follow the same transient-failure policy as get(). A 412
+        answering an If-None-Match header is returned rather than raised.
+
         Args:
             url: URL to request
-            data: POST data
+            data: POST data (form dict or pre-encoded body)
             **kwargs: Additional arguments for requests
 
         Returns:
@@ -104,12 +251,25 @@ class HTTPSession:
         Raises:
             APIError: If request fails after retries
         """
+        return self._retrying.copy()(self._post, url, data, **kwargs)
+
+    def _post(
+        self,
+        url: str,
+        data: Optional[Union[dict[str, Any], str]],
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Make a single POST attempt (see post())."""
         self._rate_limit()
 
-        logger.debug(f"POST {url}")
-        if data:
-            # Log data keys but not values (could contain sensitive info)
-            logger.debug(f"  data keys: {list(data.keys())}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"POST {url}")
+            if isinstance(data, dict):
+                # Log data keys but not values (could contain sensitive info)
+                logger.debug(f"  data keys: {list(data.keys())}")
+            elif data:
+                logger.debug(f"  body: {len(data)} bytes")
 
         try:
             response = self.session.post(
@@ -118,12 +278,36 @@ class HTTPSession:
                 timeout=self.config.request_timeout,
                 **kwargs,
             )
-            response.raise_for_status()
-            logger.debug(f"  → {response.status_code} OK ({len(response.content)} bytes)")
+            # A POST whose If-None-Match matched is answered 412 rather than
+            # 304 (RFC 9110); that is the outcome the caller asked about
+            headers = kwargs.get("headers") or {}
+            if response.status_code != 412 or "If-None-Match" not in headers:
+                response.raise_for_status()
+            if debug:
+                logger.debug(f"  → {response.status_code} OK ({len(response.content)} bytes)")
             return response
         except requests.RequestException as e:
             logger.error(f"POST request failed: {url} - {e}")
-            raise APIError(f"POST request failed: {url}") from e
+            raise _to_api_error(f"POST request failed: {url}", e) from e
+
+    def retry_read(self, read: Callable[..., T], *args: Any) -> T:
+        """Call read() again when the streamed body it consumes is cut off.
+
+        read() must make its own request and be safe to repeat. Only
+        StreamInterruptedError is retried here; failures of the request
+        itself were already retried by get().
+
+        Args:
+            read: Function that requests and fully consumes a streamed response
+            *args: Arguments for read
+
+        Returns:
+            Whatever read returns
+
+        Raises:
+            StreamInterruptedError: If the body is still cut off after retries
+        """
+        return self._read_retrying.copy()(read, *args)
 
     def set_cookies(self, cookies: dict[str, str]) -> None:
         """Set cookies on the session.
@@ -1,7 +1,8 @@
 """Exporters for LiveJournal data."""
 
 from yalje.exporters.json_exporter import JSONExporter
+from yalje.exporters.jsonl_exporter import JSONLExporter
 from yalje.exporters.xml_exporter import XMLExporter
 from yalje.exporters.yaml_exporter import YAMLExporter
 
-__all__ = ["JSONExporter", "XMLExporter", "YAMLExporter"]
+__all__ = ["JSONExporter", "JSONLExporter", "XMLExporter", "YAMLExporter"]
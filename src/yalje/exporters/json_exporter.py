@@ -1,10 +1,17 @@
 """JSON exporter for LiveJournal data."""
 
+import io
 import json
+from collections.abc import Sequence
 from pathlib import Path
+from typing import IO, Optional
+
+from pydantic import BaseModel
 
 from yalje.core.exceptions import ExportError
 from yalje.models.export import LJExport
+from yalje.utils.files import atomic_write
+from yalje.utils.serialization import orjson
 
 
 class JSONExporter:
@@ -25,12 +32,9 @@ class JSONExporter:
             # Update metadata counts
             data.update_counts()
 
-            # Convert to dict
-            data_dict = data.model_dump(mode="python")
-
             # Write to file
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data_dict, f, indent=indent, ensure_ascii=False)
+            with atomic_write(output_path) as f:
+                self._write(data, f, indent)
 
         except Exception as e:
             raise ExportError(f"Failed to export to JSON: {e}") from e
@@ -52,15 +56,69 @@ class JSONExporter:
             # Update metadata counts
             data.update_counts()
 
-            # Convert to dict
-            data_dict = data.model_dump(mode="python")
-
             # Serialize to JSON
-            return json.dumps(data_dict, indent=indent, ensure_ascii=False)
+            buffer = io.StringIO()
+            self._write(data, buffer, indent)
+            return buffer.getvalue()
 
         except Exception as e:
             raise ExportError(f"Failed to export to JSON string: {e}") from e
 
+    @staticmethod
+    def _write(data: LJExport, stream: IO[str], indent: Optional[int]) -> None:
+        """Write the export as JSON one record at a time.
+
+        Produces the same text as json.dump() of the whole model_dump(), but
+        only one record is serialized at a time instead of the entire tree.
+
+        Args:
+            data: LJExport object containing all data
+            stream: Output text stream
+            indent: Indentation level for pretty-printing (None for compact)
+        """
+        if indent is None:
+            newline, pad, item_pad, separator = "", "", "", ", "
+        else:
+            newline, pad, item_pad, separator = "\n", " " * indent, " " * (2 * indent), ","
+
+        def dumps(model: BaseModel, depth_pad: str) -> str:
+            if indent is None:
+                # model_dump_json()'s compact form drops the spaces after
+                # separators that json.dumps() writes
+                return json.dumps(model.model_dump(mode="python"), ensure_ascii=False)
+            if orjson is not None and indent == 2:
+                encoded = orjson.dumps(model.model_dump(mode="python"), option=orjson.OPT_INDENT_2)
+                text = encoded.decode("utf-8")
+            else:
+                # pydantic-core serializes straight to JSON, skipping the dict
+                text = model.model_dump_json(indent=indent)
+            # Shift nested lines to the record's depth
+            return text.replace("\n", "\n" + depth_pad)
+
+        metadata = dumps(data.metadata, pad)
+        stream.write(f'{{{newline}{pad}"metadata": {metadata}')
+
+        sections: tuple[tuple[str, Sequence[BaseModel]], ...] = (
+            ("usermap", data.usermap),
+            ("posts", data.posts),
+            ("comments", data.comments),
+            ("inbox", data.inbox),
+        )
+        for key, records in sections:
+            stream.write(f'{separator}{newline}{pad}"{key}": ')
+            if not records:
+                stream.write("[]")
+                continue
+
+            stream.write(f"[{newline}{item_pad}")
+            for i, record in enumerate(records):
+                if i:
+                    stream.write(f"{separator}{newline}{item_pad}")
+                stream.write(dumps(record, item_pad))
+            stream.write(f"{newline}{pad}]")
+
+        stream.write(f"{newline}}}")
+
     @staticmethod
     def load(input_path: Path) -> LJExport:
         """Load data from JSON file.
@@ -0,0 +1,147 @@
+"""JSON Lines exporter for LiveJournal data."""
+
+import json
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import IO, Any, Optional
+
+from pydantic import BaseModel
+
+from yalje.core.exceptions import ExportError
+from yalje.models.comment import Comment
+from yalje.models.export import ExportMetadata, LJExport
+from yalje.models.inbox import InboxMessage
+from yalje.models.post import Post
+from yalje.models.user import User
+from yalje.utils.files import atomic_write
+from yalje.utils.serialization import orjson
+
+# Section name -> record model for JSONLExporter.iter_load()
+_SECTION_MODELS: dict[str, type[BaseModel]] = {
+    "metadata": ExportMetadata,
+    "usermap": User,
+    "posts": Post,
+    "comments": Comment,
+    "inbox": InboxMessage,
+}
+
+
+class JSONLExporter:
+    """Exports LiveJournal data to JSON Lines format.
+
+    Each line is one compact JSON object, {"section": ..., "record": {...}}:
+    the metadata first, then every user, post, comment and inbox message.
+    Records are encoded and decoded one at a time, so neither writing nor
+    reading ever holds the whole document.
+    """
+
+    def export(self, data: LJExport, output_path: Path) -> None:
+        """Export data to a JSON Lines file.
+
+        Args:
+            data: LJExport object containing all data
+            output_path: Path to write JSON Lines file
+
+        Raises:
+            ExportError: If export fails
+        """
+        try:
+            # Update metadata counts
+            data.update_counts()
+
+            # Write to file
+            with atomic_write(output_path, binary=True) as f:
+                self._write(data, f)
+
+        except Exception as e:
+            raise ExportError(f"Failed to export to JSON Lines: {e}") from e
+
+    @staticmethod
+    def _write(data: LJExport, stream: IO[bytes]) -> None:
+        """Write the export one record per line.
+
+        Args:
+            data: LJExport object containing all data
+            stream: Output binary stream
+        """
+        sections: tuple[tuple[str, Sequence[BaseModel]], ...] = (
+            ("metadata", (data.metadata,)),
+            ("usermap", data.usermap),
+            ("posts", data.posts),
+            ("comments", data.comments),
+            ("inbox", data.inbox),
+        )
+        for section, records in sections:
+            if orjson is not None:
+                for record in records:
+                    stream.write(
+                        orjson.dumps(
+                            {"section": section, "record": record.model_dump(mode="python")},
+                            option=orjson.OPT_APPEND_NEWLINE,
+                        )
+                    )
+            else:
+                # pydantic-core writes the same compact UTF-8 JSON as orjson
+                prefix = f'{{"section":"{section}","record":'.encode()
+                for record in records:
+                    stream.write(prefix + record.model_dump_json().encode("utf-8") + b"}\n")
+
+    @staticmethod
+    def load(input_path: Path) -> LJExport:
+        """Load data from a JSON Lines file.
+
+        Args:
+            input_path: Path to JSON Lines file
+
+        Returns:
+            LJExport object
+
+        Raises:
+            ExportError: If load fails
+        """
+        metadata: Optional[ExportMetadata] = None
+        sections: dict[str, list[Any]] = {"usermap": [], "posts": [], "comments": [], "inbox": []}
+
+        for section, record in JSONLExporter.iter_load(input_path):
+            if isinstance(record, ExportMetadata):
+                metadata = record
+            else:
+                sections[section].append(record)
+
+        if metadata is None:
+            raise ExportError("Failed to load from JSON Lines: Missing metadata record")
+
+        # Every record was validated as it was read
+        return LJExport.model_construct(
+            metadata=metadata,
+            usermap=sections["usermap"],
+            posts=sections["posts"],
+            comments=sections["comments"],
+            inbox=sections["inbox"],
+        )
+
+    @staticmethod
+    def iter_load(input_path: Path) -> Iterator[tuple[str, BaseModel]]:
+        """Read a JSON Lines export one record at a time.
+
+        Args:
+            input_path: Path to JSON Lines file
+
+        Yields:
+            (section, model) pairs in file order, where section is one of
+            "metadata", "usermap", "posts", "comments" or "inbox"
+
+        Raises:
+            ExportError: If a line cannot be decoded or validated
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+        try:
+            with open(input_path, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    item = loads(line)
+                    section = item["section"]
+                    yield section, _SECTION_MODELS[section].model_validate(item["record"])
+        except Exception as e:
+            raise ExportError(f"Failed to load from JSON Lines: {e}") from e
@@ -1,15 +1,119 @@
 """XML exporter for LiveJournal data."""
 
-import xml.etree.ElementTree as ET
+import io
+import re
+import sys
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
-from typing import Optional, overload
+from typing import IO, Any, Callable, Optional, TypeVar, Union
+
+from lxml import etree
+from pydantic import BaseModel
 
 from yalje.core.exceptions import ExportError
 from yalje.models.comment import Comment
-from yalje.models.export import LJExport
+from yalje.models.export import ExportMetadata, LJExport
 from yalje.models.inbox import InboxMessage
 from yalje.models.post import Post
-from yalje.models.user import User
+from yalje.models.user import InboxSender, User
+from yalje.utils.files import atomic_write
+
+_XML_DECLARATION = b'<?xml version="1.0" encoding="UTF-8"?>\n'
+
+RecordT = TypeVar("RecordT", bound=BaseModel)
+
+# Characters XML 1.0 cannot represent (control characters, surrogates, U+FFFE/F)
+_INVALID_XML_CHARS = re.compile("[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]")
+
+
+def _xml_text(text: str) -> str:
+    """Drop characters that cannot appear in an XML document.
+
+    lxml refuses to store them (ElementTree wrote them out, producing a file
+    that could not be loaded back).
+
+    Args:
+        text: Element text
+
+    Returns:
+        Text safe to assign to an element
+    """
+    return _INVALID_XML_CHARS.sub("", text)
+
+
+def _build(model: type[RecordT], validate: bool, **fields: Any) -> RecordT:
+    """Create a model from already-converted field values.
+
+    Args:
+        model: Model class
+        validate: Run pydantic validation, else use model_construct()
+        **fields: Field values
+
+    Returns:
+        Model instance
+    """
+    return model(**fields) if validate else model.model_construct(**fields)
+
+
+def _children_text(elem: etree._Element) -> dict[str, str]:
+    """Collect a record's child elements in one pass.
+
+    Args:
+        elem: Record element
+
+    Returns:
+        Child tag -> text for every child with non-empty text, so a missing
+        or empty child falls back to the caller's .get() default
+    """
+    return {child.tag: child.text for child in elem if child.text}
+
+
+def _cdata(text: Optional[str]) -> "Union[str, etree.CDATA, None]":
+    """Wrap element text in a CDATA section where possible.
+
+    Args:
+        text: Element text
+
+    Returns:
+        CDATA content, or the plain text if it contains the "]]>" terminator
+        (a CDATA section cannot), or None
+    """
+    if text is None:
+        return None
+    text = _xml_text(text)
+    return etree.CDATA(text) if "]]>" not in text else text
+
+
+def _add_children(
+    parent: etree._Element, fields: "Iterable[tuple[str, Union[str, etree.CDATA, None]]]"
+) -> None:
+    """Append one child element per (tag, text) pair, in order.
+
+    Children are always created; None leaves the element empty.
+
+    Args:
+        parent: Element to append to
+        fields: Tag names with their text (plain str or CDATA from _cdata())
+    """
+    for tag, text in fields:
+        child = etree.SubElement(parent, tag)
+        if text is not None:
+            child.text = _xml_text(text) if isinstance(text, str) else text
+
+
+def _intern(text: Optional[str]) -> Optional[str]:
+    """Intern a frequently repeated value (usernames, states) when present.
+
+    A loaded export then holds one copy of each distinct value instead of
+    one per record.
+
+    Args:
+        text: Element text
+
+    Returns:
+        The interned string, or None
+    """
+    return sys.intern(text) if text is not None else None
 
 
 class XMLExporter:
@@ -18,6 +122,9 @@ class XMLExporter:
     def export(self, data: LJExport, output_path: Path) -> None:
         """Export data to XML file.
 
+        Records are serialized one at a time with lxml's incremental writer,
+        so the whole document tree is never built in memory.
+
         Args:
             data: LJExport object containing all data
             output_path: Path to write XML file
@@ -29,12 +136,9 @@ class XMLExporter:
             # Update metadata counts
             data.update_counts()
 
-            # Generate XML string
-            xml_string = self.export_string(data)
-
             # Write to file
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(xml_string)
+            with atomic_write(output_path, binary=True) as f:
+                self._write(data, f)
 
         except Exception as e:
             raise ExportError(f"Failed to export to XML: {e}") from e
@@ -55,37 +159,71 @@ class XMLExporter:
             # Update metadata counts
             data.update_counts()
 
-            # Create root element
-            root = ET.Element("lj_export")
+            buffer = io.BytesIO()
+            self._write(data, buffer)
+            return buffer.getvalue().decode("utf-8")
 
-            # Add metadata
-            self._add_metadata(root, data)
-
-            # Add usermap
-            self._add_usermap(root, data.usermap)
+        except Exception as e:
+            raise ExportError(f"Failed to export to XML string: {e}") from e
 
-            # Add posts
-            self._add_posts(root, data.posts)
+    def _write(self, data: LJExport, stream: IO[bytes]) -> None:
+        """Write the export as pretty-printed XML one record at a time.
 
-            # Add comments
-            self._add_comments(root, data.comments)
+        Each record is built as a small detached element, indented for its
+        depth and written out, giving the same text as pretty-printing the
+        whole document.
 
-            # Add inbox
-            self._add_inbox(root, data.inbox)
+        Args:
+            data: LJExport object containing all data
+            stream: Binary output stream
+        """
+        stream.write(_XML_DECLARATION)
+        with etree.xmlfile(stream, encoding="utf-8") as xf:
+            with xf.element("lj_export"):
+                metadata_elem = self._metadata_element(data.metadata)
+                etree.indent(metadata_elem, space="  ", level=1)
+                xf.write("\n  ", metadata_elem)
+                self._write_section(xf, "usermap", data.usermap, self._user_element)
+                self._write_section(xf, "posts", data.posts, self._post_element)
+                self._write_section(xf, "comments", data.comments, self._comment_element)
+                self._write_section(xf, "inbox", data.inbox, self._message_element)
+                xf.write("\n")
+        stream.write(b"\n")
 
-            # Convert to string with XML declaration
-            xml_string = self._prettify(root)
-            return xml_string
+    @staticmethod
+    def _write_section(
+        xf: Any,
+        tag: str,
+        records: Sequence[RecordT],
+        build: Callable[[RecordT], etree._Element],
+    ) -> None:
+        """Write one top-level section, building each record's element in turn.
 
-        except Exception as e:
-            raise ExportError(f"Failed to export to XML string: {e}") from e
+        Args:
+            xf: Open lxml xmlfile writer
+            tag: Section element name
+            records: Models to write
+            build: Function turning a model into its element
+        """
+        xf.write("\n  ")
+        if not records:
+            xf.write(etree.Element(tag))
+            return
+
+        with xf.element(tag):
+            for record in records:
+                elem = build(record)
+                etree.indent(elem, space="  ", level=2)
+                xf.write("\n    ", elem)
+            xf.write("\n  ")
 
     @staticmethod
-    def load(input_path: Path) -> LJExport:
+    def load(input_path: Path, validate: bool = False) -> LJExport:
         """Load data from XML file.
 
         Args:
             input_path: Path to XML file
+            validate: Run pydantic validation on every record (see iter_load())
 
         Returns:
             LJExport object
@@ -93,302 +231,293 @@ class XMLExporter:
         Raises:
             ExportError: If load fails
         """
-        try:
-            tree = ET.parse(input_path)
-            root = tree.getroot()
-
-            # Parse metadata
-            metadata_dict = XMLExporter._parse_metadata(root)
+        metadata: Optional[ExportMetadata] = None
+        sections: dict[str, list[Any]] = {"usermap": [], "posts": [], "comments": [], "inbox": []}
+
+        for section, record in XMLExporter.iter_load(input_path, validate):
+            if isinstance(record, ExportMetadata):
+                metadata = record
+            else:
+                sections[section].append(record)
+
+        if metadata is None:
+            raise ExportError("Failed to load from XML: Missing metadata section")
+
+        # Records were built (and, if requested, validated) as they were parsed
+        return LJExport.model_construct(
+            metadata=metadata,
+            usermap=sections["usermap"],
+            posts=sections["posts"],
+            comments=sections["comments"],
+            inbox=sections["inbox"],
+        )
 
-            # Parse usermap
-            usermap = XMLExporter._parse_usermap(root)
+    @staticmethod
+    def iter_load(input_path: Path, validate: bool = False) -> Iterator[tuple[str, BaseModel]]:
+        """Parse an XML export one record at a time.
 
-            # Parse posts
-            posts = XMLExporter._parse_posts(root)
+        The file is read with iterparse, and each record's subtree (and the
+        siblings already consumed) is discarded once it has been turned into
+        a model, so memory stays flat however large the export is.
 
-            # Parse comments
-            comments = XMLExporter._parse_comments(root)
+        The parsers already convert every field to its model type, so by
+        default models are created with model_construct() and pydantic's
+        validators (such as Post's security check) are skipped.
 
-            # Parse inbox
-            inbox = XMLExporter._parse_inbox(root)
+        Args:
+            input_path: Path to XML file
+            validate: Run pydantic validation on every record
 
-            # Create LJExport object
-            from yalje.models.export import ExportMetadata
+        Yields:
+            (section, model) pairs in document order, where section is one of
+            "metadata", "usermap", "posts", "comments" or "inbox"
 
-            metadata = ExportMetadata(**metadata_dict)
-            return LJExport(
-                metadata=metadata,
-                usermap=usermap,
-                posts=posts,
-                comments=comments,
-                inbox=inbox,
+        Raises:
+            ExportError: If the file cannot be parsed
+        """
+        try:
+            context = etree.iterparse(
+                str(input_path),
+                events=("end",),
+                tag=tuple(_RECORD_PARSERS),
+                # Exports never use DTDs or entities; refusing them keeps a
+                # crafted file from expanding entities or fetching anything
+                resolve_entities=False,
+                load_dtd=False,
+                no_network=True,
+                # Skip the indentation whitespace the exporter writes
+                remove_blank_text=True,
+                huge_tree=True,
+                collect_ids=False,
             )
-
+            for _event, elem in context:
+                section, parse = _RECORD_PARSERS[elem.tag]
+                yield section, parse(elem, validate)
+
+                # Free the finished record and everything before it
+                elem.clear(keep_tail=True)
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
         except Exception as e:
             raise ExportError(f"Failed to load from XML: {e}") from e
 
-    def _add_metadata(self, root: ET.Element, data: LJExport) -> None:
-        """Add metadata section to XML."""
-        metadata = ET.SubElement(root, "metadata")
-        self._add_text_element(metadata, "export_date", data.metadata.export_date)
-        self._add_text_element(metadata, "lj_user", data.metadata.lj_user)
-        self._add_text_element(metadata, "yalje_version", data.metadata.yalje_version)
-        self._add_text_element(metadata, "post_count", str(data.metadata.post_count))
-        self._add_text_element(metadata, "comment_count", str(data.metadata.comment_count))
-        self._add_text_element(metadata, "inbox_count", str(data.metadata.inbox_count))
-
-    def _add_usermap(self, root: ET.Element, usermap: list[User]) -> None:
-        """Add usermap section to XML."""
-        usermap_elem = ET.SubElement(root, "usermap")
-        for user in usermap:
-            user_elem = ET.SubElement(usermap_elem, "user")
-            user_elem.set("userid", str(user.userid))
-            user_elem.set("username", user.username)
-
-    def _add_posts(self, root: ET.Element, posts: list[Post]) -> None:
-        """Add posts section to XML."""
-        posts_elem = ET.SubElement(root, "posts")
-        for post in posts:
-            post_elem = ET.SubElement(posts_elem, "post")
-            self._add_text_element(post_elem, "itemid", str(post.itemid))
-            self._add_text_element(
-                post_elem, "jitemid", str(post.jitemid) if post.jitemid else None
-            )
-            self._add_text_element(post_elem, "eventtime", post.eventtime)
-            self._add_text_element(post_elem, "logtime", post.logtime)
-            self._add_text_element(post_elem, "subject", post.subject)
-            self._add_cdata_element(post_elem, "event", post.event)
-            self._add_text_element(post_elem, "security", post.security)
-            self._add_text_element(post_elem, "allowmask", str(post.allowmask))
-            self._add_text_element(post_elem, "current_mood", post.current_mood)
-            self._add_text_element(post_elem, "current_music", post.current_music)
-
-    def _add_comments(self, root: ET.Element, comments: list[Comment]) -> None:
-        """Add comments section to XML."""
-        comments_elem = ET.SubElement(root, "comments")
-        for comment in comments:
-            comment_elem = ET.SubElement(comments_elem, "comment")
-            self._add_text_element(comment_elem, "id", str(comment.id))
-            self._add_text_element(comment_elem, "jitemid", str(comment.jitemid))
-            self._add_text_element(
-                comment_elem, "posterid", str(comment.posterid) if comment.posterid else None
-            )
-            self._add_text_element(comment_elem, "poster_username", comment.poster_username)
-            self._add_text_element(
-                comment_elem, "parentid", str(comment.parentid) if comment.parentid else None
-            )
-            self._add_text_element(comment_elem, "date", comment.date)
-            self._add_text_element(comment_elem, "subject", comment.subject)
-            self._add_cdata_element(comment_elem, "body", comment.body)
-            self._add_text_element(comment_elem, "state", comment.state)
-
-    def _add_inbox(self, root: ET.Element, inbox: list[InboxMessage]) -> None:
-        """Add inbox section to XML."""
-        inbox_elem = ET.SubElement(root, "inbox")
-        for message in inbox:
-            message_elem = ET.SubElement(inbox_elem, "message")
-            self._add_text_element(message_elem, "qid", str(message.qid))
-            self._add_text_element(
-                message_elem, "msgid", str(message.msgid) if message.msgid else None
-            )
-            self._add_text_element(message_elem, "type", message.type)
-
-            # Add sender if present
-            if message.sender:
-                sender_elem = ET.SubElement(message_elem, "sender")
-                self._add_text_element(sender_elem, "username", message.sender.username)
-                self._add_text_element(sender_elem, "display_name", message.sender.display_name)
-                self._add_text_element(sender_elem, "profile_url", message.sender.profile_url)
-                self._add_text_element(sender_elem, "userpic_url", message.sender.userpic_url)
-                self._add_text_element(
-                    sender_elem, "verified", str(message.sender.verified).lower()
-                )
-
-            self._add_text_element(message_elem, "title", message.title)
-            self._add_cdata_element(message_elem, "body", message.body)
-            self._add_text_element(message_elem, "timestamp_relative", message.timestamp_relative)
-            self._add_text_element(message_elem, "timestamp_absolute", message.timestamp_absolute)
-            self._add_text_element(message_elem, "read", str(message.read).lower())
-            self._add_text_element(message_elem, "bookmarked", str(message.bookmarked).lower())
-
-    def _add_text_element(self, parent: ET.Element, tag: str, text: Optional[str]) -> None:
-        """Add a text element to parent, handling None values."""
-        elem = ET.SubElement(parent, tag)
-        if text is not None:
-            elem.text = text
-
-    def _add_cdata_element(self, parent: ET.Element, tag: str, text: Optional[str]) -> None:
-        """Add an element with CDATA content."""
-        elem = ET.SubElement(parent, tag)
-        if text is not None:
-            # ElementTree doesn't support CDATA directly, so we'll use regular text
-            # but escape special characters properly
-            elem.text = text
-
-    def _prettify(self, elem: ET.Element) -> str:
-        """Return a pretty-printed XML string."""
-        # Add indentation
-        self._indent(elem)
-
-        # Convert to string with XML declaration
-        xml_str = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        xml_str += ET.tostring(elem, encoding="unicode")
-        return xml_str
-
-    def _indent(self, elem: ET.Element, level: int = 0) -> None:
-        """Add indentation to XML elements for pretty printing."""
-        indent = "\n" + "  " * level
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = indent + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = indent
-            for child in elem:
-                self._indent(child, level + 1)
-            if not child.tail or not child.tail.strip():
-                child.tail = indent
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = indent
-
     @staticmethod
-    def _parse_metadata(root: ET.Element) -> dict:
-        """Parse metadata section from XML."""
-        metadata_elem = root.find("metadata")
-        if metadata_elem is None:
-            raise ValueError("Missing metadata section")
-
-        return {
-            "export_date": XMLExporter._get_text(metadata_elem, "export_date"),
-            "lj_user": XMLExporter._get_text(metadata_elem, "lj_user"),
-            "yalje_version": XMLExporter._get_text(metadata_elem, "yalje_version"),
-            "post_count": int(XMLExporter._get_text(metadata_elem, "post_count", "0")),
-            "comment_count": int(XMLExporter._get_text(metadata_elem, "comment_count", "0")),
-            "inbox_count": int(XMLExporter._get_text(metadata_elem, "inbox_count", "0")),
-        }
+    def _metadata_element(metadata: ExportMetadata) -> etree._Element:
+        """Build the <metadata> element."""
+        metadata_elem = etree.Element("metadata")
+        _add_children(
+            metadata_elem,
+            (
+                ("export_date", metadata.export_date),
+                ("lj_user", metadata.lj_user),
+                ("yalje_version", metadata.yalje_version),
+                ("post_count", str(metadata.post_count)),
+                ("comment_count", str(metadata.comment_count)),
+                ("inbox_count", str(metadata.inbox_count)),
+            ),
+        )
+        return metadata_elem
 
     @staticmethod
-    def _parse_usermap(root: ET.Element) -> list[User]:
-        """Parse usermap section from XML."""
-        usermap_elem = root.find("usermap")
-        if usermap_elem is None:
-            return []
-
-        usermap = []
-        for user_elem in usermap_elem.findall("user"):
-            userid = int(user_elem.get("userid", "0"))
-            username = user_elem.get("username", "")
-            usermap.append(User(userid=userid, username=username))
-
-        return usermap
+    def _user_element(user: User) -> etree._Element:
+        """Build a usermap <user> element."""
+        user_elem = etree.Element("user")
+        user_elem.set("userid", str(user.userid))
+        user_elem.set("username", _xml_text(user.username))
+        return user_elem
 
     @staticmethod
-    def _parse_posts(root: ET.Element) -> list[Post]:
-        """Parse posts section from XML."""
-        posts_elem = root.find("posts")
-        if posts_elem is None:
-            return []
-
-        posts = []
-        for post_elem in posts_elem.findall("post"):
-            jitemid_str = XMLExporter._get_text(post_elem, "jitemid")
-
-            post = Post(
-                itemid=int(XMLExporter._get_text(post_elem, "itemid", "0")),
-                jitemid=int(jitemid_str) if jitemid_str and jitemid_str != "None" else None,
-                eventtime=XMLExporter._get_text(post_elem, "eventtime", ""),
-                logtime=XMLExporter._get_text(post_elem, "logtime", ""),
-                subject=XMLExporter._get_text(post_elem, "subject"),
-                event=XMLExporter._get_text(post_elem, "event", ""),
-                security=XMLExporter._get_text(post_elem, "security", "public"),
-                allowmask=int(XMLExporter._get_text(post_elem, "allowmask", "0")),
-                current_mood=XMLExporter._get_text(post_elem, "current_mood"),
-                current_music=XMLExporter._get_text(post_elem, "current_music"),
-            )
-            posts.append(post)
+    def _post_element(post: Post) -> etree._Element:
+        """Build a <post> element."""
+        post_elem = etree.Element("post")
+        _add_children(
+            post_elem,
+            (
+                ("itemid", str(post.itemid)),
+                ("jitemid", str(post.jitemid) if post.jitemid else None),
+                ("eventtime", post.eventtime),
+                ("logtime", post.logtime),
+                ("subject", post.subject),
+                ("event", _cdata(post.event)),
+                ("security", post.security),
+                ("allowmask", str(post.allowmask)),
+                ("current_mood", post.current_mood),
+                ("current_music", post.current_music),
+            ),
+        )
+        return post_elem
 
-        return posts
+    @staticmethod
+    def _comment_element(comment: Comment) -> etree._Element:
+        """Build a <comment> element."""
+        comment_elem = etree.Element("comment")
+        _add_children(
+            comment_elem,
+            (
+                ("id", str(comment.id)),
+                ("jitemid", str(comment.jitemid)),
+                ("posterid", str(comment.posterid) if comment.posterid else None),
+                ("poster_username", comment.poster_username),
+                ("parentid", str(comment.parentid) if comment.parentid else None),
+                ("date", comment.date),
+                ("subject", comment.subject),
+                ("body", _cdata(comment.body)),
+                ("state", comment.state),
+            ),
+        )
+        return comment_elem
 
     @staticmethod
-    def _parse_comments(root: ET.Element) -> list[Comment]:
-        """Parse comments section from XML."""
-        comments_elem = root.find("comments")
-        if comments_elem is None:
-            return []
-
-        comments = []
-        for comment_elem in comments_elem.findall("comment"):
-            posterid_str = XMLExporter._get_text(comment_elem, "posterid")
-            parentid_str = XMLExporter._get_text(comment_elem, "parentid")
-
-            comment = Comment(
-                id=int(XMLExporter._get_text(comment_elem, "id", "0")),
-                jitemid=int(XMLExporter._get_text(comment_elem, "jitemid", "0")),
-                posterid=int(posterid_str) if posterid_str and posterid_str != "None" else None,
-                poster_username=XMLExporter._get_text(comment_elem, "poster_username"),
-                parentid=int(parentid_str) if parentid_str and parentid_str != "None" else None,
-                date=XMLExporter._get_text(comment_elem, "date", ""),
-                subject=XMLExporter._get_text(comment_elem, "subject"),
-                body=XMLExporter._get_text(comment_elem, "body"),
-                state=XMLExporter._get_text(comment_elem, "state"),
+    def _message_element(message: InboxMessage) -> etree._Element:
+        """Build an inbox <message> element."""
+        message_elem = etree.Element("message")
+        _add_children(
+            message_elem,
+            (
+                ("qid", str(message.qid)),
+                ("msgid", str(message.msgid) if message.msgid else None),
+                ("type", message.type),
+            ),
+        )
+
+        # Add sender if present
+        if message.sender:
+            sender = message.sender
+            _add_children(
+                etree.SubElement(message_elem, "sender"),
+                (
+                    ("username", sender.username),
+                    ("display_name", sender.display_name),
+                    ("profile_url", sender.profile_url),
+                    ("userpic_url", sender.userpic_url),
+                    ("verified", "true" if sender.verified else "false"),
+                ),
             )
-            comments.append(comment)
 
-        return comments
+        _add_children(
+            message_elem,
+            (
+                ("title", message.title),
+                ("body", _cdata(message.body)),
+                ("timestamp_relative", message.timestamp_relative),
+                ("timestamp_absolute", message.timestamp_absolute),
+                ("read", "true" if message.read else "false"),
+                ("bookmarked", "true" if message.bookmarked else "false"),
+            ),
+        )
+        return message_elem
 
     @staticmethod
-    def _parse_inbox(root: ET.Element) -> list[InboxMessage]:
-        """Parse inbox section from XML."""
-        inbox_elem = root.find("inbox")
-        if inbox_elem is None:
-            return []
-
-        inbox = []
-        for message_elem in inbox_elem.findall("message"):
-            msgid_str = XMLExporter._get_text(message_elem, "msgid")
-
-            # Parse sender if present
-            sender = None
-            sender_elem = message_elem.find("sender")
-            if sender_elem is not None:
-                from yalje.models.user import InboxSender
-
-                sender = InboxSender(
-                    username=XMLExporter._get_text(sender_elem, "username", ""),
-                    display_name=XMLExporter._get_text(sender_elem, "display_name", ""),
-                    profile_url=XMLExporter._get_text(sender_elem, "profile_url", ""),
-                    userpic_url=XMLExporter._get_text(sender_elem, "userpic_url"),
-                    verified=XMLExporter._get_text(sender_elem, "verified", "false") == "true",
-                )
-
-            message = InboxMessage(
-                qid=int(XMLExporter._get_text(message_elem, "qid", "0")),
-                msgid=int(msgid_str) if msgid_str and msgid_str != "None" else None,
-                type=XMLExporter._get_text(message_elem, "type", ""),
-                sender=sender,
-                title=XMLExporter._get_text(message_elem, "title", ""),
-                body=XMLExporter._get_text(message_elem, "body", ""),
-                timestamp_relative=XMLExporter._get_text(message_elem, "timestamp_relative", ""),
-                timestamp_absolute=XMLExporter._get_text(message_elem, "timestamp_absolute"),
-                read=XMLExporter._get_text(message_elem, "read", "false") == "true",
-                bookmarked=XMLExporter._get_text(message_elem, "bookmarked", "false") == "true",
-            )
-            inbox.append(message)
+    def _parse_metadata(metadata_elem: etree._Element, validate: bool) -> ExportMetadata:
+        """Parse the <metadata> element."""
+        fields = _children_text(metadata_elem)
+        return _build(
+            ExportMetadata,
+            validate,
+            export_date=fields.get("export_date"),
+            lj_user=fields.get("lj_user"),
+            yalje_version=fields.get("yalje_version"),
+            post_count=int(fields.get("post_count", "0")),
+            comment_count=int(fields.get("comment_count", "0")),
+            inbox_count=int(fields.get("inbox_count", "0")),
+        )
 
-        return inbox
+    @staticmethod
+    def _parse_user(user_elem: etree._Element, validate: bool) -> User:
+        """Parse a usermap <user> element."""
+        return _build(
+            User,
+            validate,
+            userid=int(user_elem.get("userid", "0")),
+            username=sys.intern(user_elem.get("username", "")),
+        )
 
-    @overload
     @staticmethod
-    def _get_text(element: ET.Element, tag: str, default: str) -> str: ...
+    def _parse_post(post_elem: etree._Element, validate: bool) -> Post:
+        """Parse a <post> element."""
+        fields = _children_text(post_elem)
+        jitemid_str = fields.get("jitemid")
+
+        return _build(
+            Post,
+            validate,
+            itemid=int(fields.get("itemid", "0")),
+            jitemid=int(jitemid_str) if jitemid_str and jitemid_str != "None" else None,
+            eventtime=fields.get("eventtime", ""),
+            logtime=fields.get("logtime", ""),
+            subject=fields.get("subject"),
+            event=fields.get("event", ""),
+            security=sys.intern(fields.get("security", "public")),
+            allowmask=int(fields.get("allowmask", "0")),
+            current_mood=fields.get("current_mood"),
+            current_music=fields.get("current_music"),
+        )
 
-    @overload
     @staticmethod
-    def _get_text(element: ET.Element, tag: str, default: None = None) -> Optional[str]: ...
+    def _parse_comment(comment_elem: etree._Element, validate: bool) -> Comment:
+        """Parse a <comment> element."""
+        fields = _children_text(comment_elem)
+        posterid_str = fields.get("posterid")
+        parentid_str = fields.get("parentid")
+
+        return _build(
+            Comment,
+            validate,
+            id=int(fields.get("id", "0")),
+            jitemid=int(fields.get("jitemid", "0")),
+            posterid=int(posterid_str) if posterid_str and posterid_str != "None" else None,
+            poster_username=_intern(fields.get("poster_username")),
+            parentid=int(parentid_str) if parentid_str and parentid_str != "None" else None,
+            date=fields.get("date", ""),
+            subject=fields.get("subject"),
+            body=fields.get("body"),
+            state=_intern(fields.get("state")),
+        )
 
     @staticmethod
-    def _get_text(element: ET.Element, tag: str, default: Optional[str] = None) -> Optional[str]:
-        """Get text content from child element."""
-        child = element.find(tag)
-        if child is not None and child.text:
-            return child.text
-        return default
+    def _parse_message(message_elem: etree._Element, validate: bool) -> InboxMessage:
+        """Parse an inbox <message> element."""
+        fields = _children_text(message_elem)
+        msgid_str = fields.get("msgid")
+
+        # Parse sender if present
+        sender = None
+        sender_elem = message_elem.find("sender")
+        if sender_elem is not None:
+            sender_fields = _children_text(sender_elem)
+            sender = _build(
+                InboxSender,
+                validate,
+                username=sys.intern(sender_fields.get("username", "")),
+                display_name=sender_fields.get("display_name", ""),
+                profile_url=sender_fields.get("profile_url", ""),
+                userpic_url=sender_fields.get("userpic_url"),
+                verified=sender_fields.get("verified", "false") == "true",
+            )
+
+        return _build(
+            InboxMessage,
+            validate,
+            qid=int(fields.get("qid", "0")),
+            msgid=int(msgid_str) if msgid_str and msgid_str != "None" else None,
+            type=sys.intern(fields.get("type", "")),
+            sender=sender,
+            title=fields.get("title", ""),
+            body=fields.get("body", ""),
+            timestamp_relative=fields.get("timestamp_relative", ""),
+            timestamp_absolute=fields.get("timestamp_absolute"),
+            read=fields.get("read", "false") == "true",
+            bookmarked=fields.get("bookmarked", "false") == "true",
+        )
+
+
+# Record element tag -> (section name, parser) for XMLExporter.iter_load()
+_RECORD_PARSERS: dict[str, tuple[str, Callable[[etree._Element, bool], BaseModel]]] = {
+    "metadata": ("metadata", XMLExporter._parse_metadata),
+    "user": ("usermap", XMLExporter._parse_user),
+    "post": ("posts", XMLExporter._parse_post),
+    "comment": ("comments", XMLExporter._parse_comment),
+    "message": ("inbox", XMLExporter._parse_message),
+}
@@ -1,9 +1,28 @@
 """YAML exporter for LiveJournal data."""
 
+from collections.abc import Iterable
 from pathlib import Path
+from typing import IO, Any
+
+from pydantic import BaseModel
 
 from yalje.core.exceptions import ExportError
-from yalje.models.export import LJExport
+from yalje.models.comment import Comment
+from yalje.models.export import ExportMetadata, LJExport
+from yalje.models.inbox import InboxMessage
+from yalje.models.post import Post
+from yalje.models.user import User
+from yalje.utils.files import atomic_write
+from yalje.utils.serialization import YamlDumper, yaml
+
+# Same formatting as LJExport.to_yaml(), so streamed and in-memory output match
+_DUMP_OPTIONS: dict[str, Any] = {
+    "Dumper": YamlDumper,
+    "allow_unicode": True,
+    "default_flow_style": False,
+    "sort_keys": False,
+    "width": 100,
+}
 
 
 class YAMLExporter:
@@ -23,12 +42,86 @@ class YAMLExporter:
             # Update metadata counts
             data.update_counts()
 
-            # Write to file using model's to_file method
-            data.to_file(str(output_path))
+            # Dump record by record rather than building one dict of the
+            # whole export; the text matches LJExport.to_yaml()
+            with atomic_write(output_path) as f:
+                yaml.dump({"metadata": data.metadata.model_dump(mode="python")}, f, **_DUMP_OPTIONS)
+                self._write_section(f, "usermap", data.usermap)
+                self._write_section(f, "posts", data.posts)
+                self._write_section(f, "comments", data.comments)
+                self._write_section(f, "inbox", data.inbox)
+
+        except Exception as e:
+            raise ExportError(f"Failed to export to YAML: {e}") from e
+
+    def export_stream(
+        self,
+        output_path: Path,
+        metadata: ExportMetadata,
+        posts: Iterable[Post],
+        comments: Iterable[Comment],
+        usermap: Iterable[User],
+        inbox: Iterable[InboxMessage],
+    ) -> None:
+        """Export data to a YAML file one record at a time.
+
+        Each section is written as its iterable is consumed, so only one
+        record needs to be in memory at a time. Sections are written in the
+        order posts, comments, usermap, inbox; usermap is read after comments
+        so it may be filled while the comments are downloaded. Metadata goes
+        last, once the counts are known. The result loads with load().
+
+        The file is written under a temporary name and moved into place only
+        once every section has been written.
+
+        Args:
+            output_path: Path to write YAML file
+            metadata: Export metadata (counts are filled in)
+            posts: Posts to write
+            comments: Comments to write
+            usermap: Users to write
+            inbox: Inbox messages to write
+
+        Raises:
+            ExportError: If export fails
+        """
+        # A download that fails part-way never replaces an earlier complete backup
+        try:
+            with atomic_write(output_path) as f:
+                metadata.post_count = self._write_section(f, "posts", posts)
+                metadata.comment_count = self._write_section(f, "comments", comments)
+                self._write_section(f, "usermap", usermap)
+                metadata.inbox_count = self._write_section(f, "inbox", inbox)
+                yaml.dump({"metadata": metadata.model_dump(mode="python")}, f, **_DUMP_OPTIONS)
 
         except Exception as e:
             raise ExportError(f"Failed to export to YAML: {e}") from e
 
+    @staticmethod
+    def _write_section(stream: IO[str], key: str, records: Iterable[BaseModel]) -> int:
+        """Write one top-level sequence, dumping each record as it arrives.
+
+        Args:
+            stream: Output text stream
+            key: Top-level key for the section
+            records: Models to write
+
+        Returns:
+            Number of records written
+        """
+        count = 0
+        for record in records:
+            if count == 0:
+                stream.write(f"{key}:\n")
+            # A one-item list dumps as "- ..." at column 0, which is how
+            # PyYAML lays out a sequence nested under a mapping key
+            yaml.dump([record.model_dump(mode="python")], stream, **_DUMP_OPTIONS)
+            count += 1
+
+        if count == 0:
+            stream.write(f"{key}: []\n")
+        return count
+
     def export_string(self, data: LJExport) -> str:
         """Export data to YAML string.
 
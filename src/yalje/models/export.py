@@ -1,6 +1,7 @@
 """Top-level export model containing all LiveJournal data."""
 
 from datetime import datetime, timezone
+from typing import IO, Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -45,18 +46,33 @@ class LJExport(BaseModel):
         Returns:
             YAML string representation of the entire export
         """
-        import yaml
+        yaml_str: str = self._dump_yaml()
+        return yaml_str
 
-        # Convert to dict using pydantic's model_dump
-        data = self.model_dump(mode="python", exclude_none=False)
+    def _dump_yaml(self, stream: Optional[IO[bytes]] = None) -> Any:
+        """
+        Serialize the export to YAML, optionally straight into a stream.
+
+        Args:
+            stream: Binary stream to write UTF-8 YAML to, or None to return a str
+
+        Returns:
+            YAML string if no stream was given, else None
+        """
+        from yalje.utils.serialization import YamlDumper, yaml
+
+        data = self._fast_dump()
 
         # Serialize to YAML with nice formatting
         return yaml.dump(
             data,
+            stream,
+            Dumper=YamlDumper,
             allow_unicode=True,
             default_flow_style=False,
             sort_keys=False,
             width=100,
+            encoding="utf-8" if stream is not None else None,
         )
 
     @classmethod
@@ -70,9 +86,9 @@ class LJExport(BaseModel):
         Returns:
             LJExport instance
         """
-        import yaml
+        from yalje.utils.serialization import YamlLoader, yaml
 
-        data = yaml.safe_load(yaml_str)
+        data = yaml.load(yaml_str, Loader=YamlLoader)
         return cls(**data)
 
     @classmethod
@@ -86,8 +102,13 @@ class LJExport(BaseModel):
         Returns:
             LJExport instance
         """
-        with open(path, encoding="utf-8") as f:
-            return cls.from_yaml(f.read())
+        from yalje.utils.serialization import YamlLoader, yaml
+
+        # libyaml reads and decodes the file itself, so the whole document is
+        # never held as one Python string
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=YamlLoader)
+        return cls(**data)
 
     def to_file(self, path: str) -> None:
         """
@@ -96,8 +117,34 @@ class LJExport(BaseModel):
         Args:
             path: Path to write YAML file
         """
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(self.to_yaml())
+        # The dumper writes as it goes, so the YAML text is never held whole
+        with open(path, "wb") as f:
+            self._dump_yaml(f)
+
+    def _fast_dump(self) -> dict[str, Any]:
+        """
+        Build the same dict as model_dump(mode="python") for serialization.
+
+        Every record field is a plain str, int, bool or None (plus the
+        nested inbox sender), and pydantic keeps field values in __dict__ in
+        declaration order, so those dicts are used directly instead of going
+        through pydantic's generic serializer. They are only read.
+
+        Returns:
+            Export as nested dicts and lists
+        """
+        return {
+            "metadata": self.metadata.__dict__,
+            "usermap": [user.__dict__ for user in self.usermap],
+            "posts": [post.__dict__ for post in self.posts],
+            "comments": [comment.__dict__ for comment in self.comments],
+            "inbox": [
+                {**message.__dict__, "sender": message.sender.__dict__}
+                if message.sender is not None
+                else message.__dict__
+                for message in self.inbox
+            ],
+        }
 
     def update_counts(self) -> None:
         """Update metadata counts based on current data."""
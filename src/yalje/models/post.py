@@ -4,6 +4,9 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# Access levels LiveJournal reports for a post
+VALID_SECURITY_LEVELS = frozenset({"public", "private", "friends", "usemask", "custom"})
+
 
 class Post(BaseModel):
     """A LiveJournal blog post."""
@@ -27,9 +30,8 @@ class Post(BaseModel):
     @classmethod
     def validate_security(cls, v: str) -> str:
         """Validate security level."""
-        valid_levels = {"public", "private", "friends", "usemask", "custom"}
-        if v not in valid_levels:
-            raise ValueError(f"security must be one of {valid_levels}")
+        if v not in VALID_SECURITY_LEVELS:
+            raise ValueError(f"security must be one of {sorted(VALID_SECURITY_LEVELS)}")
         return v
 
     # Pydantic v2 configuration
@@ -1,9 +1,12 @@
 """HTML parser for LiveJournal inbox pages."""
 
 import re
-from typing import Optional
+import sys
+from functools import lru_cache
+from typing import Optional, Union
 
-from bs4 import BeautifulSoup, Tag
+import lxml.html
+from lxml import etree
 
 from yalje.core.exceptions import ParsingError
 from yalje.models.inbox import InboxMessage
@@ -12,27 +15,159 @@ from yalje.utils.logging import get_logger
 
 logger = get_logger("parsers.html")
 
+# Inbox page patterns, compiled once at import
+_RE_FROM_SUFFIX = re.compile(r"\s*from\s*$")
+_RE_MSGID = re.compile(r"msgid=(\d+)")
+_RE_PAGE = re.compile(r"Page\s+(\d+)\s+of\s+(\d+)")
+
+
+def _with_class(tag: str, css_class: str) -> str:
+    """Build an XPath expression selecting descendants that carry a CSS class.
+
+    Args:
+        tag: Element name
+        css_class: One class from the element's (space-separated) class list
+
+    Returns:
+        XPath expression, relative to the element it is evaluated on
+    """
+    return f'.//{tag}[contains(concat(" ", normalize-space(@class), " "), " {css_class} ")]'
+
+
+def _descendant_with_class(tag: str, css_class: str) -> etree.XPath:
+    """Compile _with_class(tag, css_class).
+
+    Args:
+        tag: Element name
+        css_class: One class from the element's (space-separated) class list
+
+    Returns:
+        Compiled XPath, evaluated relative to the element it is called on
+    """
+    return etree.XPath(_with_class(tag, css_class))
+
+
+# Inbox page queries, compiled once at import
+_XP_ROWS = _descendant_with_class("tr", "InboxItem_Row")
+# A row's title span, bookmark image, content div and time cell in one walk;
+# each part has its own element name, which is how the results are told apart
+_XP_ROW_PARTS = etree.XPath(
+    " | ".join(
+        (
+            _with_class("span", "InboxItem_Title"),
+            _with_class("img", "InboxItem_Bookmark"),
+            _with_class("div", "InboxItem_Content"),
+            _with_class("td", "time"),
+        )
+    )
+)
+_XP_ACTIONS = _descendant_with_class("div", "actions")
+_XP_TIME = _descendant_with_class("td", "time")
+_XP_PAGE_NUMBER = _descendant_with_class("span", "page-number")
+_XP_LJUSER = _descendant_with_class("span", "ljuser")
+_XP_PROFILE_LINK = _descendant_with_class("a", "i-ljuser-profile")
+_XP_USERHEAD = _descendant_with_class("img", "i-ljuser-userhead")
+_XP_VERIFIED = _descendant_with_class("a", "i-ljuser-badge--verified")
+_XP_BOLD = etree.XPath(".//b")
+_XP_MSGID_HREFS = etree.XPath('.//a[contains(@href, "msgid=")]/@href')
+
+
+@lru_cache(maxsize=1024)
+def _default_profile_url(username: str) -> str:
+    """Build the profile URL used when the page does not link one.
+
+    Cached, so messages from the same sender share one string.
+
+    Args:
+        username: LiveJournal username
+
+    Returns:
+        Profile URL
+    """
+    return f"https://{username}.livejournal.com/profile/"
+
+
+def _classes(element: lxml.html.HtmlElement) -> frozenset[str]:
+    """Return an element's CSS classes as a set.
+
+    Args:
+        element: HTML element
+
+    Returns:
+        Classes from its class attribute (empty if it has none)
+    """
+    return frozenset(element.get("class", "").split())
+
+
+def _first(xpath: etree.XPath, element: lxml.html.HtmlElement) -> Optional[lxml.html.HtmlElement]:
+    """Return the first match of a compiled XPath, or None.
+
+    Args:
+        xpath: Compiled XPath
+        element: Element to evaluate it on
+
+    Returns:
+        First matching element, or None if nothing matched
+    """
+    matches = xpath(element)
+    return matches[0] if matches else None
+
 
 class HTMLParser:
     """Parser for LiveJournal HTML pages (inbox)."""
 
     @staticmethod
-    def parse_inbox_page(html_string: str) -> tuple[list[InboxMessage], bool]:
+    def parse_inbox_page(html_string: Union[str, bytes]) -> tuple[list[InboxMessage], bool]:
         """Parse inbox messages from HTML page.
 
         Args:
-            html_string: HTML string from /inbox/
+            html_string: HTML page from /inbox/ (UTF-8 bytes preferred)
 
         Returns:
             Tuple of (messages, has_next_page)
 
+        Raises:
+            ParsingError: If HTML parsing fails
+        """
+        messages, current_page, total_pages = HTMLParser.parse_inbox_page_with_pagination(
+            html_string
+        )
+        return (messages, current_page < total_pages)
+
+    @staticmethod
+    def parse_inbox_page_with_pagination(
+        html_string: Union[str, bytes],
+    ) -> tuple[list[InboxMessage], int, int]:
+        """Parse inbox messages and pagination bounds from HTML page.
+
+        Bytes are decoded as UTF-8, the encoding LiveJournal serves, so
+        libxml2 does not have to detect it (and never falls back to Latin-1
+        on a page without a charset declaration).
+
+        Args:
+            html_string: HTML page from /inbox/ (UTF-8 bytes preferred)
+
+        Returns:
+            Tuple of (messages, current_page, total_pages). Pages without
+            pagination info are reported as page 1 of 1.
+
         Raises:
             ParsingError: If HTML parsing fails
         """
         logger.debug("Parsing inbox page from HTML")
 
+        # libxml2 refuses an empty document; treat it as an empty inbox page
+        if not html_string.strip():
+            logger.debug("Empty inbox page")
+            return ([], 1, 1)
+
         try:
-            soup = BeautifulSoup(html_string, "html.parser")
+            if isinstance(html_string, bytes):
+                # A parser per call: the inbox is fetched from several threads
+                parser = lxml.html.HTMLParser(encoding="utf-8")
+                doc = lxml.html.document_fromstring(html_string, parser=parser)
+            else:
+                doc = lxml.html.document_fromstring(html_string)
         except Exception as e:
             logger.error(f"Failed to parse HTML: {e}")
             raise ParsingError(f"Failed to parse HTML: {e}") from e
@@ -40,7 +175,7 @@ class HTMLParser:
         messages = []
 
         # Find all message rows
-        rows = soup.find_all("tr", class_="InboxItem_Row")
+        rows = _XP_ROWS(doc)
         logger.debug(f"Found {len(rows)} message rows")
 
         for row in rows:
@@ -54,23 +189,26 @@ class HTMLParser:
 
         # Extract pagination to determine if there's a next page
         try:
-            current_page, total_pages = HTMLParser._extract_pagination(soup)
-            has_next_page = current_page < total_pages
+            current_page, total_pages = HTMLParser._extract_pagination(doc)
             logger.debug(
-                f"Pagination: page {current_page} of {total_pages}, has_next={has_next_page}"
+                f"Pagination: page {current_page} of {total_pages}, "
+                f"has_next={current_page < total_pages}"
             )
         except ParsingError:
             # If pagination info is missing, assume single page
             logger.debug("No pagination info found, assuming single page")
-            has_next_page = False
+            current_page, total_pages = 1, 1
 
         logger.debug(f"Parsed {len(messages)} messages from inbox page")
-        return (messages, has_next_page)
+        return (messages, current_page, total_pages)
 
     @staticmethod
-    def _extract_message_from_row(row: Tag) -> Optional[InboxMessage]:
+    def _extract_message_from_row(row: lxml.html.HtmlElement) -> Optional[InboxMessage]:
         """Extract inbox message from a table row.
 
+        The row is consumed: its sender and actions elements are removed
+        while the title and body text are read.
+
         Args:
             row: HTML table row element
 
@@ -79,7 +217,7 @@ class HTMLParser:
         """
         # Extract qid from lj_qid attribute
         qid_str = row.get("lj_qid")
-        if not qid_str or not isinstance(qid_str, str):
+        if not qid_str:
             logger.warning("Message row missing lj_qid attribute")
             return None
 
@@ -92,63 +230,63 @@ class HTMLParser:
         # Extract msgid from reply link
         msgid = HTMLParser._extract_msgid(row)
 
+        # Find the row's parts in one pass; the first of each kind in document
+        # order wins
+        parts: dict[str, lxml.html.HtmlElement] = {}
+        for part in _XP_ROW_PARTS(row):
+            parts.setdefault(part.tag, part)
+
         # Extract read/unread status
-        title_span = row.find("span", class_="InboxItem_Title")
-        if not title_span:
+        title_span = parts.get("span")
+        if title_span is None:
             logger.warning(f"Message {qid} missing InboxItem_Title span")
             return None
 
-        classes = title_span.get("class")
-        is_read = "InboxItem_Read" in classes if isinstance(classes, list) else False
+        is_read = "InboxItem_Read" in _classes(title_span)
 
         # Extract bookmarked status (flag_on.gif = bookmarked, flag_off.gif = not bookmarked)
-        bookmark_img = row.find("img", class_="InboxItem_Bookmark")
-        bookmarked = False
-        if bookmark_img:
-            bookmark_src = bookmark_img.get("src", "")
-            bookmarked = "flag_on.gif" in bookmark_src if isinstance(bookmark_src, str) else False
+        bookmark_img = parts.get("img")
+        bookmarked = bookmark_img is not None and "flag_on.gif" in bookmark_img.get("src", "")
 
         # Extract title and sender from InboxItem_Title span
         # The title span contains mixed content, need to extract carefully
         title_text = ""
         sender = HTMLParser._extract_sender(title_span)
 
-        # Extract title - it's the text before "from" or the entire text if no sender
-        title_html = str(title_span)
-        # Remove the ljuser span to get just the title
-        title_soup = BeautifulSoup(title_html, "html.parser")
-        ljuser_span = title_soup.find("span", class_="ljuser")
-        if ljuser_span:
-            ljuser_span.decompose()
+        # Extract title - it's the text before "from" or the entire text if no sender.
+        # The row is discarded after extraction, so the ljuser span (already read
+        # by _extract_sender) is removed from the live tree rather than a copy;
+        # drop_tree() keeps the text that follows it
+        ljuser_span = _first(_XP_LJUSER, title_span)
+        if ljuser_span is not None:
+            ljuser_span.drop_tree()
 
         # Get text and clean it
-        title_text = title_soup.get_text().strip()
+        title_text = title_span.text_content().strip()
         # Remove "from" and everything after it (including the word "from")
-        title_text = re.sub(r"\s*from\s*$", "", title_text).strip()
+        title_text = _RE_FROM_SUFFIX.sub("", title_text).strip()
 
         if not title_text:
             title_text = "No subject"
 
         # Extract body from InboxItem_Content div
-        content_div = row.find("div", class_="InboxItem_Content")
+        content_div = parts.get("div")
         body = ""
-        if content_div:
-            # Clone the content to avoid modifying original
-            content_clone = BeautifulSoup(str(content_div), "html.parser")
-            # Remove the actions div
-            actions_div = content_clone.find("div", class_="actions")
-            if actions_div:
-                actions_div.decompose()
+        if content_div is not None:
+            # Remove the actions div (msgid was already read from it)
+            actions_div = _first(_XP_ACTIONS, content_div)
+            if actions_div is not None:
+                actions_div.drop_tree()
             # Get the HTML content
-            body = content_clone.get_text().strip()
+            body = content_div.text_content().strip()
             if not body:
                 body = "No content"
 
         # Extract timestamp from time cell
-        time_cell = row.find("td", class_="time")
+        time_cell = parts.get("td")
         timestamp_relative = ""
-        if time_cell:
-            timestamp_relative = time_cell.get_text().strip()
+        if time_cell is not None:
+            timestamp_relative = time_cell.text_content().strip()
         else:
             timestamp_relative = "Unknown"
 
@@ -161,8 +299,9 @@ class HTMLParser:
         else:
             message_type = "system_notification"
 
-        # Create InboxMessage object
-        message = InboxMessage(
+        # Create InboxMessage object; every field was built with its model type
+        # above, so pydantic's validation pass is skipped
+        message = InboxMessage.model_construct(
             qid=qid,
             msgid=msgid,
             type=message_type,
@@ -178,7 +317,7 @@ class HTMLParser:
         return message
 
     @staticmethod
-    def _extract_sender(title_span: Tag) -> Optional[InboxSender]:
+    def _extract_sender(title_span: lxml.html.HtmlElement) -> Optional[InboxSender]:
         """Extract sender information from message title span.
 
         Args:
@@ -188,47 +327,43 @@ class HTMLParser:
             InboxSender object or None if no sender (system message)
         """
         # Find ljuser span with data-ljuser attribute
-        ljuser_span = title_span.find("span", class_="ljuser")
-        if not ljuser_span:
+        ljuser_span = _first(_XP_LJUSER, title_span)
+        if ljuser_span is None:
             return None
 
         # Extract username
-        username_raw = ljuser_span.get("data-ljuser")
-        if not username_raw or not isinstance(username_raw, str):
+        username_raw: Optional[str] = ljuser_span.get("data-ljuser")
+        if not username_raw:
             return None
-        username = username_raw
+        # The same few senders appear on every page; share one string per name
+        username = sys.intern(username_raw)
 
         # Extract display name (the <b> tag content, or username if not found)
-        display_name_tag = ljuser_span.find("b")
-        display_name = display_name_tag.get_text().strip() if display_name_tag else username
+        display_name_tag = _first(_XP_BOLD, ljuser_span)
+        display_name = (
+            sys.intern(display_name_tag.text_content().strip())
+            if display_name_tag is not None
+            else username
+        )
 
         # Extract profile URL
-        profile_link = ljuser_span.find("a", class_="i-ljuser-profile")
-        if profile_link:
-            profile_url_raw = profile_link.get(
-                "href", f"https://{username}.livejournal.com/profile/"
-            )
-            profile_url = (
-                profile_url_raw
-                if isinstance(profile_url_raw, str)
-                else f"https://{username}.livejournal.com/profile/"
-            )
+        default_profile_url = _default_profile_url(username)
+        profile_link = _first(_XP_PROFILE_LINK, ljuser_span)
+        if profile_link is not None:
+            profile_url = profile_link.get("href", default_profile_url)
         else:
-            profile_url = f"https://{username}.livejournal.com/profile/"
+            profile_url = default_profile_url
 
         # Extract userpic URL (from the userhead img)
-        userpic_img = ljuser_span.find("img", class_="i-ljuser-userhead")
+        userpic_img = _first(_XP_USERHEAD, ljuser_span)
         userpic_url: Optional[str] = None
-        if userpic_img:
-            userpic_src = userpic_img.get("src")
-            if isinstance(userpic_src, str):
-                userpic_url = userpic_src
+        if userpic_img is not None:
+            userpic_url = userpic_img.get("src")
 
         # Check for verified badge
-        verified_badge = ljuser_span.find("a", class_="i-ljuser-badge--verified")
-        verified = verified_badge is not None
+        verified = _first(_XP_VERIFIED, ljuser_span) is not None
 
-        return InboxSender(
+        return InboxSender.model_construct(
             username=username,
             display_name=display_name,
             profile_url=profile_url,
@@ -237,11 +372,11 @@ class HTMLParser:
         )
 
     @staticmethod
-    def _extract_pagination(soup: BeautifulSoup) -> tuple[int, int]:
+    def _extract_pagination(doc: lxml.html.HtmlElement) -> tuple[int, int]:
         """Extract current page and total pages from HTML.
 
         Args:
-            soup: BeautifulSoup document
+            doc: Parsed HTML document
 
         Returns:
             Tuple of (current_page, total_pages)
@@ -250,14 +385,14 @@ class HTMLParser:
             ParsingError: If pagination info not found
         """
         # Find element with "Page X of Y" text
-        page_number_span = soup.find("span", class_="page-number")
-        if not page_number_span:
+        page_number_span = _first(_XP_PAGE_NUMBER, doc)
+        if page_number_span is None:
             raise ParsingError("Pagination info not found")
 
-        page_text = page_number_span.get_text().strip()
+        page_text = page_number_span.text_content().strip()
 
         # Extract page numbers using regex
-        match = re.search(r"Page\s+(\d+)\s+of\s+(\d+)", page_text)
+        match = _RE_PAGE.search(page_text)
         if not match:
             raise ParsingError(f"Could not parse pagination text: {page_text}")
 
@@ -269,7 +404,7 @@ class HTMLParser:
             raise ParsingError(f"Invalid page numbers in pagination: {page_text}") from e
 
     @staticmethod
-    def _extract_msgid(row: Tag) -> Optional[int]:
+    def _extract_msgid(row: lxml.html.HtmlElement) -> Optional[int]:
         """Extract message ID from reply link.
 
         Args:
@@ -279,22 +414,17 @@ class HTMLParser:
             Message ID or None if not found
         """
         # Find link with href containing "msgid="
-        actions_div = row.find("div", class_="actions")
-        if not actions_div:
+        actions_div = _first(_XP_ACTIONS, row)
+        if actions_div is None:
             return None
 
         # Look for reply link
-        reply_link = actions_div.find("a", href=re.compile(r"msgid="))
-        if not reply_link:
-            return None
-
-        href_raw = reply_link.get("href", "")
-        if not isinstance(href_raw, str):
+        hrefs = _XP_MSGID_HREFS(actions_div)
+        if not hrefs:
             return None
-        href = href_raw
 
         # Extract msgid parameter value
-        match = re.search(r"msgid=(\d+)", href)
+        match = _RE_MSGID.search(hrefs[0])
         if not match:
             return None
 
@@ -35,6 +35,6 @@ def extract_cdata(text: Optional[str]) -> Optional[str]:
     # lxml typically handles CDATA automatically,
     # but this is here for manual parsing if needed
     if text.startswith("<![CDATA[") and text.endswith("]]>"):
-        return text[9:-3]
+        return text.removeprefix("<![CDATA[").removesuffix("]]>")
 
     return text
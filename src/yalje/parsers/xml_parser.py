@@ -1,25 +1,41 @@
 """XML parser for LiveJournal posts and comments."""
 
-from typing import Optional
-from xml.etree import ElementTree as ET
+import sys
+from io import BytesIO
+from typing import IO, Iterator, Optional, Union
 
+from lxml import etree
+
+from yalje.core.exceptions import ParsingError
 from yalje.models.comment import Comment
-from yalje.models.post import Post
+from yalje.models.post import VALID_SECURITY_LEVELS, Post
 from yalje.models.user import User
 from yalje.utils.logging import get_logger
 
 logger = get_logger("parsers.xml")
 
+# LiveJournal's export XML never uses entities, DTDs or ID attributes, and
+# the whitespace between elements is discarded anyway; turning these off
+# skips libxml2's entity expansion and ID table and drops the blank text
+# nodes (the text of leaf elements is kept as is)
+_PARSER_OPTIONS = {
+    "resolve_entities": False,
+    "collect_ids": False,
+    "remove_blank_text": True,
+    "huge_tree": True,
+}
+_XML_PARSER = etree.XMLParser(**_PARSER_OPTIONS)
+
 
 class XMLParser:
     """Parser for LiveJournal XML responses."""
 
     @staticmethod
-    def parse_posts(xml_string: str) -> list[Post]:
+    def parse_posts(xml_string: Union[str, bytes]) -> list[Post]:
         """Parse posts from XML response.
 
         Args:
-            xml_string: XML string from export_do.bml
+            xml_string: XML document (bytes preferred) from export_do.bml
 
         Returns:
             List of Post objects
@@ -27,89 +43,136 @@ class XMLParser:
         Raises:
             ParsingError: If XML parsing fails
         """
-        from yalje.core.exceptions import ParsingError
-
         logger.debug("Parsing posts from XML")
 
+        if isinstance(xml_string, str):
+            xml_string = xml_string.encode("utf-8")
+
+        posts = list(XMLParser.iter_posts(BytesIO(xml_string)))
+
+        logger.debug(f"  → Parsed {len(posts)} posts from XML")
+        return posts
+
+    @staticmethod
+    def iter_posts(stream: IO[bytes]) -> Iterator[Post]:
+        """Incrementally parse posts from an XML byte stream.
+
+        Like iter_comments(), each <entry> is turned into a Post as soon as
+        its end tag is read and is then released, so the whole month is never
+        held as one element tree.
+
+        Args:
+            stream: Binary file-like object
+
+        Yields:
+            Post objects in document order
+
+        Raises:
+            ParsingError: If XML parsing fails
+        """
         try:
-            # Parse XML string
-            root = ET.fromstring(xml_string)
-        except ET.ParseError as e:
+            for _event, entry in etree.iterparse(
+                stream, events=("end",), tag="entry", **_PARSER_OPTIONS
+            ):
+                yield XMLParser._build_post(entry)
+
+                # Release the subtree and any preceding siblings still held by the root
+                entry.clear()
+                while entry.getprevious() is not None:
+                    del entry.getparent()[0]
+        except etree.XMLSyntaxError as e:
             logger.error(f"XML parsing failed: {e}")
             raise ParsingError(f"Failed to parse XML: {e}") from e
 
-        posts = []
+    @staticmethod
+    def _build_post(entry: etree._Element) -> Post:
+        """Build a Post from an <entry> element.
 
-        # Find all <entry> elements
-        for entry in root.findall("entry"):
-            try:
-                # Extract required fields
-                itemid = XMLParser._get_int(entry, "itemid")
-                if itemid is None:
-                    raise ParsingError("Missing required field: itemid")
-
-                eventtime = XMLParser._get_text(entry, "eventtime")
-                if eventtime is None:
-                    raise ParsingError(f"Missing required field: eventtime for itemid {itemid}")
-
-                logtime = XMLParser._get_text(entry, "logtime")
-                if logtime is None:
-                    raise ParsingError(f"Missing required field: logtime for itemid {itemid}")
-
-                event = XMLParser._get_text(entry, "event")
-                if event is None:
-                    raise ParsingError(f"Missing required field: event for itemid {itemid}")
-
-                security = XMLParser._get_text(entry, "security")
-                if security is None:
-                    raise ParsingError(f"Missing required field: security for itemid {itemid}")
-
-                # Extract optional fields
-                subject = XMLParser._get_text(entry, "subject")
-                # Convert empty string to None for subject
-                if subject == "":
-                    subject = None
-
-                allowmask = XMLParser._get_int(entry, "allowmask")
-                if allowmask is None:
-                    allowmask = 0
-
-                current_mood = XMLParser._get_text(entry, "current_mood")
-                current_music = XMLParser._get_text(entry, "current_music")
-
-                # Extract jitemid (optional field)
-                jitemid = XMLParser._get_int(entry, "jitemid")
-
-                # Create Post object
-                post = Post(
-                    itemid=itemid,
-                    jitemid=jitemid,
-                    eventtime=eventtime,
-                    logtime=logtime,
-                    subject=subject,
-                    event=event,
-                    security=security,
-                    allowmask=allowmask,
-                    current_mood=current_mood,
-                    current_music=current_music,
-                )
-                posts.append(post)
+        Args:
+            entry: <entry> element
 
-            except Exception as e:
-                if isinstance(e, ParsingError):
-                    raise
-                logger.error(f"Failed to parse entry: {e}")
-                raise ParsingError(f"Failed to parse entry: {e}") from e
+        Returns:
+            Post object
 
-        logger.debug(f"  → Parsed {len(posts)} posts from XML")
-        return posts
+        Raises:
+            ParsingError: If required data is missing or invalid
+        """
+        try:
+            # Read every field in one pass over the entry's children
+            fields = XMLParser._child_texts(entry)
+
+            # Extract required fields
+            itemid_str = fields.get("itemid")
+            if itemid_str is None:
+                raise ParsingError("Missing required field: itemid")
+            itemid = int(itemid_str)
+
+            eventtime = fields.get("eventtime")
+            if eventtime is None:
+                raise ParsingError(f"Missing required field: eventtime for itemid {itemid}")
+
+            logtime = fields.get("logtime")
+            if logtime is None:
+                raise ParsingError(f"Missing required field: logtime for itemid {itemid}")
+
+            event = fields.get("event")
+            if event is None:
+                raise ParsingError(f"Missing required field: event for itemid {itemid}")
+
+            security = fields.get("security")
+            if security is None:
+                raise ParsingError(f"Missing required field: security for itemid {itemid}")
+            # Post's own validator is skipped below, so apply its check here
+            if security not in VALID_SECURITY_LEVELS:
+                raise ParsingError(f"Invalid security level {security!r} for itemid {itemid}")
+
+            # Extract optional fields
+            subject = fields.get("subject")
+            # Convert empty string to None for subject
+            if subject == "":
+                subject = None
+
+            allowmask_str = fields.get("allowmask")
+            allowmask = int(allowmask_str) if allowmask_str is not None else 0
+
+            current_mood = fields.get("current_mood")
+            if current_mood:
+                current_mood = sys.intern(current_mood)
+            current_music = fields.get("current_music")
+
+            # Extract jitemid (optional field)
+            jitemid_str = fields.get("jitemid")
+            jitemid = int(jitemid_str) if jitemid_str is not None else None
+
+            # Create Post object. Every field already has its model type, so
+            # pydantic's validation pass is skipped. The security level and
+            # moods repeat across thousands of posts, so each distinct value
+            # is stored only once
+            return Post.model_construct(
+                itemid=itemid,
+                jitemid=jitemid,
+                eventtime=eventtime,
+                logtime=logtime,
+                subject=subject,
+                event=event,
+                security=sys.intern(security),
+                allowmask=allowmask,
+                current_mood=current_mood,
+                current_music=current_music,
+            )
+
+        except Exception as e:
+            if isinstance(e, ParsingError):
+                raise
+            logger.error(f"Failed to parse entry: {e}")
+            raise ParsingError(f"Failed to parse entry: {e}") from e
 
     @staticmethod
-    def parse_comment_metadata(xml_string: str) -> tuple[int, list[User]]:
+    def parse_comment_metadata(xml_string: Union[str, bytes]) -> tuple[int, list[User]]:
         """Parse comment metadata from XML response.
 
         Args:
-            xml_string: XML string from export_comments.bml?get=comment_meta
+            xml_string: XML document (bytes preferred) from export_comments.bml?get=comment_meta
 
         Returns:
             Tuple of (maxid, usermap)
@@ -117,16 +180,9 @@ class XMLParser:
         Raises:
             ParsingError: If XML parsing fails
         """
-        from yalje.core.exceptions import ParsingError
-
         logger.debug("Parsing comment metadata from XML")
 
-        try:
-            # Parse XML string
-            root = ET.fromstring(xml_string)
-        except ET.ParseError as e:
-            logger.error(f"XML parsing failed: {e}")
-            raise ParsingError(f"Failed to parse XML: {e}") from e
+        root = XMLParser._parse_root(xml_string)
 
         # Extract maxid (required)
         maxid_elem = root.find("maxid")
@@ -176,11 +232,11 @@ class XMLParser:
         return (maxid, usermap)
 
     @staticmethod
-    def parse_comments(xml_string: str) -> list[Comment]:
+    def parse_comments(xml_string: Union[str, bytes]) -> list[Comment]:
         """Parse comments from XML response.
 
         Args:
-            xml_string: XML string from export_comments.bml?get=comment_body
+            xml_string: XML document (bytes preferred) from export_comments.bml?get=comment_body
 
         Returns:
             List of Comment objects
@@ -188,113 +244,162 @@ class XMLParser:
         Raises:
             ParsingError: If XML parsing fails
         """
-        from yalje.core.exceptions import ParsingError
-
         logger.debug("Parsing comments from XML")
 
+        if isinstance(xml_string, str):
+            xml_string = xml_string.encode("utf-8")
+
+        comments = list(XMLParser.iter_comments(BytesIO(xml_string)))
+
+        logger.debug(f"  → Parsed {len(comments)} comments from XML")
+        return comments
+
+    @staticmethod
+    def iter_comments(stream: IO[bytes]) -> Iterator[Comment]:
+        """Incrementally parse comments from an XML byte stream.
+
+        Uses lxml's iterparse so each <comment> is turned into a Comment as soon
+        as its end tag is read, then cleared along with any already-processed
+        siblings. Memory stays proportional to one comment rather than the
+        whole batch, and callers can start consuming before the body has
+        fully arrived.
+
+        Args:
+            stream: Binary file-like object (e.g. an HTTP response's raw stream)
+
+        Yields:
+            Comment objects in document order
+
+        Raises:
+            ParsingError: If XML parsing fails
+        """
         try:
-            # Parse XML string
-            root = ET.fromstring(xml_string)
-        except ET.ParseError as e:
+            for _event, comment_elem in etree.iterparse(
+                stream, events=("end",), tag="comment", **_PARSER_OPTIONS
+            ):
+                yield XMLParser._build_comment(comment_elem)
+
+                # Release the subtree and any preceding siblings still held by the root
+                comment_elem.clear()
+                while comment_elem.getprevious() is not None:
+                    del comment_elem.getparent()[0]
+        except etree.XMLSyntaxError as e:
             logger.error(f"XML parsing failed: {e}")
             raise ParsingError(f"Failed to parse XML: {e}") from e
 
-        comments = []
+    @staticmethod
+    def _build_comment(comment_elem: etree._Element) -> Comment:
+        """Build a Comment from a <comment> element.
 
-        # Find all <comment> elements
-        for comment_elem in root.findall("comment"):
-            try:
-                # Extract required attributes
-                comment_id_str = comment_elem.get("id")
-                if comment_id_str is None:
-                    raise ParsingError("Missing required attribute: id")
-
-                jitemid_str = comment_elem.get("jitemid")
-                if jitemid_str is None:
-                    raise ParsingError("Missing required attribute: jitemid")
-
-                # Convert required attributes to int
-                comment_id = int(comment_id_str)
-                jitemid = int(jitemid_str)
-
-                # Extract optional attributes
-                posterid_str = comment_elem.get("posterid")
-                posterid = int(posterid_str) if posterid_str is not None else None
-
-                parentid_str = comment_elem.get("parentid")
-                parentid = int(parentid_str) if parentid_str is not None else None
-
-                state_str = comment_elem.get("state")
-                # Convert state "D" to "deleted", None to None
-                state = "deleted" if state_str == "D" else None
-
-                # Extract required child element: date
-                date = XMLParser._get_text(comment_elem, "date")
-                if date is None:
-                    raise ParsingError(f"Missing required field: date for comment id {comment_id}")
-
-                # Extract optional child elements
-                subject = XMLParser._get_text(comment_elem, "subject")
-                # Convert empty string to None for subject
-                if subject == "":
-                    subject = None
-
-                body = XMLParser._get_text(comment_elem, "body")
-                # Convert empty string to None for body
-                if body == "":
-                    body = None
-
-                # Create Comment object (poster_username is None, will be resolved later)
-                comment = Comment(
-                    id=comment_id,
-                    jitemid=jitemid,
-                    posterid=posterid,
-                    poster_username=None,
-                    parentid=parentid,
-                    date=date,
-                    subject=subject,
-                    body=body,
-                    state=state,
-                )
-                comments.append(comment)
+        Args:
+            comment_elem: <comment> element
 
-            except Exception as e:
-                if isinstance(e, ParsingError):
-                    raise
-                logger.error(f"Failed to parse comment element: {e}")
-                raise ParsingError(f"Failed to parse comment element: {e}") from e
+        Returns:
+            Comment object (poster_username is None, resolved later)
 
-        logger.debug(f"  → Parsed {len(comments)} comments from XML")
-        return comments
+        Raises:
+            ParsingError: If required data is missing or invalid
+        """
+        try:
+            # Extract required attributes
+            comment_id_str = comment_elem.get("id")
+            if comment_id_str is None:
+                raise ParsingError("Missing required attribute: id")
+
+            jitemid_str = comment_elem.get("jitemid")
+            if jitemid_str is None:
+                raise ParsingError("Missing required attribute: jitemid")
+
+            # Convert required attributes to int
+            comment_id = int(comment_id_str)
+            jitemid = int(jitemid_str)
+
+            # Extract optional attributes
+            posterid_str = comment_elem.get("posterid")
+            posterid = int(posterid_str) if posterid_str is not None else None
+
+            parentid_str = comment_elem.get("parentid")
+            parentid = int(parentid_str) if parentid_str is not None else None
+
+            state_str = comment_elem.get("state")
+            # Convert state "D" to "deleted", None to None
+            state = "deleted" if state_str == "D" else None
+
+            # Read the child elements in one pass
+            fields = XMLParser._child_texts(comment_elem)
+
+            # Extract required child element: date
+            date = fields.get("date")
+            if date is None:
+                raise ParsingError(f"Missing required field: date for comment id {comment_id}")
+
+            # Extract optional child elements
+            subject = fields.get("subject")
+            # Convert empty string to None for subject
+            if subject == "":
+                subject = None
+
+            body = fields.get("body")
+            # Convert empty string to None for body
+            if body == "":
+                body = None
+
+            # Create Comment object (poster_username is None, will be resolved later);
+            # fields are already typed, so validation is skipped
+            return Comment.model_construct(
+                id=comment_id,
+                jitemid=jitemid,
+                posterid=posterid,
+                poster_username=None,
+                parentid=parentid,
+                date=date,
+                subject=subject,
+                body=body,
+                state=state,
+            )
+
+        except Exception as e:
+            if isinstance(e, ParsingError):
+                raise
+            logger.error(f"Failed to parse comment element: {e}")
+            raise ParsingError(f"Failed to parse comment element: {e}") from e
 
     @staticmethod
-    def _get_text(element: ET.Element, tag: str) -> Optional[str]:
-        """Get text content from child element.
+    def _parse_root(xml_string: Union[str, bytes]) -> etree._Element:
+        """Parse an XML document and return its root element.
+
+        lxml reads bytes directly and honours the encoding in the XML
+        declaration; str input is encoded to UTF-8 first because lxml rejects
+        unicode strings that carry an encoding declaration.
 
         Args:
-            element: Parent element
-            tag: Child tag name
+            xml_string: XML document as bytes or str
 
         Returns:
-            Text content or None if not found
+            Root element
+
+        Raises:
+            ParsingError: If XML parsing fails
         """
-        child = element.find(tag)
-        if child is not None:
-            return child.text
-        return None
+        if isinstance(xml_string, str):
+            xml_string = xml_string.encode("utf-8")
+
+        try:
+            return etree.fromstring(xml_string, _XML_PARSER)
+        except etree.XMLSyntaxError as e:
+            logger.error(f"XML parsing failed: {e}")
+            raise ParsingError(f"Failed to parse XML: {e}") from e
 
     @staticmethod
-    def _get_int(element: ET.Element, tag: str) -> Optional[int]:
-        """Get integer content from child element.
+    def _child_texts(element: etree._Element) -> dict[str, Optional[str]]:
+        """Get the text of every child element in one pass.
 
         Args:
             element: Parent element
-            tag: Child tag name
 
         Returns:
-            Integer value or None if not found
+            Child tag -> text (None for an empty child). As with find(), the
+            first child with a given tag wins.
         """
-        text = XMLParser._get_text(element, tag)
-        if text is not None:
-            return int(text)
-        return None
+        # Walking backwards lets earlier children overwrite later duplicates
+        return {child.tag: child.text for child in reversed(element)}
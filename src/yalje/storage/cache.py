@@ -0,0 +1,137 @@
+"""On-disk cache of HTTP validators and parsed payloads for conditional requests."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from yalje.utils.logging import get_logger
+
+logger = get_logger("storage.cache")
+
+
+class CacheEntry:
+    """Cached validators and payload for a single request."""
+
+    def __init__(
+        self,
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Initialize cache entry.
+
+        Args:
+            data: JSON-serializable payload derived from the response
+            etag: ETag header from the response
+            last_modified: Last-Modified header from the response
+        """
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for revalidation.
+
+        Returns:
+            Dictionary of conditional request headers
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """JSON file cache keyed by account, request URL and parameters.
+
+    Only responses that carry an ETag or Last-Modified header are worth
+    storing, since without validators the server cannot answer 304.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize response cache.
+
+        Args:
+            cache_dir: Directory to store cache entries in
+        """
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def make_key(username: Optional[str], url: str, params: Any = None) -> str:
+        """Build a stable cache key for a request.
+
+        The same URL and parameters return a different journal for each
+        logged-in account, so the username is part of the key; accounts
+        sharing a cache_dir never reuse each other's entries.
+
+        Args:
+            username: Account the request is made as
+            url: Request URL
+            params: Query/form parameters or encoded body that select the resource
+
+        Returns:
+            Hex digest identifying the request
+        """
+        material = json.dumps([username, url, params], sort_keys=True)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Get the file path for a cache entry.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Path of the entry's JSON file
+        """
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Load a cache entry.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            CacheEntry or None if missing or unreadable
+        """
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                raw = json.load(f)
+            return CacheEntry(
+                data=raw["data"],
+                etag=raw.get("etag"),
+                last_modified=raw.get("last_modified"),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """Store a cache entry.
+
+        Entries without validators are not stored.
+
+        Args:
+            key: Cache key from make_key()
+            entry: Entry to store
+        """
+        if not entry.etag and not entry.last_modified:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"etag": entry.etag, "last_modified": entry.last_modified, "data": entry.data},
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, path)
@@ -1,6 +1,5 @@
 """Date utilities."""
 
-from datetime import datetime
 from typing import Iterator, Tuple
 
 
@@ -17,18 +16,21 @@ def generate_month_range(
 
     Yields:
         (year, month) tuples
+
+    Raises:
+        ValueError: If a month is outside 1-12
     """
-    current = datetime(start_year, start_month, 1)
-    end = datetime(end_year, end_month, 1)
+    if not (1 <= start_month <= 12 and 1 <= end_month <= 12):
+        raise ValueError("month must be in 1..12")
 
-    while current <= end:
-        yield (current.year, current.month)
+    # Walk a flat month index (year * 12 + zero-based month) with plain integer math
+    index = start_year * 12 + (start_month - 1)
+    end = end_year * 12 + (end_month - 1)
 
-        # Move to next month
-        if current.month == 12:
-            current = datetime(current.year + 1, 1, 1)
-        else:
-            current = datetime(current.year, current.month + 1, 1)
+    while index <= end:
+        year, month0 = divmod(index, 12)
+        yield (year, month0 + 1)
+        index += 1
 
 
 def format_month(year: int, month: int) -> str:
@@ -0,0 +1,36 @@
+"""File writing helpers."""
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any
+
+
+@contextmanager
+def atomic_write(path: Path, binary: bool = False) -> Iterator[IO[Any]]:
+    """Open a file that replaces ``path`` only once fully written.
+
+    Output goes to ``<name>.tmp`` beside the target, which is flushed to disk
+    and renamed over ``path`` when the block exits normally. If the block
+    raises, the temporary file is removed and any existing ``path`` (such as
+    an earlier complete backup) is left untouched.
+
+    Args:
+        path: Final file path (missing parent directories are created)
+        binary: Open in binary mode instead of UTF-8 text mode
+
+    Yields:
+        Stream to write to
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with open(tmp_path, "wb") if binary else open(tmp_path, "w", encoding="utf-8") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
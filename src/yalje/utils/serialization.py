@@ -0,0 +1,21 @@
+"""Serialization backends, preferring native implementations when available."""
+
+import yaml
+
+# libyaml-backed dumper/loader are several times faster than the pure-Python
+# ones; PyYAML wheels normally include them, but source builds may not
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+# orjson (optional, from the "speedups" extra) encodes JSON several times
+# faster than the stdlib encoder
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+__all__ = ["YamlDumper", "YamlLoader", "orjson", "yaml"]
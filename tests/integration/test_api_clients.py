@@ -1,15 +1,23 @@
 """Integration tests for API clients."""
 
+from io import BytesIO
 from pathlib import Path
+from typing import Optional
 from unittest.mock import MagicMock
+from urllib.parse import parse_qsl
 
 import pytest
 import requests
+import urllib3
 
+from yalje.api.comments import CommentsClient
 from yalje.api.posts import PostsClient
 from yalje.core.config import YaljeConfig
 from yalje.core.exceptions import APIError
 from yalje.core.session import HTTPSession
+from yalje.models.comment import Comment
+from yalje.models.user import User
+from yalje.storage.cache import ResponseCache
 
 
 @pytest.fixture
@@ -58,7 +66,7 @@ class TestPostsClient:
         """Test successful month download."""
         # Mock the session.post method
         mock_response = MagicMock(spec=requests.Response)
-        mock_response.text = sample_posts_xml
+        mock_response.content = sample_posts_xml.encode("utf-8")
         mock_response.status_code = 200
         mocker.patch.object(mock_session, "post", return_value=mock_response)
 
@@ -79,7 +87,7 @@ class TestPostsClient:
         assert call_args[0][0] == "https://www.livejournal.com/export_do.bml"
 
         # Check data parameters
-        data = call_args[1]["data"]
+        data = dict(parse_qsl(call_args[1]["data"]))
         assert data["what"] == "journal"
         assert data["year"] == "2023"
         assert data["month"] == "01"  # Zero-padded
@@ -96,7 +104,7 @@ class TestPostsClient:
         """Test downloading an empty month."""
         # Mock the session.post method
         mock_response = MagicMock(spec=requests.Response)
-        mock_response.text = sample_posts_empty_xml
+        mock_response.content = sample_posts_empty_xml.encode("utf-8")
         mock_response.status_code = 200
         mocker.patch.object(mock_session, "post", return_value=mock_response)
 
@@ -114,7 +122,7 @@ class TestPostsClient:
         """Test that month is zero-padded in request."""
         # Mock the session.post method
         mock_response = MagicMock(spec=requests.Response)
-        mock_response.text = sample_posts_xml
+        mock_response.content = sample_posts_xml.encode("utf-8")
         mock_response.status_code = 200
         mocker.patch.object(mock_session, "post", return_value=mock_response)
 
@@ -124,7 +132,7 @@ class TestPostsClient:
 
         # Check that month was zero-padded
         call_args = mock_session.post.call_args
-        data = call_args[1]["data"]
+        data = dict(parse_qsl(call_args[1]["data"]))
         assert data["month"] == "03"
 
     def test_download_month_api_error(
@@ -140,13 +148,95 @@ class TestPostsClient:
         with pytest.raises(APIError, match="Network error"):
             client.download_month(2023, 1)
 
+    def test_download_month_conditional_cache(
+        self, mock_config: YaljeConfig, sample_posts_xml: str, tmp_path: Path, mocker
+    ) -> None:
+        """Test that an unchanged month is served from cache on 304."""
+        config = mock_config.model_copy(update={"cache_dir": tmp_path})
+        session = HTTPSession(config)
+
+        fresh = MagicMock(spec=requests.Response)
+        fresh.content = sample_posts_xml.encode("utf-8")
+        fresh.status_code = 200
+        fresh.headers = {"ETag": '"v1"'}
+        not_modified = MagicMock(spec=requests.Response)
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        mocker.patch.object(session, "post", side_effect=[fresh, not_modified])
+
+        client = PostsClient(session, config)
+        first = client.download_month(2023, 1)
+        second = client.download_month(2023, 1)
+
+        assert second == first
+        assert session.post.call_args_list[1][1]["headers"]["If-None-Match"] == '"v1"'
+
+    def test_download_month_conditional_cache_precondition_failed(
+        self, mock_config: YaljeConfig, sample_posts_xml: str, tmp_path: Path, mocker
+    ) -> None:
+        """Test that a 412 answering If-None-Match on the POST reuses the cache."""
+        config = mock_config.model_copy(update={"cache_dir": tmp_path})
+        session = HTTPSession(config)
+
+        fresh = MagicMock(spec=requests.Response)
+        fresh.content = sample_posts_xml.encode("utf-8")
+        fresh.status_code = 200
+        fresh.headers = {"ETag": '"v1"'}
+        precondition_failed = MagicMock(spec=requests.Response)
+        precondition_failed.status_code = 412
+        precondition_failed.headers = {}
+        precondition_failed.raise_for_status.side_effect = requests.HTTPError(
+            response=precondition_failed
+        )
+        mocker.patch.object(session.session, "post", side_effect=[fresh, precondition_failed])
+
+        client = PostsClient(session, config)
+        first = client.download_month(2023, 1)
+        second = client.download_month(2023, 1)
+
+        assert second == first
+
+    def test_download_month_cache_is_per_user(
+        self,
+        mock_config: YaljeConfig,
+        sample_posts_xml: str,
+        sample_posts_empty_xml: str,
+        tmp_path: Path,
+        mocker,
+    ) -> None:
+        """Test that accounts sharing a cache_dir never reuse each other's entries."""
+        fresh = MagicMock(spec=requests.Response)
+        fresh.content = sample_posts_xml.encode("utf-8")
+        fresh.status_code = 200
+        fresh.headers = {"ETag": '"v1"'}
+        other = MagicMock(spec=requests.Response)
+        other.content = sample_posts_empty_xml.encode("utf-8")
+        other.status_code = 200
+        other.headers = {}
+
+        config_a = mock_config.model_copy(update={"cache_dir": tmp_path, "username": "alice"})
+        config_b = mock_config.model_copy(update={"cache_dir": tmp_path, "username": "bob"})
+        session_a = HTTPSession(config_a)
+        session_b = HTTPSession(config_b)
+        mocker.patch.object(session_a, "post", return_value=fresh)
+        mocker.patch.object(session_b, "post", return_value=other)
+
+        PostsClient(session_a, config_a).download_month(2023, 1)
+        posts_b = PostsClient(session_b, config_b).download_month(2023, 1)
+
+        assert posts_b == []
+        assert "If-None-Match" not in session_b.post.call_args[1]["headers"]
+        assert ResponseCache.make_key("alice", "url", "body") != ResponseCache.make_key(
+            "bob", "url", "body"
+        )
+
     def test_download_all_multiple_months(
         self, mock_session: HTTPSession, mock_config: YaljeConfig, sample_posts_xml: str, mocker
     ) -> None:
         """Test downloading multiple months."""
         # Mock the session.post method
         mock_response = MagicMock(spec=requests.Response)
-        mock_response.text = sample_posts_xml
+        mock_response.content = sample_posts_xml.encode("utf-8")
         mock_response.status_code = 200
         mocker.patch.object(mock_session, "post", return_value=mock_response)
 
@@ -160,6 +250,36 @@ class TestPostsClient:
         # Should have 12 posts (4 per month × 3 months)
         assert len(posts) == 12
 
+    def test_download_all_preserves_month_order(
+        self, mock_session: HTTPSession, mock_config: YaljeConfig, mocker
+    ) -> None:
+        """Test that concurrent month downloads are returned in chronological order."""
+        client = PostsClient(mock_session, mock_config)
+        mocker.patch.object(
+            client,
+            "download_month",
+            side_effect=lambda year, month: [f"{year}-{month:02d}"],
+        )
+
+        posts = client.download_all(2022, 11, 2023, 2)
+
+        assert posts == ["2022-11", "2022-12", "2023-01", "2023-02"]
+
+    def test_iter_all_yields_in_month_order(
+        self, mock_session: HTTPSession, mock_config: YaljeConfig, mocker
+    ) -> None:
+        """Test that iter_all streams posts month by month in order."""
+        client = PostsClient(mock_session, mock_config.model_copy(update={"concurrency": 2}))
+        mocker.patch.object(
+            client,
+            "download_month",
+            side_effect=lambda year, month: [f"{year}-{month:02d}a", f"{year}-{month:02d}b"],
+        )
+
+        posts = list(client.iter_all(2023, 1, 2023, 3))
+
+        assert posts == ["2023-01a", "2023-01b", "2023-02a", "2023-02b", "2023-03a", "2023-03b"]
+
     def test_month_range_generation(
         self, mock_session: HTTPSession, mock_config: YaljeConfig
     ) -> None:
@@ -181,3 +301,131 @@ class TestPostsClient:
         # Test full year
         months = list(client._generate_month_range(2023, 1, 2023, 12))
         assert len(months) == 12
+
+
+class TestCommentsClient:
+    """Tests for CommentsClient."""
+
+    def test_download_metadata_parses_bytes(
+        self, mock_session: HTTPSession, mock_config: YaljeConfig, fixtures_dir: Path, mocker
+    ) -> None:
+        """Test that metadata is parsed straight from the raw response bytes."""
+        mock_response = MagicMock(spec=requests.Response)
+        mock_response.content = (fixtures_dir / "sample_comment_meta.xml").read_bytes()
+        mocker.patch.object(mock_session, "get", return_value=mock_response)
+
+        client = CommentsClient(mock_session, mock_config)
+        maxid, usermap = client.download_metadata()
+
+        assert maxid == 987654
+        assert usermap[0] == User(userid=123, username="friend1")
+
+    def test_download_all_paginates_batches(
+        self, mock_session: HTTPSession, mock_config: YaljeConfig, mocker
+    ) -> None:
+        """Test that batches are requested from the highest ID seen so far."""
+        batches = {
+            0: [
+                Comment(id=3, jitemid=1, posterid=1, date="2023-01-01 00:00:00"),
+                Comment(id=2, jitemid=1, posterid=9, date="2023-01-01 00:00:00"),
+            ],
+            3: [Comment(id=5, jitemid=1, posterid=None, date="2023-01-02 00:00:00")],
+        }
+        client = CommentsClient(mock_session, mock_config)
+        mocker.patch.object(
+            client, "download_metadata", return_value=(5, [User(userid=1, username="alice")])
+        )
+        download_batch = mocker.patch.object(
+            client, "download_batch", side_effect=lambda startid: iter(batches[startid])
+        )
+
+        comments, usermap = client.download_all()
+
+        assert [call.args[0] for call in download_batch.call_args_list] == [0, 3]
+        assert [c.id for c in comments] == [3, 2, 5]
+        assert [c.poster_username for c in comments] == ["alice", "[unknown-9]", None]
+        assert len(usermap) == 1
+
+    def test_download_all_retries_batch_cut_off_mid_stream(
+        self, mock_session: HTTPSession, mock_config: YaljeConfig, fixtures_dir: Path, mocker
+    ) -> None:
+        """Test that a batch whose connection drops mid-body is re-requested whole."""
+        body = (fixtures_dir / "sample_comments.xml").read_bytes()
+
+        class DroppedStream(BytesIO):
+            """Byte stream whose connection drops once the data runs out."""
+
+            def read(self, size: Optional[int] = -1) -> bytes:
+                data = super().read(size)
+                if not data:
+                    raise urllib3.exceptions.ProtocolError("Connection broken")
+                return data
+
+        dropped = MagicMock(spec=requests.Response)
+        dropped.raw = DroppedStream(body[: body.index(b"<comment", body.index(b"</comment>"))])
+        complete = MagicMock(spec=requests.Response)
+        complete.raw = BytesIO(body)
+        mocker.patch("time.sleep")
+        get = mocker.patch.object(mock_session, "get", side_effect=[dropped, complete])
+
+        client = CommentsClient(mock_session, mock_config)
+        mocker.patch.object(client, "download_metadata", return_value=(103, []))
+        comments, _ = client.download_all()
+
+        assert [c.id for c in comments] == [100, 101, 102, 103]
+        assert [c[1]["params"]["startid"] for c in get.call_args_list] == ["0", "0"]
+
+    def test_download_all_stops_on_stuck_startid(
+        self, mock_session: HTTPSession, mock_config: YaljeConfig, mocker
+    ) -> None:
+        """Test that a batch which does not advance startid ends pagination."""
+        client = CommentsClient(mock_session, mock_config)
+        mocker.patch.object(client, "download_metadata", return_value=(10, []))
+        stuck = [Comment(id=0, jitemid=1, posterid=None, date="2023-01-01 00:00:00")]
+        download_batch = mocker.patch.object(
+            client, "download_batch", side_effect=lambda startid: iter(stuck)
+        )
+
+        comments, _ = client.download_all()
+
+        assert download_batch.call_count == 1
+        assert len(comments) == 1
+
+    def test_iter_all_yields_resolved_batches(
+        self, mock_session: HTTPSession, mock_config: YaljeConfig, mocker
+    ) -> None:
+        """Test that iter_all yields one resolved batch at a time."""
+        batches = {
+            0: [Comment(id=2, jitemid=1, posterid=1, date="2023-01-01 00:00:00")],
+            2: [Comment(id=4, jitemid=1, posterid=1, date="2023-01-02 00:00:00")],
+        }
+        client = CommentsClient(mock_session, mock_config)
+        mocker.patch.object(
+            client, "download_metadata", return_value=(4, [User(userid=1, username="alice")])
+        )
+        mocker.patch.object(
+            client, "download_batch", side_effect=lambda startid: iter(batches[startid])
+        )
+
+        usermap, batch_iter = client.iter_all()
+        results = list(batch_iter)
+
+        assert [[c.id for c in batch] for batch in results] == [[2], [4]]
+        assert all(c.poster_username == "alice" for batch in results for c in batch)
+        assert usermap == [User(userid=1, username="alice")]
+
+    def test_iter_all_returns_usermap_without_batches(
+        self, mock_session: HTTPSession, mock_config: YaljeConfig, mocker
+    ) -> None:
+        """Test that the usermap is available when there are no comment batches."""
+        client = CommentsClient(mock_session, mock_config)
+        mocker.patch.object(
+            client, "download_metadata", return_value=(0, [User(userid=1, username="alice")])
+        )
+        download_batch = mocker.patch.object(client, "download_batch")
+
+        usermap, batches = client.iter_all()
+
+        assert usermap == [User(userid=1, username="alice")]
+        assert list(batches) == []
+        download_batch.assert_not_called()
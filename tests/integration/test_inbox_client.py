@@ -69,7 +69,7 @@ class TestInboxClient:
         """Test successful inbox page download."""
         # Mock the session.get method
         mock_response = MagicMock(spec=requests.Response)
-        mock_response.text = sample_inbox_real_html
+        mock_response.content = sample_inbox_real_html.encode("utf-8")
         mock_response.status_code = 200
         mocker.patch.object(mock_session, "get", return_value=mock_response)
 
@@ -105,7 +105,7 @@ class TestInboxClient:
         """Test downloading an empty inbox page."""
         # Mock the session.get method
         mock_response = MagicMock(spec=requests.Response)
-        mock_response.text = sample_inbox_empty_html
+        mock_response.content = sample_inbox_empty_html.encode("utf-8")
         mock_response.status_code = 200
         mocker.patch.object(mock_session, "get", return_value=mock_response)
 
@@ -128,7 +128,7 @@ class TestInboxClient:
         """Test downloading page with more pages available."""
         # Mock the session.get method
         mock_response = MagicMock(spec=requests.Response)
-        mock_response.text = sample_inbox_multipage_html
+        mock_response.content = sample_inbox_multipage_html.encode("utf-8")
         mock_response.status_code = 200
         mocker.patch.object(mock_session, "get", return_value=mock_response)
 
@@ -163,7 +163,7 @@ class TestInboxClient:
         """Test downloading folder with single page."""
         # Mock the session.get method
         mock_response = MagicMock(spec=requests.Response)
-        mock_response.text = sample_inbox_real_html
+        mock_response.content = sample_inbox_real_html.encode("utf-8")
         mock_response.status_code = 200
         mocker.patch.object(mock_session, "get", return_value=mock_response)
 
@@ -192,9 +192,9 @@ class TestInboxClient:
             mock_response = MagicMock(spec=requests.Response)
             # First 4 pages return multipage HTML, last page returns single page
             if params and int(params.get("page", "1")) < 5:
-                mock_response.text = sample_inbox_multipage_html
+                mock_response.content = sample_inbox_multipage_html.encode("utf-8")
             else:
-                mock_response.text = sample_inbox_real_html
+                mock_response.content = sample_inbox_real_html.encode("utf-8")
             mock_response.status_code = 200
             return mock_response
 
@@ -220,7 +220,7 @@ class TestInboxClient:
         """Test downloading all folders (default single folder)."""
         # Mock the session.get method
         mock_response = MagicMock(spec=requests.Response)
-        mock_response.text = sample_inbox_real_html
+        mock_response.content = sample_inbox_real_html.encode("utf-8")
         mock_response.status_code = 200
         mocker.patch.object(mock_session, "get", return_value=mock_response)
 
@@ -241,7 +241,7 @@ class TestInboxClient:
         """Test downloading multiple folders."""
         # Mock the session.get method
         mock_response = MagicMock(spec=requests.Response)
-        mock_response.text = sample_inbox_real_html
+        mock_response.content = sample_inbox_real_html.encode("utf-8")
         mock_response.status_code = 200
         mocker.patch.object(mock_session, "get", return_value=mock_response)
 
@@ -265,7 +265,7 @@ class TestInboxClient:
         """Test that view parameter is correctly passed."""
         # Mock the session.get method
         mock_response = MagicMock(spec=requests.Response)
-        mock_response.text = sample_inbox_real_html
+        mock_response.content = sample_inbox_real_html.encode("utf-8")
         mock_response.status_code = 200
         mocker.patch.object(mock_session, "get", return_value=mock_response)
 
@@ -0,0 +1,64 @@
+"""Tests for the authentication flow."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from yalje.core.auth import Authenticator
+from yalje.core.config import YaljeConfig
+from yalje.core.exceptions import AuthenticationError
+from yalje.core.session import HTTPSession
+
+
+def _server_sets(cookies: dict[str, str], domain: str = "www.livejournal.com"):
+    """Build a request stub that stores cookies in the jar, as requests does."""
+
+    def request(self: HTTPSession, url: str, *args, **kwargs) -> MagicMock:
+        for name, value in cookies.items():
+            self.session.cookies.set(name, value, domain=domain)
+        return MagicMock(spec=requests.Response)
+
+    return request
+
+
+@pytest.fixture
+def authenticator() -> Authenticator:
+    """Create an authenticator."""
+    return Authenticator(YaljeConfig(username="testuser", request_delay=0.0))
+
+
+class TestAuthenticator:
+    """Tests for Authenticator.login()."""
+
+    def test_login_sets_session_cookies(self, authenticator: Authenticator, mocker) -> None:
+        """Test that cookies the server set are copied to .livejournal.com."""
+        mocker.patch.object(HTTPSession, "get", _server_sets({"luid": "abc"}))
+        mocker.patch.object(
+            HTTPSession,
+            "post",
+            _server_sets({"ljloggedin": "v2:u1", "ljmastersession": "v2:u1:s1"}),
+        )
+
+        session = authenticator.login("testuser", "secret")
+
+        assert session.get_cookie("luid") == "abc"
+        assert session.get_cookie("ljloggedin") == "v2:u1"
+        assert session.get_cookie("ljmastersession") == "v2:u1:s1"
+
+    def test_login_rejected_without_session_cookies(
+        self, authenticator: Authenticator, mocker
+    ) -> None:
+        """Test that a login response without session cookies fails."""
+        mocker.patch.object(HTTPSession, "get", _server_sets({"luid": "abc"}))
+        mocker.patch.object(HTTPSession, "post", _server_sets({}))
+
+        with pytest.raises(AuthenticationError, match="session cookies"):
+            authenticator.login("testuser", "wrong")
+
+    def test_cookie_name_in_other_value_not_matched(self, authenticator: Authenticator) -> None:
+        """Test that a cookie is matched by name, not by substring."""
+        session = HTTPSession(authenticator.config)
+        session.session.cookies.set("prefs", "luid=fake", domain="www.livejournal.com")
+
+        assert authenticator._get_cookie(session, "luid") is None
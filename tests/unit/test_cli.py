@@ -0,0 +1,40 @@
+"""Tests for CLI export helpers."""
+
+from pathlib import Path
+
+from yalje.api.comments import CommentsClient
+from yalje.cli.main import _stream_yaml_export
+from yalje.core.config import YaljeConfig
+from yalje.core.session import HTTPSession
+from yalje.exporters.yaml_exporter import YAMLExporter
+from yalje.models.export import ExportMetadata
+from yalje.models.user import User
+
+
+class TestStreamYamlExport:
+    """Tests for the streaming YAML export."""
+
+    def test_keeps_usermap_without_comments(
+        self, sample_config: YaljeConfig, tmp_path: Path, mocker
+    ) -> None:
+        """Test that the usermap is written when no comment batch arrives."""
+        client = CommentsClient(HTTPSession(sample_config), sample_config)
+        mocker.patch.object(
+            client, "download_metadata", return_value=(0, [User(userid=1, username="alice")])
+        )
+        output = tmp_path / "backup.yaml"
+        usermap: list[User] = []
+
+        _stream_yaml_export(
+            output,
+            ExportMetadata(lj_user="testuser", yalje_version="test"),
+            usermap,
+            posts=None,
+            comments_client=client,
+            download_inbox=None,
+        )
+
+        assert usermap == [User(userid=1, username="alice")]
+        export = YAMLExporter.load(output)
+        assert export.comments == []
+        assert export.usermap == [User(userid=1, username="alice")]
@@ -0,0 +1,14 @@
+"""Tests for configuration loading."""
+
+from pathlib import Path
+
+from yalje.core.config import YaljeConfig
+
+
+def test_cache_dir_expands_home(monkeypatch):
+    """Test that a ~ in YALJE_CACHE_DIR resolves to the home directory."""
+    monkeypatch.setenv("YALJE_CACHE_DIR", "~/.yalje/cache")
+
+    config = YaljeConfig(_env_file=None)
+
+    assert config.cache_dir == Path.home() / ".yalje" / "cache"
@@ -5,7 +5,9 @@ from pathlib import Path
 
 import pytest
 
+from yalje.core.exceptions import ExportError
 from yalje.exporters.json_exporter import JSONExporter
+from yalje.exporters.jsonl_exporter import JSONLExporter
 from yalje.exporters.xml_exporter import XMLExporter
 from yalje.exporters.yaml_exporter import YAMLExporter
 from yalje.models.comment import Comment
@@ -123,10 +125,101 @@ class TestYAMLExporter:
             assert len(loaded.comments) == len(sample_export.comments)
             assert len(loaded.inbox) == len(sample_export.inbox)
 
+    def test_export_matches_to_yaml(self, sample_export):
+        """Test that record-by-record output matches dumping the whole tree."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.yaml"
+
+            YAMLExporter().export(sample_export, output_path)
+
+            assert output_path.read_text(encoding="utf-8") == sample_export.to_yaml()
+
+    def test_export_stream_and_load(self, sample_export):
+        """Test streaming export loads back to the same data."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.yaml"
+            exporter = YAMLExporter()
+            metadata = sample_export.metadata.model_copy()
+
+            exporter.export_stream(
+                output_path,
+                metadata,
+                posts=iter(sample_export.posts),
+                comments=iter(sample_export.comments),
+                usermap=iter(sample_export.usermap),
+                inbox=iter([]),
+            )
+
+            loaded = exporter.load(output_path)
+            assert loaded.posts == sample_export.posts
+            assert loaded.comments == sample_export.comments
+            assert loaded.usermap == sample_export.usermap
+            assert loaded.inbox == []
+            assert loaded.metadata.post_count == len(sample_export.posts)
+            assert loaded.metadata.inbox_count == 0
+
+    def test_export_stream_failure_keeps_existing_file(self, sample_export):
+        """Test that a failed streaming export leaves the previous file intact."""
+
+        def failing_posts():
+            yield sample_export.posts[0]
+            raise RuntimeError("connection lost")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.yaml"
+            output_path.write_text("previous backup", encoding="utf-8")
+
+            with pytest.raises(ExportError, match="connection lost"):
+                YAMLExporter().export_stream(
+                    output_path,
+                    sample_export.metadata.model_copy(),
+                    posts=failing_posts(),
+                    comments=[],
+                    usermap=[],
+                    inbox=[],
+                )
+
+            assert output_path.read_text(encoding="utf-8") == "previous backup"
+            assert list(Path(tmpdir).iterdir()) == [output_path]
+
 
 class TestJSONExporter:
     """Tests for JSONExporter."""
 
+    @pytest.mark.parametrize("indent", [2, 4, None])
+    def test_export_matches_json_dump(self, sample_export, indent):
+        """Test that record-by-record output matches dumping the whole tree."""
+        import json
+
+        sample_export.update_counts()
+        expected = json.dumps(
+            sample_export.model_dump(mode="python"), indent=indent, ensure_ascii=False
+        )
+
+        assert JSONExporter().export_string(sample_export, indent=indent) == expected
+
+    def test_export_failure_keeps_existing_file(self, sample_export, mocker):
+        """Test that a failed export leaves the previous file in place."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "backups" / "test.json"
+
+            JSONExporter().export(sample_export, output_path)
+            previous = output_path.read_text(encoding="utf-8")
+
+            mocker.patch.object(JSONExporter, "_write", side_effect=RuntimeError("disk full"))
+            with pytest.raises(ExportError):
+                JSONExporter().export(sample_export, output_path)
+
+            assert output_path.read_text(encoding="utf-8") == previous
+            assert list(output_path.parent.iterdir()) == [output_path]
+
+    def test_export_without_orjson(self, sample_export, mocker):
+        """Test that the stdlib encoder fallback produces the same text."""
+        expected = JSONExporter().export_string(sample_export)
+        mocker.patch("yalje.exporters.json_exporter.orjson", None)
+
+        assert JSONExporter().export_string(sample_export) == expected
+
     def test_export_and_load(self, sample_export):
         """Test export to JSON and load back."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -154,6 +247,60 @@ class TestJSONExporter:
         assert isinstance(json_str, str)
 
 
+class TestJSONLExporter:
+    """Tests for JSONLExporter."""
+
+    def test_export_and_load(self, sample_export):
+        """Test export to JSON Lines and load back."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.jsonl"
+            JSONLExporter().export(sample_export, output_path)
+
+            loaded = JSONLExporter.load(output_path)
+            assert loaded.model_dump() == sample_export.model_dump()
+
+    def test_one_record_per_line(self, sample_export):
+        """Test that each line holds one section-tagged record."""
+        import json
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.jsonl"
+            JSONLExporter().export(sample_export, output_path)
+
+            lines = output_path.read_text(encoding="utf-8").splitlines()
+            items = [json.loads(line) for line in lines]
+            assert [item["section"] for item in items] == (
+                ["metadata"]
+                + ["usermap"] * len(sample_export.usermap)
+                + ["posts"] * len(sample_export.posts)
+                + ["comments"] * len(sample_export.comments)
+                + ["inbox"] * len(sample_export.inbox)
+            )
+            assert items[0]["record"]["lj_user"] == "testuser"
+
+    def test_export_without_orjson(self, sample_export, mocker):
+        """Test that the pydantic encoder fallback produces the same bytes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            orjson_path = Path(tmpdir) / "orjson.jsonl"
+            fallback_path = Path(tmpdir) / "fallback.jsonl"
+
+            JSONLExporter().export(sample_export, orjson_path)
+            mocker.patch("yalje.exporters.jsonl_exporter.orjson", None)
+            JSONLExporter().export(sample_export, fallback_path)
+
+            assert fallback_path.read_bytes() == orjson_path.read_bytes()
+            assert JSONLExporter.load(fallback_path).model_dump() == sample_export.model_dump()
+
+    def test_load_malformed_file(self):
+        """Test that an unreadable line raises ExportError."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "bad.jsonl"
+            input_path.write_text('{"section": "posts", "record": {}}\n', encoding="utf-8")
+
+            with pytest.raises(ExportError):
+                JSONLExporter.load(input_path)
+
+
 class TestXMLExporter:
     """Tests for XMLExporter."""
 
@@ -185,6 +332,99 @@ class TestXMLExporter:
         assert "<lj_user>testuser</lj_user>" in xml_str
         assert isinstance(xml_str, str)
 
+    def test_iter_load_yields_records(self, sample_export):
+        """Test that iter_load streams every record with its section."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.xml"
+            XMLExporter().export(sample_export, output_path)
+
+            records = list(XMLExporter.iter_load(output_path))
+
+        sections = [section for section, _record in records]
+        assert sections == ["metadata", "usermap", "usermap", "posts", "posts", "comments", "inbox"]
+        assert records[3][1] == sample_export.posts[0]
+
+    def test_load_shares_repeated_strings(self, sample_export):
+        """Test that repeated usernames load as one shared string."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.xml"
+            XMLExporter().export(sample_export, output_path)
+            loaded = XMLExporter.load(output_path)
+
+        assert loaded.comments[0].poster_username is loaded.usermap[0].username
+
+    def test_load_validation_opt_in(self, sample_export):
+        """Test that pydantic validation only runs when requested."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.xml"
+            XMLExporter().export(sample_export, output_path)
+            text = output_path.read_text(encoding="utf-8")
+            output_path.write_text(
+                text.replace("<security>public</security>", "<security>bogus</security>"),
+                encoding="utf-8",
+            )
+
+            assert XMLExporter.load(output_path).posts[0].security == "bogus"
+            with pytest.raises(ExportError, match="security"):
+                XMLExporter.load(output_path, validate=True)
+
+    def test_load_does_not_expand_entities(self, sample_export):
+        """Test that entities declared in the file are not expanded."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.xml"
+            XMLExporter().export(sample_export, output_path)
+            text = output_path.read_text(encoding="utf-8")
+            text = text.replace(
+                "<lj_export>", '<!DOCTYPE lj_export [<!ENTITY boom "expanded">]>\n<lj_export>', 1
+            )
+            text = text.replace("<subject>Test Post</subject>", "<subject>&boom;</subject>")
+            output_path.write_text(text, encoding="utf-8")
+
+            loaded = XMLExporter.load(output_path)
+
+        assert loaded.posts[0].subject is None
+        assert loaded.posts[0].event == sample_export.posts[0].event
+
+    def test_load_malformed_file(self):
+        """Test that a truncated file raises ExportError."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = Path(tmpdir) / "broken.xml"
+            input_path.write_text("<lj_export><posts><post><itemid>1</itemid>", encoding="utf-8")
+
+            with pytest.raises(ExportError):
+                XMLExporter.load(input_path)
+
+    def test_streamed_output_matches_pretty_print(self, sample_export):
+        """Test that record-by-record output is laid out like a pretty-printed tree."""
+        from lxml import etree
+
+        xml_str = XMLExporter().export_string(sample_export)
+
+        parser = etree.XMLParser(remove_blank_text=True, strip_cdata=False)
+        root = etree.fromstring(xml_str.encode("utf-8"), parser)
+        declaration, body = xml_str.split("\n", 1)
+        assert declaration == '<?xml version="1.0" encoding="UTF-8"?>'
+        assert body == etree.tostring(root, encoding="unicode", pretty_print=True)
+
+    def test_bodies_written_as_cdata(self, sample_export):
+        """Test that HTML post bodies are emitted as CDATA sections."""
+        xml_str = XMLExporter().export_string(sample_export)
+
+        assert "<event><![CDATA[<p>Test content with <b>HTML</b></p>]]></event>" in xml_str
+
+    def test_awkward_text_round_trips(self, sample_export):
+        """Test CDATA terminators survive and unrepresentable characters are dropped."""
+        sample_export.posts[0].event = "a ]]> b"
+        sample_export.posts[0].subject = "bell\x07"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.xml"
+            XMLExporter().export(sample_export, output_path)
+            loaded = XMLExporter.load(output_path)
+
+        assert loaded.posts[0].event == "a ]]> b"
+        assert loaded.posts[0].subject == "bell"
+
     def test_xml_structure(self, sample_export):
         """Test XML structure contains all expected elements."""
         exporter = XMLExporter()
@@ -254,21 +494,25 @@ class TestExporterComparison:
         with tempfile.TemporaryDirectory() as tmpdir:
             yaml_path = Path(tmpdir) / "test.yaml"
             json_path = Path(tmpdir) / "test.json"
+            jsonl_path = Path(tmpdir) / "test.jsonl"
             xml_path = Path(tmpdir) / "test.xml"
 
             # Export to all formats
             YAMLExporter().export(sample_export, yaml_path)
             JSONExporter().export(sample_export, json_path)
+            JSONLExporter().export(sample_export, jsonl_path)
             XMLExporter().export(sample_export, xml_path)
 
             # Load from all formats
             yaml_loaded = YAMLExporter.load(yaml_path)
             json_loaded = JSONExporter.load(json_path)
+            jsonl_loaded = JSONLExporter.load(jsonl_path)
             xml_loaded = XMLExporter.load(xml_path)
 
             # Verify all have same data
             assert yaml_loaded.metadata.lj_user == json_loaded.metadata.lj_user
             assert json_loaded.metadata.lj_user == xml_loaded.metadata.lj_user
+            assert jsonl_loaded.model_dump() == json_loaded.model_dump()
 
             assert len(yaml_loaded.posts) == len(json_loaded.posts)
             assert len(json_loaded.posts) == len(xml_loaded.posts)
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import lxml.html
 import pytest
 
 from yalje.core.exceptions import ParsingError
@@ -104,6 +105,16 @@ class TestHTMLParserInbox:
         # Page 2 of 5, so there should be more pages
         assert has_next_page is True
 
+    def test_parse_pagination_bounds(self, sample_inbox_multipage_html: str) -> None:
+        """Test that page bounds are reported alongside messages."""
+        messages, current_page, total_pages = HTMLParser.parse_inbox_page_with_pagination(
+            sample_inbox_multipage_html
+        )
+
+        assert len(messages) == 1
+        assert current_page == 2
+        assert total_pages == 5
+
     def test_parse_message_read_status(self, sample_inbox_real_html: str) -> None:
         """Test that read status is correctly detected."""
         messages, _ = HTMLParser.parse_inbox_page(sample_inbox_real_html)
@@ -148,11 +159,27 @@ class TestHTMLParserInbox:
         assert "Reply" not in body
         assert "Mark as Spam" not in body
 
+    def test_parse_bytes_input(self, sample_inbox_real_html: str) -> None:
+        """Test that UTF-8 bytes parse the same as the decoded page."""
+        assert HTMLParser.parse_inbox_page(
+            sample_inbox_real_html.encode("utf-8")
+        ) == HTMLParser.parse_inbox_page(sample_inbox_real_html)
+
+    def test_parse_bytes_without_charset_declaration(self, sample_inbox_real_html: str) -> None:
+        """Test that bytes are read as UTF-8 even when the page declares no charset."""
+        html = sample_inbox_real_html.replace(
+            "LiveJournal User Agreement updated", "Mise à jour — ✓"
+        )
+        assert "charset" not in html
+
+        messages, _has_next = HTMLParser.parse_inbox_page(html.encode("utf-8"))
+        assert messages[0].title == "Mise à jour — ✓"
+
     def test_parse_invalid_html(self) -> None:
         """Test parsing malformed HTML raises ParsingError."""
         invalid_html = "<html><body><div>Invalid"
 
-        # Should not raise - BeautifulSoup is tolerant
+        # Should not raise - libxml2's HTML parser is tolerant
         messages, has_next = HTMLParser.parse_inbox_page(invalid_html)
         # But should return empty list
         assert len(messages) == 0
@@ -163,45 +190,37 @@ class TestHTMLParserPagination:
 
     def test_extract_pagination_single_page(self) -> None:
         """Test extracting pagination for single page."""
-        from bs4 import BeautifulSoup
-
         html = '<span class="page-number">Page 1 of 1</span>'
-        soup = BeautifulSoup(html, "html.parser")
+        doc = lxml.html.document_fromstring(html)
 
-        current, total = HTMLParser._extract_pagination(soup)
+        current, total = HTMLParser._extract_pagination(doc)
         assert current == 1
         assert total == 1
 
     def test_extract_pagination_multipage(self) -> None:
         """Test extracting pagination for multiple pages."""
-        from bs4 import BeautifulSoup
-
         html = '<span class="page-number">Page 3 of 10</span>'
-        soup = BeautifulSoup(html, "html.parser")
+        doc = lxml.html.document_fromstring(html)
 
-        current, total = HTMLParser._extract_pagination(soup)
+        current, total = HTMLParser._extract_pagination(doc)
         assert current == 3
         assert total == 10
 
     def test_extract_pagination_missing(self) -> None:
         """Test extracting pagination when element is missing."""
-        from bs4 import BeautifulSoup
-
         html = "<div>No pagination here</div>"
-        soup = BeautifulSoup(html, "html.parser")
+        doc = lxml.html.document_fromstring(html)
 
         with pytest.raises(ParsingError, match="Pagination info not found"):
-            HTMLParser._extract_pagination(soup)
+            HTMLParser._extract_pagination(doc)
 
     def test_extract_pagination_invalid_format(self) -> None:
         """Test extracting pagination with invalid format."""
-        from bs4 import BeautifulSoup
-
         html = '<span class="page-number">Invalid pagination text</span>'
-        soup = BeautifulSoup(html, "html.parser")
+        doc = lxml.html.document_fromstring(html)
 
         with pytest.raises(ParsingError, match="Could not parse pagination"):
-            HTMLParser._extract_pagination(soup)
+            HTMLParser._extract_pagination(doc)
 
 
 class TestHTMLParserMessageExtraction:
@@ -209,8 +228,6 @@ class TestHTMLParserMessageExtraction:
 
     def test_extract_msgid_present(self) -> None:
         """Test extracting msgid when present."""
-        from bs4 import BeautifulSoup
-
         html = """
         <tr class="InboxItem_Row">
             <td>
@@ -220,27 +237,21 @@ class TestHTMLParserMessageExtraction:
             </td>
         </tr>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        row = soup.find("tr")
+        row = lxml.html.document_fromstring(html).find(".//tr")
 
         msgid = HTMLParser._extract_msgid(row)
         assert msgid == 12345
 
     def test_extract_msgid_missing_actions(self) -> None:
         """Test extracting msgid when actions div is missing."""
-        from bs4 import BeautifulSoup
-
         html = '<tr class="InboxItem_Row"><td>No actions</td></tr>'
-        soup = BeautifulSoup(html, "html.parser")
-        row = soup.find("tr")
+        row = lxml.html.document_fromstring(html).find(".//tr")
 
         msgid = HTMLParser._extract_msgid(row)
         assert msgid is None
 
     def test_extract_msgid_missing_reply_link(self) -> None:
         """Test extracting msgid when reply link is missing."""
-        from bs4 import BeautifulSoup
-
         html = """
         <tr class="InboxItem_Row">
             <td>
@@ -250,8 +261,7 @@ class TestHTMLParserMessageExtraction:
             </td>
         </tr>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        row = soup.find("tr")
+        row = lxml.html.document_fromstring(html).find(".//tr")
 
         msgid = HTMLParser._extract_msgid(row)
         assert msgid is None
@@ -262,8 +272,6 @@ class TestHTMLParserSenderExtraction:
 
     def test_extract_sender_with_verified_badge(self) -> None:
         """Test extracting sender with verified badge."""
-        from bs4 import BeautifulSoup
-
         html = """
         <span class="InboxItem_Title">
             Test message from
@@ -276,8 +284,7 @@ class TestHTMLParserSenderExtraction:
             </span>
         </span>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        title_span = soup.find("span", class_="InboxItem_Title")
+        title_span = lxml.html.document_fromstring(html).find_class("InboxItem_Title")[0]
 
         sender = HTMLParser._extract_sender(title_span)
         assert sender is not None
@@ -289,8 +296,6 @@ class TestHTMLParserSenderExtraction:
 
     def test_extract_sender_without_verified_badge(self) -> None:
         """Test extracting sender without verified badge."""
-        from bs4 import BeautifulSoup
-
         html = """
         <span class="InboxItem_Title">
             <span class="ljuser" data-ljuser="normaluser">
@@ -298,8 +303,7 @@ class TestHTMLParserSenderExtraction:
             </span>
         </span>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        title_span = soup.find("span", class_="InboxItem_Title")
+        title_span = lxml.html.document_fromstring(html).find_class("InboxItem_Title")[0]
 
         sender = HTMLParser._extract_sender(title_span)
         assert sender is not None
@@ -308,19 +312,14 @@ class TestHTMLParserSenderExtraction:
 
     def test_extract_sender_missing_ljuser(self) -> None:
         """Test extracting sender when ljuser span is missing (system message)."""
-        from bs4 import BeautifulSoup
-
         html = '<span class="InboxItem_Title">System notification</span>'
-        soup = BeautifulSoup(html, "html.parser")
-        title_span = soup.find("span", class_="InboxItem_Title")
+        title_span = lxml.html.document_fromstring(html).find_class("InboxItem_Title")[0]
 
         sender = HTMLParser._extract_sender(title_span)
         assert sender is None
 
     def test_extract_sender_missing_username(self) -> None:
         """Test extracting sender when username attribute is missing."""
-        from bs4 import BeautifulSoup
-
         html = """
         <span class="InboxItem_Title">
             <span class="ljuser">
@@ -328,8 +327,7 @@ class TestHTMLParserSenderExtraction:
             </span>
         </span>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        title_span = soup.find("span", class_="InboxItem_Title")
+        title_span = lxml.html.document_fromstring(html).find_class("InboxItem_Title")[0]
 
         sender = HTMLParser._extract_sender(title_span)
         assert sender is None
@@ -1,7 +1,10 @@
 """Tests for data models."""
 
+import pytest
+from pydantic import ValidationError
+
 from yalje.models.export import LJExport
-from yalje.models.post import Post
+from yalje.models.post import VALID_SECURITY_LEVELS, Post
 
 
 def test_post_jitemid_optional():
@@ -30,6 +33,16 @@ def test_post_jitemid_optional():
     assert post2.jitemid is None
 
 
+def test_post_security_levels():
+    """Test that only known security levels are accepted."""
+    for level in VALID_SECURITY_LEVELS:
+        post = Post(itemid=1, eventtime="", logtime="", event="", security=level)
+        assert post.security == level
+
+    with pytest.raises(ValidationError, match="security must be one of"):
+        Post(itemid=1, eventtime="", logtime="", event="", security="secret")
+
+
 def test_export_serialization(sample_export):
     """Test export can be serialized to YAML and back."""
     # Serialize to YAML
@@ -40,3 +53,18 @@ def test_export_serialization(sample_export):
     # Deserialize from YAML
     loaded = LJExport.from_yaml(yaml_str)
     assert loaded.metadata.lj_user == "testuser"
+
+
+def test_export_file_round_trip(sample_export, tmp_path):
+    """Test that to_file writes the same YAML as to_yaml and loads back."""
+    path = tmp_path / "export.yaml"
+
+    sample_export.to_file(str(path))
+
+    assert path.read_text(encoding="utf-8") == sample_export.to_yaml()
+    assert LJExport.from_file(str(path)) == sample_export
+
+
+def test_fast_dump_matches_model_dump(sample_export):
+    """Test that the serialization dict is identical to pydantic's."""
+    assert sample_export._fast_dump() == sample_export.model_dump(mode="python")
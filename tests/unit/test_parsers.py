@@ -1,5 +1,6 @@
 """Tests for XML and HTML parsers."""
 
+from io import BytesIO
 from pathlib import Path
 
 import pytest
@@ -147,6 +148,48 @@ class TestXMLParserPosts:
         # Multiple paragraphs in post 3
         assert "<p>Multiple paragraphs!</p>" in posts[2].event
 
+    def test_parse_bytes_input(self, sample_posts_xml: str) -> None:
+        """Test that raw response bytes parse the same as decoded text."""
+        posts = XMLParser.parse_posts(sample_posts_xml.encode("utf-8"))
+
+        assert [p.itemid for p in posts] == [
+            p.itemid for p in XMLParser.parse_posts(sample_posts_xml)
+        ]
+
+    def test_repeated_values_shared(self, sample_posts_xml: str) -> None:
+        """Test that security levels parsed from separate documents share one string."""
+        first = XMLParser.parse_posts(sample_posts_xml)
+        second = XMLParser.parse_posts(sample_posts_xml)
+
+        assert first[0].security is second[0].security
+
+    def test_entities_not_expanded(self) -> None:
+        """Test that entities declared in the document are not expanded."""
+        xml = """<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE livejournal [<!ENTITY boom "expanded">]>
+<livejournal>
+  <entry>
+    <itemid>1</itemid>
+    <eventtime>2023-01-15 14:30:00</eventtime>
+    <logtime>2023-01-15 14:30:00</logtime>
+    <subject>&boom;</subject>
+    <event>Body</event>
+    <security>public</security>
+  </entry>
+</livejournal>"""
+        posts = XMLParser.parse_posts(xml)
+
+        assert posts[0].subject is None
+        assert posts[0].event == "Body"
+
+    def test_iter_posts_from_stream(self, sample_posts_xml: str) -> None:
+        """Test that posts can be parsed incrementally from a byte stream."""
+        stream = BytesIO(sample_posts_xml.encode("utf-8"))
+
+        streamed = list(XMLParser.iter_posts(stream))
+
+        assert streamed == XMLParser.parse_posts(sample_posts_xml)
+
     def test_invalid_xml(self) -> None:
         """Test parsing malformed XML raises ParsingError."""
         invalid_xml = "<livejournal><entry>Invalid</livejournal>"
@@ -186,6 +229,22 @@ class TestXMLParserPosts:
         with pytest.raises(ParsingError, match="Missing required field: security"):
             XMLParser.parse_posts(xml_without_security)
 
+    def test_invalid_security_level(self) -> None:
+        """Test parsing entry with an unknown security level raises ParsingError."""
+        xml_bad_security = """<?xml version="1.0"?>
+<livejournal>
+  <entry>
+    <itemid>12345</itemid>
+    <eventtime>2023-01-15 14:30:00</eventtime>
+    <logtime>2023-01-15 14:30:00</logtime>
+    <event><![CDATA[Content]]></event>
+    <security>secret</security>
+  </entry>
+</livejournal>
+"""
+        with pytest.raises(ParsingError, match="Invalid security level 'secret'"):
+            XMLParser.parse_posts(xml_bad_security)
+
     def test_optional_fields_default_values(self) -> None:
         """Test that optional fields have correct default values."""
         xml_minimal = """<?xml version="1.0"?>
@@ -423,3 +482,13 @@ class TestXMLParserComments:
         # Verify HTML content is preserved from CDATA
         assert "<b>comment</b>" in comments[0].body
         assert "<p>" in comments[0].body
+
+    def test_iter_comments_from_stream(self, sample_comments_xml: str) -> None:
+        """Test that comments can be parsed incrementally from a byte stream."""
+        stream = BytesIO(sample_comments_xml.encode("utf-8"))
+
+        streamed = list(XMLParser.iter_comments(stream))
+
+        assert [c.id for c in streamed] == [
+            c.id for c in XMLParser.parse_comments(sample_comments_xml)
+        ]
@@ -0,0 +1,100 @@
+"""Tests for profile page parser."""
+
+import pytest
+
+from yalje.api.profile import ProfileParser
+from yalje.core.exceptions import ParsingError
+
+PROFILE_HTML = """
+<html><head>
+<script>Site.remote = {"username":"testuser","number_of_posts":"358"};</script>
+</head><body>
+<div class="b-profile-stat-item b-profile-stat-entrycount">
+  <div class="b-profile-stat-value">357</div>
+</div>
+<dl><dt>Journal created:</dt>
+<dd>on  5 January 2011&nbsp;(#33401138)</dd>
+<dt>Last updated:</dt>
+<dd><span class="tooltip" title='18 hours ago'>11 November 2025</span></dd></dl>
+</body></html>
+"""
+
+
+class TestProfileParser:
+    """Tests for ProfileParser.parse_profile_data()."""
+
+    def test_parse_profile(self) -> None:
+        """Test extracting post count and date range."""
+        profile = ProfileParser.parse_profile_data(PROFILE_HTML)
+
+        assert profile.post_count == 358
+        assert (profile.created_year, profile.created_month) == (2011, 1)
+        assert (profile.updated_year, profile.updated_month) == (2025, 11)
+
+    def test_site_remote_with_nested_braces(self) -> None:
+        """Test that Site.remote JSON containing '};' in a string still parses."""
+        html = PROFILE_HTML.replace(
+            '{"username":"testuser",', '{"motd":"a};b","nested":{"x":1},"username":"testuser",'
+        )
+
+        profile = ProfileParser.parse_profile_data(html)
+
+        assert profile.post_count == 358
+
+    def test_creation_date_anchored_to_label(self) -> None:
+        """Test that an earlier 'on <day> <month> <year>' is not mistaken for creation."""
+        html = PROFILE_HTML.replace("<body>", "<body><p>Posted on 3 March 2020</p>")
+
+        profile = ProfileParser.parse_profile_data(html)
+
+        assert (profile.created_year, profile.created_month) == (2011, 1)
+
+    def test_creation_date_with_markup_around_tokens(self) -> None:
+        """Test the label-anchored scan when tags touch the day and year."""
+        html = PROFILE_HTML.replace(
+            "<dd>on  5 January 2011&nbsp;(#33401138)</dd>", "<dd>5 February 2012</dd>"
+        )
+
+        profile = ProfileParser.parse_profile_data(html)
+
+        assert (profile.created_year, profile.created_month) == (2012, 2)
+
+    def test_post_count_html_fallback(self) -> None:
+        """Test falling back to the statistics block without Site.remote."""
+        html = PROFILE_HTML.replace("Site.remote", "Site.other")
+
+        profile = ProfileParser.parse_profile_data(html)
+
+        assert profile.post_count == 357
+
+    def test_russian_month_names(self) -> None:
+        """Test multi-language month lookup."""
+        html = PROFILE_HTML.replace("January", "января").replace("November", "ноября")
+
+        profile = ProfileParser.parse_profile_data(html)
+
+        assert profile.created_month == 1
+        assert profile.updated_month == 11
+
+    def test_missing_update_date_defaults_to_now(self) -> None:
+        """Test that a missing update date falls back to the current date."""
+        from datetime import datetime
+
+        html = PROFILE_HTML.replace('class="tooltip"', 'class="other"')
+
+        profile = ProfileParser.parse_profile_data(html)
+
+        now = datetime.now()
+        assert (profile.updated_year, profile.updated_month) == (now.year, now.month)
+
+    def test_missing_post_count(self) -> None:
+        """Test that a page without any post count raises ParsingError."""
+        with pytest.raises(ParsingError, match="post count"):
+            ProfileParser.parse_profile_data("<html><body>on 5 January 2011</body></html>")
+
+    def test_missing_creation_date(self) -> None:
+        """Test that a page without a creation date raises ParsingError."""
+        html = '<script>Site.remote = {"number_of_posts":"1"};</script>'
+
+        with pytest.raises(ParsingError, match="creation date"):
+            ProfileParser.parse_profile_data(html)
@@ -0,0 +1,167 @@
+"""Tests for HTTP session retry behaviour."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from yalje.core.config import YaljeConfig
+from yalje.core.exceptions import APIError, TransientAPIError
+from yalje.core.session import CONCURRENT_SECTIONS, HTTPSession, _parse_retry_after
+
+
+def _response(status_code: int, headers: dict | None = None) -> MagicMock:
+    """Build a mock response whose raise_for_status matches its status."""
+    response = MagicMock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = b""
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+@pytest.fixture
+def session(mocker) -> HTTPSession:
+    """Create an HTTP session that never actually sleeps."""
+    mocker.patch("time.sleep")
+    return HTTPSession(YaljeConfig(username="testuser", request_delay=0.0))
+
+
+class TestHTTPSessionRetry:
+    """Tests for transient-failure retries."""
+
+    def test_retries_server_error(self, session: HTTPSession, mocker) -> None:
+        """Test that a 503 is retried and the later success returned."""
+        ok = _response(200)
+        get = mocker.patch.object(
+            session.session, "get", side_effect=[_response(503, {"Retry-After": "0"}), ok]
+        )
+
+        assert session.get("https://www.livejournal.com/") is ok
+        assert get.call_count == 2
+
+    def test_retries_connection_error(self, session: HTTPSession, mocker) -> None:
+        """Test that connection errors are retried until attempts run out."""
+        post = mocker.patch.object(
+            session.session, "post", side_effect=requests.ConnectionError("reset")
+        )
+
+        with pytest.raises(TransientAPIError):
+            session.post("https://www.livejournal.com/export_do.bml", data="x")
+        assert post.call_count == 3
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            requests.exceptions.ChunkedEncodingError("IncompleteRead"),
+            requests.exceptions.ContentDecodingError("truncated gzip"),
+        ],
+    )
+    def test_retries_truncated_response(
+        self, session: HTTPSession, error: requests.RequestException, mocker
+    ) -> None:
+        """Test that a response cut off mid-body is retried like a dropped connection."""
+        ok = _response(200)
+        post = mocker.patch.object(session.session, "post", side_effect=[error, ok])
+
+        assert session.post("https://www.livejournal.com/export_do.bml", data="x") is ok
+        assert post.call_count == 2
+
+    def test_client_error_not_retried(self, session: HTTPSession, mocker) -> None:
+        """Test that a 404 fails immediately."""
+        get = mocker.patch.object(session.session, "get", return_value=_response(404))
+
+        with pytest.raises(APIError) as exc_info:
+            session.get("https://www.livejournal.com/missing")
+        assert not isinstance(exc_info.value, TransientAPIError)
+        assert get.call_count == 1
+
+
+class TestHTTPSessionConditional:
+    """Tests for conditional POST requests."""
+
+    def test_precondition_failed_returned_for_if_none_match(
+        self, session: HTTPSession, mocker
+    ) -> None:
+        """Test that a 412 answering If-None-Match is returned, not raised."""
+        precondition_failed = _response(412)
+        mocker.patch.object(session.session, "post", return_value=precondition_failed)
+
+        response = session.post(
+            "https://www.livejournal.com/export_do.bml",
+            data="x",
+            headers={"If-None-Match": '"v1"'},
+        )
+        assert response is precondition_failed
+
+    def test_precondition_failed_raised_without_validators(
+        self, session: HTTPSession, mocker
+    ) -> None:
+        """Test that a 412 on an unconditional POST is still an error."""
+        mocker.patch.object(session.session, "post", return_value=_response(412))
+
+        with pytest.raises(APIError):
+            session.post("https://www.livejournal.com/export_do.bml", data="x")
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_seconds(self) -> None:
+        """Test delta-seconds form."""
+        assert _parse_retry_after("7") == 7.0
+
+    def test_http_date_in_past(self) -> None:
+        """Test HTTP-date form clamps past dates to zero."""
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_invalid(self) -> None:
+        """Test missing or garbage values."""
+        assert _parse_retry_after(None) is None
+        assert _parse_retry_after("soon") is None
+
+
+class TestHTTPSessionPool:
+    """Tests for connection pool configuration."""
+
+    def test_pool_sized_to_concurrency(self) -> None:
+        """Test that the mounted adapter pool matches the configured concurrency."""
+        session = HTTPSession(YaljeConfig(username="testuser", concurrency=12))
+
+        adapter = session.session.get_adapter("https://www.livejournal.com/")
+        assert adapter._pool_maxsize == 12 * CONCURRENT_SECTIONS
+        assert adapter.max_retries.total == 0
+        assert session.session.headers["Connection"] == "keep-alive"
+
+
+class TestHTTPSessionRateLimit:
+    """Tests for request spacing."""
+
+    def test_spaces_requests_by_delay(self, mocker) -> None:
+        """Test that only the remaining part of request_delay is slept."""
+        sleep = mocker.patch("time.sleep")
+        mocker.patch("time.monotonic", side_effect=[100.0, 100.25, 105.0])
+        session = HTTPSession(YaljeConfig(username="testuser", request_delay=1.0))
+
+        session._rate_limit()
+        session._rate_limit()
+        session._rate_limit()
+
+        sleep.assert_called_once_with(pytest.approx(0.75))
+
+
+class TestHTTPSessionRetryConfig:
+    """Tests for config-driven retry limits."""
+
+    def test_retry_attempts_from_config(self, mocker) -> None:
+        """Test that retry_attempts bounds the number of tries."""
+        mocker.patch("time.sleep")
+        session = HTTPSession(YaljeConfig(username="testuser", request_delay=0.0, retry_attempts=5))
+        get = mocker.patch.object(session.session, "get", side_effect=requests.Timeout("slow"))
+
+        with pytest.raises(TransientAPIError):
+            session.get("https://www.livejournal.com/")
+        assert get.call_count == 5